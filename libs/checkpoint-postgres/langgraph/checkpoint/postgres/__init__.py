@@ -12,11 +12,13 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     get_checkpoint_id,
     get_serializable_checkpoint_metadata,
 )
 from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.delta import DeltaEncoder
 from psycopg import Capabilities, Connection, Cursor, Pipeline
 from psycopg.rows import DictRow, dict_row
 from psycopg.types.json import Jsonb
@@ -39,6 +41,8 @@ class PostgresSaver(BasePostgresSaver):
         conn: _internal.Conn,
         pipe: Pipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        max_delta_chain: int = 0,
     ) -> None:
         super().__init__(serde=serde)
         if isinstance(conn, ConnectionPool) and pipe is not None:
@@ -50,17 +54,22 @@ class PostgresSaver(BasePostgresSaver):
         self.pipe = pipe
         self.lock = threading.Lock()
         self.supports_pipeline = Capabilities().has_pipeline()
+        if max_delta_chain > 0:
+            self.delta = DeltaEncoder(self.serde, max_chain=max_delta_chain)
 
     @classmethod
     @contextmanager
     def from_conn_string(
-        cls, conn_string: str, *, pipeline: bool = False
+        cls, conn_string: str, *, pipeline: bool = False, max_delta_chain: int = 0
     ) -> Iterator[PostgresSaver]:
         """Create a new PostgresSaver instance from a connection string.
 
         Args:
             conn_string: The Postgres connection info string.
             pipeline: whether to use Pipeline
+            max_delta_chain: Store list channel values that only grew since their
+                previous version as the appended items, with a full copy at least
+                every `max_delta_chain` versions. Defaults to 0 (always full copies).
 
         Returns:
             PostgresSaver: A new PostgresSaver instance.
@@ -70,9 +79,9 @@ class PostgresSaver(BasePostgresSaver):
         ) as conn:
             if pipeline:
                 with conn.pipeline() as pipe:
-                    yield cls(conn, pipe)
+                    yield cls(conn, pipe, max_delta_chain=max_delta_chain)
             else:
-                yield cls(conn)
+                yield cls(conn, max_delta_chain=max_delta_chain)
 
     def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
@@ -176,9 +185,43 @@ class PostgresSaver(BasePostgresSaver):
                             value["checkpoint"],
                             value["channel_values"],
                         )
+            self._fetch_delta_bases(cur, values)
             for value in values:
                 yield self._load_checkpoint_tuple(value)
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        Only the metadata columns and the checkpoint timestamp are read; channel
+        blobs and pending writes are never loaded. Checkpoints are ordered by
+        checkpoint ID in descending order, so the `config` of the last item can be
+        passed as `before` to fetch the next page.
+
+        Args:
+            config: The config to use for listing the checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: The maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of checkpoint metadata tuples.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._cursor() as cur:
+            cur.execute(query, args)
+            for value in cur.fetchall():
+                yield self._load_metadata_tuple(value)
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -248,6 +291,7 @@ class PostgresSaver(BasePostgresSaver):
                         value["channel_values"],
                     )
 
+            self._fetch_delta_bases(cur, [value])
             return self._load_checkpoint_tuple(value)
 
     def put(
@@ -329,6 +373,8 @@ class PostgresSaver(BasePostgresSaver):
                     Jsonb(get_serializable_checkpoint_metadata(config, metadata)),
                 ),
             )
+        if self.delta is not None:
+            self.delta.commit(thread_id, checkpoint_ns)
         return next_config
 
     def put_writes(
@@ -387,6 +433,19 @@ class PostgresSaver(BasePostgresSaver):
                 "DELETE FROM checkpoint_writes WHERE thread_id = %s",
                 (str(thread_id),),
             )
+        if self.delta is not None:
+            self.delta.forget(str(thread_id))
+
+    def _fetch_delta_bases(
+        self, cur: Cursor[DictRow], values: Sequence[DictRow]
+    ) -> None:
+        """Fetch the blobs that the delta channel values of the given rows are
+        built upon."""
+        keys = self._delta_base_keys(values)
+        if not keys[0]:
+            return
+        cur.execute(self.SELECT_DELTA_BASES_SQL, keys)
+        self._attach_delta_bases(values, cur.fetchall())
 
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
@@ -452,7 +511,9 @@ class PostgresSaver(BasePostgresSaver):
                 **value["checkpoint"],
                 "channel_values": {
                     **(value["checkpoint"].get("channel_values") or {}),
-                    **self._load_blobs(value["channel_values"]),
+                    **self._load_blobs(
+                        value["channel_values"], value.get("delta_bases")
+                    ),
                 },
             },
             value["metadata"],
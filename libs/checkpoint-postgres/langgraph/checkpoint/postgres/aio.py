@@ -12,11 +12,13 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     get_checkpoint_id,
     get_serializable_checkpoint_metadata,
 )
 from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.delta import DeltaEncoder
 from psycopg import AsyncConnection, AsyncCursor, AsyncPipeline, Capabilities
 from psycopg.rows import DictRow, dict_row
 from psycopg.types.json import Jsonb
@@ -39,6 +41,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
         conn: _ainternal.Conn,
         pipe: AsyncPipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        max_delta_chain: int = 0,
     ) -> None:
         super().__init__(serde=serde)
         if isinstance(conn, AsyncConnectionPool) and pipe is not None:
@@ -51,6 +55,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.supports_pipeline = Capabilities().has_pipeline()
+        if max_delta_chain > 0:
+            self.delta = DeltaEncoder(self.serde, max_chain=max_delta_chain)
 
     @classmethod
     @asynccontextmanager
@@ -60,12 +66,16 @@ class AsyncPostgresSaver(BasePostgresSaver):
         *,
         pipeline: bool = False,
         serde: SerializerProtocol | None = None,
+        max_delta_chain: int = 0,
     ) -> AsyncIterator[AsyncPostgresSaver]:
         """Create a new AsyncPostgresSaver instance from a connection string.
 
         Args:
             conn_string: The Postgres connection info string.
             pipeline: whether to use AsyncPipeline
+            max_delta_chain: Store list channel values that only grew since their
+                previous version as the appended items, with a full copy at least
+                every `max_delta_chain` versions. Defaults to 0 (always full copies).
 
         Returns:
             AsyncPostgresSaver: A new AsyncPostgresSaver instance.
@@ -75,9 +85,14 @@ class AsyncPostgresSaver(BasePostgresSaver):
         ) as conn:
             if pipeline:
                 async with conn.pipeline() as pipe:
-                    yield cls(conn=conn, pipe=pipe, serde=serde)
+                    yield cls(
+                        conn=conn,
+                        pipe=pipe,
+                        serde=serde,
+                        max_delta_chain=max_delta_chain,
+                    )
             else:
-                yield cls(conn=conn, serde=serde)
+                yield cls(conn=conn, serde=serde, max_delta_chain=max_delta_chain)
 
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
@@ -165,9 +180,43 @@ class AsyncPostgresSaver(BasePostgresSaver):
                             value["checkpoint"],
                             value["channel_values"],
                         )
+            await self._fetch_delta_bases(cur, values)
             for value in values:
                 yield await self._load_checkpoint_tuple(value)
 
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database asynchronously.
+
+        Only the metadata columns and the checkpoint timestamp are read; channel
+        blobs and pending writes are never loaded. Checkpoints are ordered by
+        checkpoint ID in descending order, so the `config` of the last item can be
+        passed as `before` to fetch the next page.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._cursor() as cur:
+            await cur.execute(query, args, binary=True)
+            for value in await cur.fetchall():
+                yield self._load_metadata_tuple(value)
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -217,6 +266,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
                         value["channel_values"],
                     )
 
+            await self._fetch_delta_bases(cur, [value])
             return await self._load_checkpoint_tuple(value)
 
     async def aput(
@@ -289,6 +339,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
                     Jsonb(get_serializable_checkpoint_metadata(config, metadata)),
                 ),
             )
+        if self.delta is not None:
+            self.delta.commit(thread_id, checkpoint_ns)
         return next_config
 
     async def aput_writes(
@@ -346,6 +398,19 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 "DELETE FROM checkpoint_writes WHERE thread_id = %s",
                 (str(thread_id),),
             )
+        if self.delta is not None:
+            self.delta.forget(str(thread_id))
+
+    async def _fetch_delta_bases(
+        self, cur: AsyncCursor[DictRow], values: Sequence[DictRow]
+    ) -> None:
+        """Fetch the blobs that the delta channel values of the given rows are
+        built upon."""
+        keys = self._delta_base_keys(values)
+        if not keys[0]:
+            return
+        await cur.execute(self.SELECT_DELTA_BASES_SQL, keys, binary=True)
+        self._attach_delta_bases(values, await cur.fetchall())
 
     @asynccontextmanager
     async def _cursor(
@@ -413,7 +478,9 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 **value["checkpoint"],
                 "channel_values": {
                     **(value["checkpoint"].get("channel_values") or {}),
-                    **self._load_blobs(value["channel_values"]),
+                    **self._load_blobs(
+                        value["channel_values"], value.get("delta_bases")
+                    ),
                 },
             },
             value["metadata"],
@@ -475,6 +542,47 @@ class AsyncPostgresSaver(BasePostgresSaver):
             except StopAsyncIteration:
                 break
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of matching checkpoint metadata tuples.
+        """
+        try:
+            # check if we are in the main thread, only bg threads can block
+            # we don't check in other methods to avoid the overhead
+            if asyncio.get_running_loop() is self.loop:
+                raise asyncio.InvalidStateError(
+                    "Synchronous calls to AsyncPostgresSaver are only allowed from a "
+                    "different thread. From the main thread, use the async interface. "
+                    "For example, use `checkpointer.alist_metadata(...)` or `await "
+                    "graph.ainvoke(...)`."
+                )
+        except RuntimeError:
+            pass
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    anext(aiter_),  # type: ignore[arg-type]  # noqa: F821
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -11,8 +11,16 @@ from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
+    CheckpointMetadataTuple,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.serde.delta import (
+    DeltaEncoder,
+    is_delta,
+    join_delta,
+    loads_delta,
+)
+from langgraph.checkpoint.serde.lazy import loads_typed_lazy
 from langgraph.checkpoint.serde.types import TASKS
 from psycopg.types.json import Jsonb
 
@@ -111,6 +119,16 @@ select
     ) as pending_writes
 from checkpoints """
 
+SELECT_METADATA_SQL = """
+select
+    thread_id,
+    checkpoint_ns,
+    checkpoint_id,
+    parent_checkpoint_id,
+    metadata,
+    checkpoint ->> 'ts' as ts
+from checkpoints """
+
 SELECT_PENDING_SENDS_SQL = f"""
 select
     checkpoint_id,
@@ -122,6 +140,14 @@ where thread_id = %s
 group by checkpoint_id
 """
 
+SELECT_DELTA_BASES_SQL = """
+select thread_id, checkpoint_ns, channel, version, type, blob
+from checkpoint_blobs
+where (thread_id, checkpoint_ns, channel, version) in (
+    select * from unnest(%s::text[], %s::text[], %s::text[], %s::text[])
+)
+"""
+
 UPSERT_CHECKPOINT_BLOBS_SQL = """
     INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
     VALUES (%s, %s, %s, %s, %s, %s)
@@ -155,7 +181,9 @@ INSERT_CHECKPOINT_WRITES_SQL = """
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     SELECT_PENDING_SENDS_SQL = SELECT_PENDING_SENDS_SQL
+    SELECT_DELTA_BASES_SQL = SELECT_DELTA_BASES_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
@@ -163,6 +191,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
 
     supports_pipeline: bool
+    delta: DeltaEncoder | None = None
 
     def _migrate_pending_sends(
         self,
@@ -184,16 +213,58 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             else self.get_next_version(None, None)
         )
 
+    def _delta_base_keys(
+        self, values: Sequence[dict[str, Any]]
+    ) -> tuple[list[str], list[str], list[str], list[str]]:
+        """Return the (thread_id, checkpoint_ns, channel, version) columns of the
+        blobs that the delta blobs of the given rows are built upon."""
+        keys: tuple[list[str], list[str], list[str], list[str]] = ([], [], [], [])
+        for value in values:
+            for k, t, v in value["channel_values"] or ():
+                if not is_delta(type_ := t.decode()):
+                    continue
+                for version in loads_delta(self.serde, (type_, v))[0]:
+                    keys[0].append(value["thread_id"])
+                    keys[1].append(value["checkpoint_ns"])
+                    keys[2].append(k.decode())
+                    keys[3].append(version)
+        return keys
+
+    def _attach_delta_bases(
+        self, values: Sequence[dict[str, Any]], rows: Sequence[dict[str, Any]]
+    ) -> None:
+        """Attach the blobs selected with `SELECT_DELTA_BASES_SQL` to the checkpoint
+        rows they belong to, for `_load_blobs` to rebuild delta channel values."""
+        bases: dict[tuple[str, str], dict[str, dict[str, tuple[str, bytes]]]] = {}
+        for row in rows:
+            bases.setdefault((row["thread_id"], row["checkpoint_ns"]), {}).setdefault(
+                row["channel"], {}
+            )[row["version"]] = (row["type"], row["blob"] or b"")
+        for value in values:
+            value["delta_bases"] = bases.get(
+                (value["thread_id"], value["checkpoint_ns"])
+            )
+
     def _load_blobs(
-        self, blob_values: list[tuple[bytes, bytes, bytes]]
+        self,
+        blob_values: list[tuple[bytes, bytes, bytes]],
+        delta_bases: dict[str, dict[str, tuple[str, bytes]]] | None = None,
     ) -> dict[str, Any]:
         if not blob_values:
             return {}
-        return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
-            for k, t, v in blob_values
-            if t.decode() != "empty"
-        }
+        values: dict[str, Any] = {}
+        for k, t, v in blob_values:
+            channel, type_ = k.decode(), t.decode()
+            if type_ == "empty":
+                continue
+            if is_delta(type_):
+                chain, items = loads_delta(self.serde, (type_, v))
+                values[channel] = join_delta(
+                    self.serde, chain, items, (delta_bases or {}).get(channel, {})
+                )
+            else:
+                values[channel] = loads_typed_lazy(self.serde, (type_, v))
+        return values
 
     def _dump_blobs(
         self,
@@ -205,21 +276,52 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         if not versions:
             return []
 
+        if self.delta is not None:
+            typed = self.delta.dumps_typed(
+                thread_id,
+                checkpoint_ns,
+                values,
+                {k: str(v) for k, v in versions.items()},
+            )
+        else:
+            typed = {
+                k: self.serde.dumps_typed(v) for k, v in values.items() if k in versions
+            }
         return [
             (
                 thread_id,
                 checkpoint_ns,
                 k,
                 cast(str, ver),
-                *(
-                    self.serde.dumps_typed(values[k])
-                    if k in values
-                    else ("empty", None)
-                ),
+                *(typed[k] if k in typed else ("empty", None)),
             )
             for k, ver in versions.items()
         ]
 
+    def _load_metadata_tuple(self, value: dict[str, Any]) -> CheckpointMetadataTuple:
+        return CheckpointMetadataTuple(
+            {
+                "configurable": {
+                    "thread_id": value["thread_id"],
+                    "checkpoint_ns": value["checkpoint_ns"],
+                    "checkpoint_id": value["checkpoint_id"],
+                }
+            },
+            value["metadata"],
+            (
+                {
+                    "configurable": {
+                        "thread_id": value["thread_id"],
+                        "checkpoint_ns": value["checkpoint_ns"],
+                        "checkpoint_id": value["parent_checkpoint_id"],
+                    }
+                }
+                if value["parent_checkpoint_id"]
+                else None
+            ),
+            value["ts"],
+        )
+
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> list[tuple[str, str, Any]]:
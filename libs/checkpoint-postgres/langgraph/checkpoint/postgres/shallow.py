@@ -11,6 +11,7 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     get_serializable_checkpoint_metadata,
 )
@@ -112,6 +113,19 @@ select
     ) as pending_sends
 from checkpoints """
 
+# the shallow table has no checkpoint ID column, so expose one for search_where
+SELECT_METADATA_SQL = """
+select * from (
+    select
+        thread_id,
+        checkpoint_ns,
+        checkpoint ->> 'id' as checkpoint_id,
+        null::text as parent_checkpoint_id,
+        metadata,
+        checkpoint ->> 'ts' as ts
+    from checkpoints
+) as checkpoints """
+
 UPSERT_CHECKPOINT_BLOBS_SQL = """
     INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, type, blob)
     VALUES (%s, %s, %s, %s, %s)
@@ -175,6 +189,7 @@ class ShallowPostgresSaver(BasePostgresSaver):
     """
 
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
@@ -300,6 +315,29 @@ class ShallowPostgresSaver(BasePostgresSaver):
                     pending_writes=self._load_writes(value["pending_writes"]),
                 )
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        Only the metadata and the checkpoint timestamp are read; channel blobs and
+        pending writes are never loaded. For ShallowPostgresSaver, this method returns
+        a list with ONLY the most recent checkpoint of each thread.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._cursor() as cur:
+            cur.execute(query, args)
+            for value in cur.fetchall():
+                yield self._load_metadata_tuple(value)
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -533,6 +571,7 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
     """
 
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
@@ -666,6 +705,29 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
                     ),
                 )
 
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database asynchronously.
+
+        Only the metadata and the checkpoint timestamp are read; channel blobs and
+        pending writes are never loaded. For ShallowPostgresSaver, this method returns
+        a list with ONLY the most recent checkpoint of each thread.
+        """
+        where, args = self._search_where(config, filter, before)
+        query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._cursor() as cur:
+            await cur.execute(query, args, binary=True)
+            for value in await cur.fetchall():
+                yield self._load_metadata_tuple(value)
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -887,6 +949,29 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
             except StopAsyncIteration:
                 break
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        For AsyncShallowPostgresSaver, this method returns a list with ONLY the most
+        recent checkpoint of each thread.
+        """
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    anext(aiter_),  # type: ignore[arg-type]  # noqa: F821
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import functools
 import json
 import logging
+import re
 import threading
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, Sequence
@@ -36,6 +38,12 @@ from langgraph.store.base import (
     get_text_at_path,
     tokenize_path,
 )
+from langgraph.store.base.embed import (
+    _get_index_id,
+    _get_indexed_texts,
+    _hash_text,
+    _reindex_batches,
+)
 from psycopg import Capabilities, Connection, Cursor, Pipeline
 from psycopg.rows import DictRow, dict_row
 from psycopg.types.json import Jsonb
@@ -141,6 +149,14 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS store_vectors_embedding_idx ON store_vec
             ),
         },
     ),
+    Migration(
+        """
+-- Hash of the embedded text and of the embedding model, to skip unchanged fields
+-- when reindexing
+ALTER TABLE store_vectors
+ADD COLUMN IF NOT EXISTS text_hash bytea;
+""",
+    ),
 ]
 
 
@@ -183,6 +199,15 @@ class ANNIndexConfig(TypedDict, total=False):
     - 'vector': Regular vectors (default)
     - 'halfvec': Half-precision vectors for reduced memory usage
     """
+    iterative_scan: Literal["off", "strict_order", "relaxed_order"]
+    """Iterative scan mode of the index, which requires pgvector 0.8.0 or later.
+
+    Without iterative scans, searches with a selective namespace or filter can return
+    fewer results than their limit, as the index returns a fixed number of vectors
+    that are filtered afterwards. Iterative scans keep scanning the index until
+    enough vectors pass the filters. 'ivfflat' indexes only support 'relaxed_order'.
+    The setting is applied to the connections of the store when searching.
+    """
 
 
 class HNSWConfig(ANNIndexConfig, total=False):
@@ -214,6 +239,15 @@ class IVFFlatConfig(ANNIndexConfig, total=False):
     """
 
 
+class TextSearchConfig(TypedDict, total=False):
+    """Configuration of the full-text search fused with vector search in PostgresStore."""
+
+    language: str
+    """Postgres text search configuration used to parse the text. Defaults to 'english'."""
+    weight: float
+    """Weight of the full-text ranks relative to the vector ranks. Defaults to 1.0."""
+
+
 class PostgresIndexConfig(IndexConfig, total=False):
     """Configuration for vector embeddings in PostgreSQL store with pgvector-specific options.
 
@@ -228,6 +262,23 @@ class PostgresIndexConfig(IndexConfig, total=False):
     - 'inner_product': Dot product
     - 'cosine': Cosine similarity
     """
+    exact_search_threshold: int
+    """Maximum number of items matching the namespace and filter of a search for which
+    distances are computed exactly, without the ANN index. Defaults to 1000.
+
+    Exact search returns all the results of selective searches, such as searches of
+    the memories of one user, where the ANN index could return too few of them once
+    filtered. Set to 0 to always use the ANN index.
+    """
+    text_search: bool | TextSearchConfig
+    """Whether searches by query also match the text of the items with Postgres
+    full-text search.
+
+    The items ranked by vector distance and by full-text rank are then fused with
+    reciprocal rank fusion, and their `score` is the fused score. The full-text search
+    covers all the string values of the items, and uses a GIN index created by
+    `setup()`.
+    """
 
 
 class BasePostgresStore(Generic[C]):
@@ -236,6 +287,157 @@ class BasePostgresStore(Generic[C]):
     conn: C
     _deserializer: Callable[[bytes | orjson.Fragment], dict[str, Any]] | None
     index_config: PostgresIndexConfig | None
+    ttl_config: TTLConfig | None
+
+    def _get_sweep_ttl_query(self, batch_size: int | None) -> tuple[str, int]:
+        """Build the query deleting a batch of expired items, oldest first.
+
+        Returns the query and the maximum number of items it deletes. The items are
+        selected through the partial index on expires_at, and items locked by other
+        transactions are left to the next batch.
+        """
+        batch_size = (
+            batch_size or (self.ttl_config or {}).get("sweep_batch_size") or 1000
+        )
+        query = """
+            DELETE FROM store
+            WHERE (prefix, key) IN (
+                SELECT prefix, key FROM store
+                WHERE expires_at IS NOT NULL AND expires_at < NOW()
+                ORDER BY expires_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+        """
+        return query, batch_size
+
+    def _get_reindex_read_query(
+        self, items: Sequence[Item]
+    ) -> tuple[str, tuple[list[str], list[str]]]:
+        """Query the current values of the items, and the text hashes of their
+        vectors, for reindexing."""
+        query = """
+            SELECT s.prefix, s.key, s.value, v.field_name, v.text_hash
+            FROM store s
+            LEFT JOIN store_vectors v ON v.prefix = s.prefix AND v.key = s.key
+            WHERE (s.prefix, s.key) IN (SELECT * FROM unnest(%s::text[], %s::text[]))
+        """
+        params = (
+            [_namespace_to_text(item.namespace) for item in items],
+            [item.key for item in items],
+        )
+        return query, params
+
+    def _get_reindex_texts(
+        self, rows: Iterable[Row], index_id: str, force: bool = False
+    ) -> tuple[
+        list[tuple[str, str, str, str, bytes | None]], list[tuple[str, str, str]]
+    ]:
+        """Compare the texts of the items read to the hashes of their vectors.
+
+        Returns the (prefix, key, field, text, stored hash) of the fields to embed
+        again, and the (prefix, key, field) of the vectors of the fields that are no
+        longer indexed.
+        """
+        assert self.index_config is not None
+        values: dict[tuple[str, str], Any] = {}
+        hashes: dict[tuple[str, str], dict[str, bytes | None]] = defaultdict(dict)
+        for row in rows:
+            prefix, key = row["prefix"], row["key"]
+            values[(prefix, key)] = row["value"]
+            if row["field_name"] is not None:
+                hashes[(prefix, key)][row["field_name"]] = row["text_hash"]
+        to_embed: list[tuple[str, str, str, str, bytes | None]] = []
+        stale: list[tuple[str, str, str]] = []
+        for (ns, key), value in values.items():
+            if not isinstance(value, dict):
+                value = (self._deserializer or _json_loads)(value)
+            stored = hashes.get((ns, key), {})
+            texts = dict(
+                _get_indexed_texts(value, self.index_config["__tokenized_fields"])
+            )
+            stale.extend((ns, key, path) for path in stored if path not in texts)
+            for path, text in texts.items():
+                text_hash = stored.get(path)
+                if (
+                    force
+                    or text_hash is None
+                    or bytes(text_hash) != _hash_text(index_id, text)
+                ):
+                    to_embed.append((ns, key, path, text, text_hash))
+        return to_embed, stale
+
+    def _get_reindex_queries(
+        self,
+        to_embed: Sequence[tuple[str, str, str, str, bytes | None]],
+        vectors: dict[str, list[float]],
+        stale: Sequence[tuple[str, str, str]],
+        index_id: str,
+    ) -> list[tuple[str, Sequence]]:
+        """Queries storing the vectors of the fields embedded again, and deleting the
+        vectors of the fields that are no longer indexed.
+
+        A vector is only stored if the hash stored for its field did not change since
+        it was read, so that vectors put in the meantime are not overwritten, and only
+        if the item was not deleted.
+        """
+        queries: list[tuple[str, Sequence]] = []
+        if stale:
+            query = """
+                DELETE FROM store_vectors
+                WHERE (prefix, key, field_name) IN (
+                    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[])
+                )
+            """
+            queries.append(
+                (
+                    query,
+                    (
+                        [ns for ns, _, _ in stale],
+                        [k for _, k, _ in stale],
+                        [pathname for _, _, pathname in stale],
+                    ),
+                )
+            )
+        if to_embed:
+            vector_type = (
+                cast(dict, self.index_config)
+                .get("ann_index_config", {})
+                .get("vector_type", "vector")
+            )
+            query = f"""
+                INSERT INTO store_vectors (prefix, key, field_name, embedding, text_hash, created_at, updated_at)
+                SELECT t.prefix, t.key, t.field_name, t.embedding::{vector_type},
+                    t.text_hash, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::bytea[], %s::bytea[])
+                    AS t(prefix, key, field_name, embedding, text_hash, stored_hash)
+                JOIN store s ON s.prefix = t.prefix AND s.key = t.key
+                LEFT JOIN store_vectors v
+                    ON v.prefix = t.prefix AND v.key = t.key AND v.field_name = t.field_name
+                WHERE v.text_hash IS NOT DISTINCT FROM t.stored_hash
+                FOR KEY SHARE OF s
+                ON CONFLICT (prefix, key, field_name) DO UPDATE
+                SET embedding = EXCLUDED.embedding,
+                    text_hash = EXCLUDED.text_hash,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+            txt_params = [
+                (ns, k, pathname, text) for ns, k, pathname, text, _ in to_embed
+            ]
+            queries.append(
+                (
+                    query,
+                    (
+                        *_get_vector_params(
+                            txt_params,
+                            [vectors[text] for *_, text in txt_params],
+                            index_id,
+                        ),
+                        [text_hash for *_, text_hash in to_embed],
+                    ),
+                )
+            )
+        return queries
 
     def _get_batch_GET_ops_queries(
         self,
@@ -314,44 +516,33 @@ class BasePostgresStore(Generic[C]):
         queries: list[tuple[str, Sequence]] = []
 
         if deletes:
-            namespace_groups: dict[tuple[str, ...], list[str]] = defaultdict(list)
-            for op in deletes:
-                namespace_groups[op.namespace].append(op.key)
-            for namespace, keys in namespace_groups.items():
-                placeholders = ",".join(["%s"] * len(keys))
-                query = (
-                    f"DELETE FROM store WHERE prefix = %s AND key IN ({placeholders})"
+            query = """
+                DELETE FROM store
+                WHERE (prefix, key) IN (
+                    SELECT * FROM unnest(%s::text[], %s::text[])
                 )
-                params = (_namespace_to_text(namespace), *keys)
-                queries.append((query, params))
+            """
+            params = (
+                [_namespace_to_text(op.namespace) for op in deletes],
+                [op.key for op in deletes],
+            )
+            queries.append((query, params))
         embedding_request: tuple[str, Sequence[tuple[str, str, str, str]]] | None = None
         if inserts:
-            values = []
-            insertion_params = []
-            vector_values = []
+            # Rows are sent as one array parameter per column, so the query text
+            # does not grow with the number of rows
+            prefixes: list[str] = []
+            keys: list[str] = []
+            values: list[Jsonb] = []
+            ttls: list[float | None] = []
             embedding_request_params = []
-            # Handle TTL expiration
 
             # First handle main store insertions
             for op in inserts:
-                if op.ttl is not None:
-                    expires_at_str = f"NOW() + INTERVAL '{op.ttl * 60} seconds'"
-                    ttl_minutes = op.ttl
-                else:
-                    expires_at_str = "NULL"
-                    ttl_minutes = None
-
-                values.append(
-                    f"(%s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, {expires_at_str}, %s)"
-                )
-                insertion_params.extend(
-                    [
-                        _namespace_to_text(op.namespace),
-                        op.key,
-                        Jsonb(cast(dict, op.value)),
-                        ttl_minutes,
-                    ]
-                )
+                prefixes.append(_namespace_to_text(op.namespace))
+                keys.append(op.key)
+                values.append(Jsonb(cast(dict, op.value)))
+                ttls.append(float(op.ttl) if op.ttl is not None else None)
 
             # Then handle embeddings if configured
             if self.index_config:
@@ -371,30 +562,37 @@ class BasePostgresStore(Generic[C]):
                         texts = get_text_at_path(value, tokenized_path)
                         for i, text in enumerate(texts):
                             pathname = f"{path}.{i}" if len(texts) > 1 else path
-                            vector_values.append(
-                                "(%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
-                            )
                             embedding_request_params.append((ns, k, pathname, text))
 
-            values_str = ",".join(values)
-            query = f"""
+            query = """
                 INSERT INTO store (prefix, key, value, created_at, updated_at, expires_at, ttl_minutes)
-                VALUES {values_str}
+                SELECT t.prefix, t.key, t.value, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP,
+                    NOW() + t.ttl_minutes * INTERVAL '1 minute', t.ttl_minutes
+                FROM unnest(%s::text[], %s::text[], %s::jsonb[], %s::float8[])
+                    AS t(prefix, key, value, ttl_minutes)
                 ON CONFLICT (prefix, key) DO UPDATE
                 SET value = EXCLUDED.value,
                     updated_at = CURRENT_TIMESTAMP,
                     expires_at = EXCLUDED.expires_at,
                     ttl_minutes = EXCLUDED.ttl_minutes
             """
-            queries.append((query, insertion_params))
+            queries.append((query, (prefixes, keys, values, ttls)))
 
-            if vector_values:
-                values_str = ",".join(vector_values)
+            if embedding_request_params:
+                vector_type = (
+                    cast(dict, self.index_config)
+                    .get("ann_index_config", {})
+                    .get("vector_type", "vector")
+                )
                 query = f"""
-                    INSERT INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
-                    VALUES {values_str}
+                    INSERT INTO store_vectors (prefix, key, field_name, embedding, text_hash, created_at, updated_at)
+                    SELECT t.prefix, t.key, t.field_name, t.embedding::{vector_type},
+                        t.text_hash, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                    FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::bytea[])
+                        AS t(prefix, key, field_name, embedding, text_hash)
                     ON CONFLICT (prefix, key, field_name) DO UPDATE
                     SET embedding = EXCLUDED.embedding,
+                        text_hash = EXCLUDED.text_hash,
                         updated_at = CURRENT_TIMESTAMP
                 """
                 embedding_request = (query, embedding_request_params)
@@ -430,8 +628,11 @@ class BasePostgresStore(Generic[C]):
                             filter_clauses.append(condition)
                             filter_params.extend(params_)
                     else:
-                        filter_clauses.append("value->%s = %s::jsonb")
-                        filter_params.extend([key, orjson.dumps(value).decode("utf-8")])
+                        field, params_ = self._get_filter_field(key, "->")
+                        filter_clauses.append(f"{field} = %s::jsonb")
+                        filter_params.extend(
+                            [*params_, orjson.dumps(value).decode("utf-8")]
+                        )
 
             ns_condition = "TRUE"
             ns_param: Sequence[str] | None = None
@@ -449,75 +650,26 @@ class BasePostgresStore(Generic[C]):
                 # We'll embed the text later, so record the request.
                 embedding_requests.append((idx, op.query))
 
-                score_operator, post_operator = get_distance_operator(self)
-                post_operator = post_operator.replace("scored", "uniq")
-                vector_type = self.index_config.get("ann_index_config", {}).get(
-                    "vector_type", "vector"
-                )
-
-                # For hamming bit vectors, or “regular” vectors
-                if (
-                    vector_type == "bit"
-                    and cast(dict, self.index_config).get("distance_type") == "hamming"
-                ):
-                    score_operator = score_operator % (
-                        "%s",
-                        cast(dict, self.index_config)["dims"],
+                search_results_sql, search_results_params = (
+                    self._get_vector_search_query(
+                        op, ns_condition, [*ns_param, *filter_params], extra_filters
                     )
-                else:
-                    score_operator = score_operator % ("%s", vector_type)
-
-                vectors_per_doc_estimate = cast(dict, self.index_config)[
-                    "__estimated_num_vectors"
-                ]
-                expanded_limit = (op.limit * vectors_per_doc_estimate * 2) + 1
-
-                # “sub_scored” does the main vector search
-                # Then we do DISTINCT ON to drop duplicates if your store can have them
-                # Finally we limit & offset
-                vector_search_cte = f"""
-                        SELECT store.prefix, store.key, store.value, store.created_at, store.updated_at,
-                            {score_operator} AS neg_score
-                        FROM store
-                        JOIN store_vectors sv ON store.prefix = sv.prefix AND store.key = sv.key
-                        WHERE {ns_condition} {extra_filters}
-                        ORDER BY {score_operator} ASC
-                        LIMIT %s
-                    """
-
-                search_results_sql = f"""
-                        WITH scored AS (
-                            {vector_search_cte}
-                        )
-                        SELECT uniq.prefix, uniq.key, uniq.value, uniq.created_at, uniq.updated_at,
-                            {post_operator} AS score
-                        FROM (
-                            SELECT DISTINCT ON (scored.prefix, scored.key)
-                                scored.prefix, scored.key, scored.value, scored.created_at, scored.updated_at, scored.neg_score
-                            FROM scored
-                            ORDER BY scored.prefix, scored.key, scored.neg_score ASC
-                        ) uniq
-                        ORDER BY score DESC
-                        LIMIT %s
-                        OFFSET %s
-                    """
-
-                search_results_params = [
-                    PLACEHOLDER,
-                    *ns_param,
-                    *filter_params,
-                    PLACEHOLDER,
-                    expanded_limit,
-                    op.limit,
-                    op.offset,
-                ]
+                )
 
             else:
+                after_condition = ""
+                after_params: list[str] = []
+                order_by = "store.updated_at DESC"
+                if op.after is not None:
+                    # keyset pagination, in (prefix, key) order
+                    after_condition = " AND (store.prefix, store.key) > (%s, %s)"
+                    after_params = [_namespace_to_text(op.after[0]), op.after[1]]
+                    order_by = "store.prefix, store.key"
                 base_query = f"""
                         SELECT store.prefix, store.key, store.value, store.created_at, store.updated_at, NULL AS score
                         FROM store
-                        WHERE {ns_condition} {extra_filters}
-                        ORDER BY store.updated_at DESC
+                        WHERE {ns_condition} {extra_filters}{after_condition}
+                        ORDER BY {order_by}
                         LIMIT %s
                         OFFSET %s
                     """
@@ -525,6 +677,7 @@ class BasePostgresStore(Generic[C]):
                 search_results_params = [
                     *ns_param,
                     *filter_params,
+                    *after_params,
                     op.limit,
                     op.offset,
                 ]
@@ -554,6 +707,178 @@ class BasePostgresStore(Generic[C]):
 
         return queries, embedding_requests
 
+    def _get_vector_search_query(
+        self,
+        op: SearchOp,
+        condition: str,
+        condition_params: list[Any],
+        extra_filters: str,
+    ) -> tuple[str, list[Any]]:
+        """Build the SQL of a search by query, with the query vector as PLACEHOLDER.
+
+        When the namespace and filter of the search match at most
+        `exact_search_threshold` items, the distances to their vectors are computed
+        exactly. Otherwise, the vectors are searched with the ANN index, filtering the
+        store rows they belong to. With `text_search`, the items ranked by vector
+        distance are fused with the items ranked by full-text search.
+        """
+        config = cast(PostgresIndexConfig, self.index_config)
+        score_operator, post_operator = get_distance_operator(self)
+        vector_type = config.get("ann_index_config", {}).get("vector_type", "vector")
+
+        # For hamming bit vectors, or “regular” vectors
+        if (
+            vector_type == "bit"
+            and cast(dict, config).get("distance_type") == "hamming"
+        ):
+            score_operator = score_operator % ("%s", cast(dict, config)["dims"])
+        else:
+            score_operator = score_operator % ("%s", vector_type)
+
+        vectors_per_doc_estimate = cast(dict, config)["__estimated_num_vectors"]
+        expanded_limit = ((op.limit + op.offset) * vectors_per_doc_estimate * 2) + 1
+        threshold = config.get("exact_search_threshold", 1000)
+        exact = bool(threshold and (op.namespace_prefix or op.filter))
+
+        # “ann” does the main vector search
+        ann_gate = ""
+        ann_gate_params: list[Any] = []
+        if exact:
+            ann_gate = "(SELECT count(*) FROM candidates) > %s AND "
+            ann_gate_params = [threshold]
+        ann_sql = f"""
+                SELECT store.prefix, store.key, store.value, store.created_at, store.updated_at,
+                    {score_operator} AS neg_score
+                FROM store
+                JOIN store_vectors sv ON store.prefix = sv.prefix AND store.key = sv.key
+                WHERE {ann_gate}{condition} {extra_filters}
+                ORDER BY {score_operator} ASC
+                LIMIT %s
+            """
+        ann_params = [
+            PLACEHOLDER,
+            *ann_gate_params,
+            *condition_params,
+            PLACEHOLDER,
+            expanded_limit,
+        ]
+
+        if exact:
+            # Only one of "exact" and "ann" runs, depending on the number of
+            # candidates. OFFSET 0 keeps the ANN index from ordering "exact".
+            scored_sql = f"""
+                candidates AS MATERIALIZED (
+                    SELECT store.prefix, store.key, store.value, store.created_at, store.updated_at
+                    FROM store
+                    WHERE {condition} {extra_filters}
+                    LIMIT %s
+                ),
+                scored AS (
+                    (
+                        SELECT exact.* FROM (
+                            SELECT c.prefix, c.key, c.value, c.created_at, c.updated_at,
+                                {score_operator} AS neg_score
+                            FROM candidates c
+                            JOIN store_vectors sv ON c.prefix = sv.prefix AND c.key = sv.key
+                            WHERE (SELECT count(*) FROM candidates) <= %s
+                            OFFSET 0
+                        ) exact
+                        ORDER BY exact.neg_score ASC
+                        LIMIT %s
+                    )
+                    UNION ALL
+                    ({ann_sql})
+                )
+            """
+            scored_params = [
+                *condition_params,
+                threshold + 1,
+                PLACEHOLDER,
+                threshold,
+                expanded_limit,
+                *ann_params,
+            ]
+        else:
+            scored_sql = f"""
+                scored AS (
+                    {ann_sql}
+                )
+            """
+            scored_params = ann_params
+
+        # DISTINCT ON drops the other vectors of the items
+        uniq_sql = """
+                SELECT DISTINCT ON (scored.prefix, scored.key)
+                    scored.prefix, scored.key, scored.value, scored.created_at, scored.updated_at, scored.neg_score
+                FROM scored
+                ORDER BY scored.prefix, scored.key, scored.neg_score ASC
+            """
+        if not (text_search := _get_text_search_config(config)):
+            post_operator = post_operator.replace("scored", "uniq")
+            sql = f"""
+                WITH {scored_sql}
+                SELECT uniq.prefix, uniq.key, uniq.value, uniq.created_at, uniq.updated_at,
+                    {post_operator} AS score
+                FROM ({uniq_sql}) uniq
+                ORDER BY score DESC
+                LIMIT %s
+                OFFSET %s
+            """
+            return sql, [*scored_params, op.limit, op.offset]
+
+        # reciprocal rank fusion of the ranks of the vector and full-text searches
+        tsvector = _get_tsvector_sql(text_search["language"], "store.value")
+        sql = f"""
+                WITH {scored_sql},
+                by_vector AS (
+                    SELECT uniq.*, ROW_NUMBER() OVER (ORDER BY uniq.neg_score ASC) AS rank
+                    FROM ({uniq_sql}) uniq
+                ),
+                by_text AS (
+                    SELECT store.prefix, store.key, store.value, store.created_at, store.updated_at,
+                        ROW_NUMBER() OVER (ORDER BY ts_rank_cd({tsvector}, q) DESC) AS rank
+                    FROM store, websearch_to_tsquery('{text_search["language"]}'::regconfig, %s) q
+                    WHERE {tsvector} @@ q AND {condition} {extra_filters}
+                    ORDER BY rank
+                    LIMIT %s
+                )
+                SELECT COALESCE(v.prefix, l.prefix) AS prefix,
+                    COALESCE(v.key, l.key) AS key,
+                    COALESCE(v.value, l.value) AS value,
+                    COALESCE(v.created_at, l.created_at) AS created_at,
+                    COALESCE(v.updated_at, l.updated_at) AS updated_at,
+                    COALESCE(1.0::float8 / ({_RRF_K} + v.rank), 0)
+                        + COALESCE(%s::float8 / ({_RRF_K} + l.rank), 0) AS score
+                FROM by_vector v
+                FULL OUTER JOIN by_text l ON v.prefix = l.prefix AND v.key = l.key
+                ORDER BY score DESC
+                LIMIT %s
+                OFFSET %s
+            """
+        params = [
+            *scored_params,
+            op.query,
+            *condition_params,
+            (op.limit + op.offset) * 2,
+            text_search["weight"],
+            op.limit,
+            op.offset,
+        ]
+        return sql, params
+
+    def _get_iterative_scan_query(self) -> tuple[str, tuple[str, str]] | None:
+        """Statement enabling the iterative scans of the ANN index, if configured.
+
+        Iterative scans keep scanning the index until enough vectors pass the
+        filters of a search. The setting applies to the session of the connection.
+        """
+        kind, _ = _get_index_params(self)
+        index_config = self.index_config or {}
+        mode = index_config.get("ann_index_config", {}).get("iterative_scan")
+        if not mode or kind == "flat":
+            return None
+        return "SELECT set_config(%s, %s, false)", (f"{kind}.iterative_scan", mode)
+
     def _get_batch_list_namespaces_queries(
         self,
         list_ops: Sequence[tuple[int, ListNamespacesOp]],
@@ -598,10 +923,19 @@ class BasePostgresStore(Generic[C]):
                             f"Unknown match_type in list_namespaces: {condition.match_type}"
                         )
 
+            if op.after is not None:
+                # namespaces are truncated to a prefix of themselves, which
+                # can only come after the cursor if they do
+                conditions.append("prefix > %s")
+                params.append(_namespace_to_text(op.after))
+
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
             query += ") AS subquery "
 
+            if op.after is not None:
+                query += " WHERE truncated_prefix > %s"
+                params.append(_namespace_to_text(op.after))
             query += " ORDER BY truncated_prefix LIMIT %s OFFSET %s"
             params.extend([op.limit, op.offset])
             queries.append((query, tuple(params)))
@@ -610,21 +944,51 @@ class BasePostgresStore(Generic[C]):
 
     def _get_filter_condition(self, key: str, op: str, value: Any) -> tuple[str, list]:
         """Helper to generate filter conditions."""
-        if op == "$eq":
-            return "value->%s = %s::jsonb", [key, json.dumps(value)]
-        elif op == "$gt":
-            return "value->>%s > %s", [key, str(value)]
-        elif op == "$gte":
-            return "value->>%s >= %s", [key, str(value)]
-        elif op == "$lt":
-            return "value->>%s < %s", [key, str(value)]
-        elif op == "$lte":
-            return "value->>%s <= %s", [key, str(value)]
-        elif op == "$ne":
-            return "value->%s != %s::jsonb", [key, json.dumps(value)]
+        if op in ("$eq", "$ne"):
+            field, params = self._get_filter_field(key, "->")
+            comparison = "=" if op == "$eq" else "!="
+            return f"{field} {comparison} %s::jsonb", [*params, json.dumps(value)]
+        elif op in _RANGE_OPERATORS:
+            field, params = self._get_filter_field(key, "->>")
+            return f"{field} {_RANGE_OPERATORS[op]} %s", [*params, str(value)]
         else:
             raise ValueError(f"Unsupported operator: {op}")
 
+    def _get_filter_field(
+        self, key: str, operator: Literal["->", "->>"]
+    ) -> tuple[str, list]:
+        """Expression of a filtered field, with the key inlined for the filter fields
+        of the index config so that it matches the expression of their index."""
+        if key in ((self.index_config or {}).get("filter_fields") or ()):
+            return f"value{operator}'{key}'", []
+        return f"value{operator}%s", [key]
+
+    def _get_filter_index_sql(self) -> list[str]:
+        """Statements creating the indexes of the `filter_fields` of the index config,
+        and the full-text index of its `text_search`.
+
+        Each field gets an index on its JSON value, used by equality conditions, and
+        one on its text value, used by range conditions.
+        """
+        statements = []
+        for field in (self.index_config or {}).get("filter_fields") or []:
+            statements.append(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "store_filter_{field}_idx" '
+                f"ON store ((value->'{field}'));"
+            )
+            statements.append(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"\"store_filter_{field}_text_idx\" ON store ((value->>'{field}'));"
+            )
+        if text_search := _get_text_search_config(self.index_config):
+            language = text_search["language"]
+            statements.append(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f'"store_text_search_{language}_idx" ON store '
+                f"USING gin ({_get_tsvector_sql(language, 'value')});"
+            )
+        return statements
+
 
 class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
     """Postgres-backed store with optional vector search using pgvector.
@@ -714,6 +1078,7 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         "_ttl_stop_event",
     )
     supports_ttl: bool = True
+    supports_cursor: bool = True
 
     def __init__(
         self,
@@ -792,21 +1157,105 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 else:
                     yield cls(conn, index=index, ttl=ttl)
 
-    def sweep_ttl(self) -> int:
+    def reindex(
+        self,
+        namespace_prefix: tuple[str, ...] = (),
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+        force: bool = False,
+    ) -> int:
+        """Re-embed the fields of stored items after the index config changed.
+
+        Items are read in batches, and each of their fields is embedded again only if
+        its text, or the embedding model, changed since the field was embedded. The
+        vectors of fields no longer in the `fields` of the index config are deleted.
+        Fields embedded before the store recorded text hashes are all embedded again.
+        An interrupted reindex resumes by running it again, since fields already
+        reindexed are skipped.
+
+        Note:
+            Embedding functions are identified by name, so a function that starts
+            calling another model is not seen as a model change. Reindex with
+            `force=True` to embed every field again in that case.
+
+        Args:
+            namespace_prefix: Prefix of the namespaces of the items to reindex.
+                Defaults to all items.
+            batch_size: Number of items read and embedded at once.
+            max_concurrency: Maximum number of batches embedded at once.
+            force: Whether to embed every field again, even those whose text and
+                embedding model did not change.
+
+        Returns:
+            int: The number of texts embedded.
+        """
+        if not self.index_config or not self.embeddings:
+            raise ValueError("Reindexing requires an index configuration.")
+        items = self.search_iter(
+            namespace_prefix, page_size=batch_size, refresh_ttl=False
+        )
+        return _reindex_batches(
+            functools.partial(self._reindex, force=force),
+            items,
+            batch_size,
+            max_concurrency,
+        )
+
+    def _reindex(self, items: list[SearchItem], force: bool = False) -> int:
+        assert self.index_config is not None and self.embeddings is not None
+        index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+        query, params = self._get_reindex_read_query(items)
+        with self._cursor() as cur:
+            cur.execute(query, params)
+            rows = cast(list[Row], cur.fetchall())
+        to_embed, stale = self._get_reindex_texts(rows, index_id, force)
+        texts = list(dict.fromkeys(text for _, _, _, text, _ in to_embed))
+        vectors = self.embeddings.embed_documents(texts) if texts else []
+        queries = self._get_reindex_queries(
+            to_embed, dict(zip(texts, vectors, strict=True)), stale, index_id
+        )
+        if queries:
+            with self._cursor(pipeline=True) as cur:
+                for query, params in queries:
+                    cur.execute(query, params)
+        return len(texts)
+
+    def sweep_ttl(self, *, batch_size: int | None = None) -> int:
         """Delete expired store items based on TTL.
 
+        Args:
+            batch_size: Maximum number of items deleted per statement. Defaults to
+                the `sweep_batch_size` of the TTL config, or 1000.
+
         Returns:
             int: The number of deleted items.
         """
-        with self._cursor() as cur:
-            cur.execute(
-                """
-                DELETE FROM store
-                WHERE expires_at IS NOT NULL AND expires_at < NOW()
-                """
-            )
-            deleted_count = cur.rowcount
-            return deleted_count
+        return sum(self.sweep_ttl_batches(batch_size=batch_size))
+
+    def sweep_ttl_batches(self, *, batch_size: int | None = None) -> Iterator[int]:
+        """Delete expired store items in batches, oldest first.
+
+        Each batch is deleted by its own statement, so that locks are released and
+        other queries can run between batches while a large number of expired items
+        is deleted.
+
+        Args:
+            batch_size: Maximum number of items deleted per batch. Defaults to the
+                `sweep_batch_size` of the TTL config, or 1000.
+
+        Yields:
+            int: The number of items deleted by each batch.
+        """
+        query, batch_size = self._get_sweep_ttl_query(batch_size)
+        while True:
+            with self._cursor() as cur:
+                cur.execute(query, (batch_size,))
+                deleted = cur.rowcount
+            if deleted:
+                yield deleted
+            if deleted < batch_size:
+                return
 
     def start_ttl_sweeper(
         self, sweep_interval_minutes: int | None = None
@@ -846,7 +1295,12 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                         break
 
                     try:
-                        expired_items = self.sweep_ttl()
+                        expired_items = 0
+                        for deleted in self.sweep_ttl_batches():
+                            expired_items += deleted
+                            logger.debug(f"Store swept {deleted} expired items")
+                            if self._ttl_stop_event.is_set():
+                                break
                         if expired_items > 0:
                             logger.info(f"Store swept {expired_items} expired items")
                     except Exception as exc:
@@ -1012,18 +1466,9 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
             vectors = self.embeddings.embed_documents(
                 [param[-1] for param in txt_params]
             )
-            queries.append(
-                (
-                    query,
-                    [
-                        p
-                        for (ns, k, pathname, _), vector in zip(
-                            txt_params, vectors, strict=False
-                        )
-                        for p in (ns, k, pathname, vector)
-                    ],
-                )
-            )
+            assert self.index_config is not None
+            index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+            queries.append((query, _get_vector_params(txt_params, vectors, index_id)))
 
         for query, params in queries:
             cur.execute(query, params)
@@ -1047,6 +1492,8 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 for i in range(len(_paramslist)):
                     if _paramslist[i] is PLACEHOLDER:
                         _paramslist[i] = embedding
+            if iterative_scan := self._get_iterative_scan_query():
+                cur.execute(*iterative_scan)
 
         for (idx, _), (query, params) in zip(search_ops, queries, strict=False):
             cur.execute(query, params)
@@ -1109,6 +1556,9 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                     )
                     raise
 
+            for sql in self._get_filter_index_sql():
+                cur.execute(sql)
+
             if self.index_config:
                 version = _get_version(cur, table="vector_migrations")
                 for v, migration in enumerate(
@@ -1137,11 +1587,32 @@ class Row(TypedDict):
 
 # Private utilities
 
+_RANGE_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+# rank constant of reciprocal rank fusion
+_RRF_K = 60
+
 _DEFAULT_ANN_CONFIG = ANNIndexConfig(
     vector_type="vector",
 )
 
 
+def _get_vector_params(
+    txt_params: Sequence[tuple[str, str, str, str]],
+    vectors: Sequence[Sequence[float]],
+    index_id: str,
+) -> tuple[list[str], list[str], list[str], list[str], list[bytes]]:
+    """Columns of the vectors to insert, with the embeddings in their text format
+    and the hashes of the texts embedded."""
+    return (
+        [ns for ns, _, _, _ in txt_params],
+        [k for _, k, _, _ in txt_params],
+        [pathname for _, _, pathname, _ in txt_params],
+        [orjson.dumps(list(vector)).decode("utf-8") for vector in vectors],
+        [_hash_text(index_id, text) for _, _, _, text in txt_params],
+    )
+
+
 def _get_vector_type_ops(store: BasePostgresStore) -> str:
     """Get the vector type operator class based on config."""
     if not store.index_config:
@@ -1183,9 +1654,32 @@ def _get_index_params(store: Any) -> tuple[str, dict[str, Any]]:
     index_config = config.get("ann_index_config", _DEFAULT_ANN_CONFIG).copy()
     kind = index_config.pop("kind", "hnsw")
     index_config.pop("vector_type", None)
+    index_config.pop("iterative_scan", None)
     return kind, index_config
 
 
+def _get_text_search_config(
+    index_config: PostgresIndexConfig | None,
+) -> TextSearchConfig | None:
+    """Get the full-text search configuration, with its defaults."""
+    text_search = (index_config or {}).get("text_search")
+    if not text_search:
+        return None
+    if text_search is True:
+        text_search = {}
+    return TextSearchConfig(
+        language=text_search.get("language", "english"),
+        weight=text_search.get("weight", 1.0),
+    )
+
+
+def _get_tsvector_sql(language: str, column: str) -> str:
+    """Full-text vector of the string values of a column, as indexed by setup()."""
+    return (
+        f"""jsonb_to_tsvector('{language}'::regconfig, {column}, '["string"]'::jsonb)"""
+    )
+
+
 def _namespace_to_text(
     namespace: tuple[str, ...], handle_wildcards: bool = False
 ) -> str:
@@ -1338,8 +1832,36 @@ def _ensure_index_config(
             tot += len(toks)
     index_config["__tokenized_fields"] = tokenized
     index_config["__estimated_num_vectors"] = tot
+    for field in index_config.get("filter_fields") or []:
+        # inlined in SQL statements
+        if not re.match(r"^[a-zA-Z0-9_.-]+$", field):
+            raise ValueError(
+                f"Invalid filter field: '{field}'. Filter fields must contain only "
+                "alphanumeric characters, underscores, dots, and hyphens."
+            )
+    ann_index_config = index_config.get("ann_index_config", {})
+    iterative_scan = ann_index_config.get("iterative_scan")
+    if iterative_scan not in (None, "off", "strict_order", "relaxed_order"):
+        raise ValueError(
+            "Iterative scan must be 'off', 'strict_order' or 'relaxed_order'. "
+            f"Got {iterative_scan}"
+        )
+    if iterative_scan == "strict_order" and ann_index_config.get("kind") == "ivfflat":
+        raise ValueError("ivfflat indexes only support 'relaxed_order' iterative scans")
+    if text_search := _get_text_search_config(index_config):
+        # inlined in SQL statements
+        if not re.match(r"^[a-zA-Z0-9_]+$", text_search["language"]):
+            raise ValueError(
+                f"Invalid text search language: '{text_search['language']}'. "
+                "It must contain only alphanumeric characters and underscores."
+            )
+    if index_config.get("exact_search_threshold", 0) < 0:
+        raise ValueError("exact_search_threshold must be at least 0")
     embeddings = ensure_embeddings(
         index_config.get("embed"),
+        cache=index_config.get("cache"),
+        batch_size=index_config.get("embed_batch_size"),
+        max_concurrency=index_config.get("embed_concurrency"),
     )
     return embeddings, index_config
 
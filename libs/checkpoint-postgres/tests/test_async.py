@@ -278,6 +278,32 @@ async def test_asearch(saver_name: str, test_data) -> None:
         } == {"", "inner"}
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+async def test_alist_metadata(saver_name: str, test_data) -> None:
+    async with _saver(saver_name) as saver:
+        configs = test_data["configs"]
+        checkpoints = test_data["checkpoints"]
+        metadata = test_data["metadata"]
+
+        await saver.aput(configs[0], checkpoints[0], metadata[0], {})
+        await saver.aput(configs[1], checkpoints[1], metadata[1], {})
+        await saver.aput(configs[2], checkpoints[2], metadata[2], {})
+
+        results = [c async for c in saver.alist_metadata(None)]
+        assert len(results) == 3
+        assert [r.config for r in results] == [
+            r.config async for r in saver.alist(None)
+        ]
+
+        filtered = [c async for c in saver.alist_metadata(None, filter={"step": 1})]
+        assert len(filtered) == 1
+        assert filtered[0].metadata == {
+            **_exclude_keys(configs[1]["configurable"]),
+            **metadata[1],
+        }
+        assert filtered[0].ts == checkpoints[1]["ts"]
+
+
 @pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
 async def test_null_chars(saver_name: str, test_data) -> None:
     async with _saver(saver_name) as saver:
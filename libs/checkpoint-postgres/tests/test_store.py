@@ -20,6 +20,7 @@ from langgraph.store.base import (
 from psycopg import Connection
 
 from langgraph.store.postgres import PostgresStore
+from langgraph.store.postgres.base import PLACEHOLDER
 from tests.conftest import (
     DEFAULT_URI,
     VECTOR_TYPES,
@@ -186,6 +187,60 @@ def test_batch_put_ops(store: PostgresStore) -> None:
     assert item3 is None
 
 
+def test_batch_put_many(store: PostgresStore) -> None:
+    n = 5000
+    store.batch(
+        [
+            PutOp(namespace=("bulk", str(i % 7)), key=f"key{i}", value={"i": i})
+            for i in range(n)
+        ]
+    )
+    # deletes and updates across namespaces in a single batch
+    results = store.batch(
+        [
+            *(
+                PutOp(namespace=("bulk", str(i % 7)), key=f"key{i}", value=None)
+                for i in range(0, n, 2)
+            ),
+            PutOp(namespace=("bulk", "1"), key="key1", value={"i": -1}, ttl=None),
+            # integer and fractional TTLs in the same batch
+            PutOp(namespace=("ttl",), key="int", value={"i": 0}, ttl=60),
+            PutOp(namespace=("ttl",), key="float", value={"i": 1}, ttl=1.5),
+        ]
+    )
+    assert all(result is None for result in results)
+    assert {item.key for item in store.search(("ttl",))} == {"int", "float"}
+
+    items = store.search(("bulk",), limit=n)
+    assert len(items) == n // 2
+    assert {item.key for item in items} == {f"key{i}" for i in range(1, n, 2)}
+    item = store.get(("bulk", "1"), "key1")
+    assert item and item.value == {"i": -1}
+
+
+def test_search_iter(store: PostgresStore) -> None:
+    for i in range(25):
+        store.put(("docs", str(i % 3)), f"key{i:02d}", {"i": i})
+    store.put(("other",), "key", {"i": -1})
+    expected = sorted((("docs", str(i % 3)), f"key{i:02d}") for i in range(25))
+
+    items = list(store.search_iter(("docs",), page_size=4))
+    assert [(item.namespace, item.key) for item in items] == expected
+    items = list(store.search_iter(("docs",), filter={"i": {"$gte": 20}}))
+    assert sorted(item.value["i"] for item in items) == [20, 21, 22, 23, 24]
+
+    assert list(store.list_namespaces_iter(page_size=2)) == [
+        ("docs", "0"),
+        ("docs", "1"),
+        ("docs", "2"),
+        ("other",),
+    ]
+    assert list(store.list_namespaces_iter(max_depth=1, page_size=1)) == [
+        ("docs",),
+        ("other",),
+    ]
+
+
 def test_batch_search_ops(store: PostgresStore) -> None:
     # Setup test data
     test_data = [
@@ -382,6 +437,8 @@ def _create_vector_store(
     fake_embeddings: Embeddings,
     text_fields: list[str] | None = None,
     enable_ttl: bool = True,
+    filter_fields: list[str] | None = None,
+    **index_options: Any,
 ) -> PostgresStore:
     """Create a store with vector search enabled."""
     database = f"test_{uuid4().hex[:16]}"
@@ -404,6 +461,9 @@ def _create_vector_store(
         "distance_type": distance_type,
         "fields": text_fields,
     }
+    if filter_fields:
+        index_config["filter_fields"] = filter_fields
+    index_config.update(index_options)
 
     with Connection.connect(admin_conn_string, autocommit=True) as conn:
         conn.execute(f"CREATE DATABASE {database}")
@@ -556,6 +616,185 @@ def test_vector_search_with_filters(
     assert results[0].key == "doc3"
 
 
+def test_filter_fields_index(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that filters on the filter fields use their indexes."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        enable_ttl=False,
+        filter_fields=["color", "rank"],
+    ) as store:
+        for i in range(200):
+            store.put(
+                ("test",),
+                f"doc{i}",
+                {"color": ["red", "green", "blue"][i % 3], "rank": f"{i:03d}"},
+                index=False,
+            )
+        with store._cursor() as cur:
+            cur.execute("ANALYZE store")
+
+        results = store.search(("test",), filter={"color": "red"}, limit=100)
+        assert len(results) == 67
+        results = store.search(("test",), filter={"rank": {"$gte": "196"}})
+        assert {r.key for r in results} == {f"doc{i}" for i in range(196, 200)}
+
+        for filter, index in [
+            ({"color": "blue"}, "store_filter_color_idx"),
+            ({"rank": {"$gt": "190"}}, "store_filter_rank_text_idx"),
+        ]:
+            queries, _ = store._prepare_batch_search_queries(
+                [(0, SearchOp(("test",), filter=filter))]
+            )
+            query, params = queries[0]
+            with store._cursor() as cur:
+                cur.execute("SET enable_seqscan = off")
+                cur.execute("EXPLAIN " + query, params)
+                plan = "\n".join(row["QUERY PLAN"] for row in cur)
+            assert index in plan, plan
+
+
+def test_exact_search(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that selective searches compute exact distances and return all results."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        enable_ttl=False,
+        exact_search_threshold=10,
+        ann_index_config={"kind": "hnsw", "iterative_scan": "relaxed_order"},
+    ) as store:
+        store.batch(
+            [
+                PutOp(("users", str(i % 50)), f"doc{i}", {"text": f"memory {i}"})
+                for i in range(500)
+            ]
+        )
+        with store._cursor() as cur:
+            cur.execute("ANALYZE store")
+            cur.execute("ANALYZE store_vectors")
+
+        # 10 items in the namespace, out of 500 items: exact search
+        results = store.search(("users", "7"), query="memory 7", limit=20)
+        assert {r.key for r in results} == {f"doc{i}" for i in range(7, 500, 50)}
+        assert results == sorted(results, key=lambda r: r.score, reverse=True)
+        results = store.search(
+            ("users",), query="memory 7", filter={"text": "memory 7"}
+        )
+        assert [r.key for r in results] == ["doc7"]
+        # 500 items in the namespace: ANN search
+        results = store.search(("users",), query="memory", limit=5, offset=5)
+        assert len(results) == 5
+
+        for namespace, exact in [(("users", "7"), True), (("users",), False)]:
+            queries, _ = store._prepare_batch_search_queries(
+                [(0, SearchOp(namespace, query="memory"))]
+            )
+            query, params = queries[0]
+            params = [
+                fake_embeddings.embed_query("memory") if p is PLACEHOLDER else p
+                for p in params
+            ]
+            with store._cursor() as cur:
+                cur.execute("SET enable_seqscan = off")
+                cur.execute("EXPLAIN ANALYZE " + query, params)
+                plan = [row["QUERY PLAN"] for row in cur]
+            ann_scans = [line for line in plan if "store_vectors_embedding_idx" in line]
+            assert ann_scans, plan
+            assert all("never executed" in line for line in ann_scans) == exact, plan
+
+
+def test_hybrid_search(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that full-text matches are fused with vector search results."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        text_fields=["text"],
+        enable_ttl=False,
+        text_search={"language": "simple"},
+    ) as store:
+        docs = {
+            "doc1": {"text": "aaaa bbbb", "tag": "xylophone"},
+            "doc2": {"text": "aaab bbba", "tag": "drums"},
+            "doc3": {"text": "zzzz yyyy", "tag": "xylophone"},
+        }
+        for key, value in docs.items():
+            store.put(("test",), key, value)
+        with store._cursor() as cur:
+            cur.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname = %s",
+                ("store_text_search_simple_idx",),
+            )
+            assert cur.fetchone() is not None
+
+        # the tag is not embedded, but matches the text of doc1 and doc3
+        results = store.search(("test",), query="xylophone")
+        assert {r.key for r in results[:2]} == {"doc1", "doc3"}
+        assert results[2].key == "doc2"
+        assert results[1].score > results[2].score
+        results = store.search(("test",), query="xylophone", filter={"tag": "drums"})
+        assert [r.key for r in results] == ["doc2"]
+        results = store.search(("test",), query="zzzz", limit=1, refresh_ttl=True)
+        assert [r.key for r in results] == ["doc3"]
+
+    with pytest.raises(ValueError, match="Invalid text search language"):
+        PostgresStore(
+            None,
+            index={
+                "dims": fake_embeddings.dims,
+                "embed": fake_embeddings,
+                "text_search": {"language": "english'; DROP TABLE store; --"},
+            },
+        )
+    with pytest.raises(ValueError, match="only support 'relaxed_order'"):
+        PostgresStore(
+            None,
+            index={
+                "dims": fake_embeddings.dims,
+                "embed": fake_embeddings,
+                "ann_index_config": {
+                    "kind": "ivfflat",
+                    "iterative_scan": "strict_order",
+                },
+            },
+        )
+
+
+def test_reindex(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that reindexing only embeds the fields whose text changed."""
+    query = "SELECT key, field_name FROM store_vectors ORDER BY key, field_name"
+    with _create_vector_store(
+        "vector", "cosine", fake_embeddings, text_fields=["text"], enable_ttl=False
+    ) as store:
+        store.put(("docs",), "a", {"text": "apples", "title": "A"})
+        store.put(("docs",), "b", {"text": "bananas", "title": "B"}, index=False)
+        store.put(("docs",), "c", {"text": "cherries", "title": "C"}, index=["title"])
+        assert store.reindex(batch_size=2) == 2
+        assert store.reindex() == 0
+        assert store.reindex(force=True) == 3
+
+        # a store on the same tables with other fields
+        other = PostgresStore(
+            store.conn,
+            index={**store.index_config, "fields": ["text", "title"]},
+        )
+        assert other.reindex(batch_size=1, max_concurrency=2) == 3
+        with store._cursor() as cur:
+            cur.execute(query)
+            assert [(row["key"], row["field_name"]) for row in cur] == [
+                ("a", "text"),
+                ("a", "title"),
+                ("b", "text"),
+                ("b", "title"),
+                ("c", "text"),
+                ("c", "title"),
+            ]
+        results = other.search(("docs",), query="cherries", limit=1)
+        assert results[0].key == "c"
+
+
 def test_vector_search_pagination(vector_store: PostgresStore) -> None:
     """Test pagination with vector search."""
     # Insert multiple similar documents
@@ -863,6 +1102,17 @@ def test_store_ttl(store):
     assert len(res) == 0
 
 
+def test_sweep_ttl_batches(store: PostgresStore) -> None:
+    ns = ("sweep",)
+    for i in range(5):
+        store.put(ns, f"item{i}", {"i": i}, ttl=1 / 60)
+    store.put(ns, "permanent", {"i": -1}, ttl=None)
+    time.sleep(2)
+    assert list(store.sweep_ttl_batches(batch_size=2)) == [2, 2, 1]
+    assert store.sweep_ttl() == 0
+    assert [item.key for item in store.search(ns)] == ["permanent"]
+
+
 @pytest.mark.parametrize(
     "vector_type,distance_type",
     [
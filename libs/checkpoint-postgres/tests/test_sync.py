@@ -14,6 +14,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.delta import DeltaEncoder
 from langgraph.checkpoint.serde.types import TASKS
 from psycopg import Connection
 from psycopg.rows import dict_row
@@ -258,6 +259,30 @@ def test_search(saver_name: str, test_data) -> None:
         } == {"", "inner"}
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+def test_list_metadata(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        configs = test_data["configs"]
+        checkpoints = test_data["checkpoints"]
+        metadata = test_data["metadata"]
+
+        saver.put(configs[0], checkpoints[0], metadata[0], {})
+        saver.put(configs[1], checkpoints[1], metadata[1], {})
+        saver.put(configs[2], checkpoints[2], metadata[2], {})
+
+        results = list(saver.list_metadata(None))
+        assert len(results) == 3
+        assert [r.config for r in results] == [r.config for r in saver.list(None)]
+
+        filtered = list(saver.list_metadata(None, filter={"step": 1}))
+        assert len(filtered) == 1
+        assert filtered[0].metadata == {
+            **_exclude_keys(configs[1]["configurable"]),
+            **metadata[1],
+        }
+        assert filtered[0].ts == checkpoints[1]["ts"]
+
+
 @pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
 def test_null_chars(saver_name: str, test_data) -> None:
     with _saver(saver_name) as saver:
@@ -330,6 +355,40 @@ def test_pending_sends_migration(saver_name: str) -> None:
         assert TASKS in search_results[0].checkpoint["channel_versions"]
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_delta_channel_values(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        saver.delta = DeltaEncoder(saver.serde, max_chain=2)
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        chkpnt = empty_checkpoint()
+        values = [["a"], ["a", "b"], ["a", "b", "c"], ["a", "b", "c", "d"], ["x"]]
+        configs = []
+        for i, messages in enumerate(values, 1):
+            chkpnt = create_checkpoint(chkpnt, None, i)
+            chkpnt["channel_values"] = {"messages": messages}
+            chkpnt["channel_versions"] = {
+                "messages": saver.get_next_version(None, None)
+            }
+            config = saver.put(config, chkpnt, {}, chkpnt["channel_versions"])
+            configs.append(config)
+
+        with saver._cursor() as cur:
+            cur.execute(
+                "SELECT count(*) AS deltas FROM checkpoint_blobs WHERE type LIKE 'delta:%%'"
+            )
+            # a full copy after 2 deltas, or when the list was rewritten
+            assert cur.fetchone()["deltas"] == 2
+
+        for config, messages in zip(configs, values, strict=True):
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {
+                "messages": messages
+            }
+        assert [
+            c.checkpoint["channel_values"]["messages"]
+            for c in saver.list({"configurable": {"thread_id": "thread-1"}})
+        ] == values[::-1]
+
+
 @pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
 def test_get_checkpoint_no_channel_values(
     monkeypatch, saver_name: str, test_data
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import queue
 import random
 import sqlite3
 import threading
 from collections.abc import AsyncIterator, Iterator, Sequence
-from contextlib import closing, contextmanager
+from contextlib import ExitStack, closing, contextmanager
 from typing import Any, cast
 
 from langchain_core.runnables import RunnableConfig
@@ -15,14 +16,25 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.serde.delta import DeltaEncoder
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INLINE_CHECKPOINTS_MIGRATION,
+    UPSERT_CHECKPOINT_BLOBS_SQL,
+    blobs_where,
+    delta_bases,
+    dump_blobs,
+    load_blobs,
+    metadata_index_sql,
+    search_where,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -48,6 +60,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
     Args:
         conn (sqlite3.Connection): The SQLite database connection.
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to JsonPlusSerializerCompat.
+        readers (Sequence[sqlite3.Connection]): Read-only connections to serve reads from. Defaults to no readers.
+        indexed_metadata_keys (Sequence[str]): Metadata keys to index for `list(filter=...)`. Defaults to ("source", "step").
+        max_delta_chain (int): Store list channel values that only grew since their previous version as the appended items, with a full copy at least every `max_delta_chain` versions. Defaults to 0 (always full copies).
 
     Examples:
 
@@ -73,6 +88,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
     """  # noqa
 
     conn: sqlite3.Connection
+    readers: queue.Queue[sqlite3.Connection] | None
     is_setup: bool
 
     def __init__(
@@ -80,20 +96,51 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         conn: sqlite3.Connection,
         *,
         serde: SerializerProtocol | None = None,
+        readers: Sequence[sqlite3.Connection] = (),
+        indexed_metadata_keys: Sequence[str] = ("source", "step"),
+        max_delta_chain: int = 0,
     ) -> None:
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
         self.is_setup = False
         self.lock = threading.Lock()
+        self.readers = None
+        self.indexed_metadata_keys = indexed_metadata_keys
+        self.delta = (
+            DeltaEncoder(self.serde, max_chain=max_delta_chain)
+            if max_delta_chain > 0
+            else None
+        )
+        if readers:
+            self.readers = queue.Queue()
+            for reader in readers:
+                self.readers.put(reader)
 
     @classmethod
     @contextmanager
-    def from_conn_string(cls, conn_string: str) -> Iterator[SqliteSaver]:
+    def from_conn_string(
+        cls,
+        conn_string: str,
+        *,
+        readers: int = 0,
+        indexed_metadata_keys: Sequence[str] = ("source", "step"),
+        max_delta_chain: int = 0,
+    ) -> Iterator[SqliteSaver]:
         """Create a new SqliteSaver instance from a connection string.
 
         Args:
             conn_string: The SQLite connection string.
+            readers: The number of read-only connections to open alongside the
+                writer connection. Reads (`get_tuple`, `list`, `list_metadata`)
+                are served from this pool so they no longer wait on writes.
+                Ignored for in-memory databases. Defaults to 0.
+            indexed_metadata_keys: Metadata keys to index, so that filtering on them
+                with `filter=...` doesn't scan the whole table.
+                Defaults to ("source", "step").
+            max_delta_chain: Store list channel values that only grew since their
+                previous version as the appended items, with a full copy at least
+                every `max_delta_chain` versions. Defaults to 0 (always full copies).
 
         Yields:
             SqliteSaver: A new SqliteSaver instance.
@@ -109,15 +156,37 @@ class SqliteSaver(BaseCheckpointSaver[str]):
 
                 with SqliteSaver.from_conn_string("checkpoints.sqlite") as memory:
                     ...
+
+            To disk, with a pool of concurrent readers:
+
+                with SqliteSaver.from_conn_string("checkpoints.sqlite", readers=4) as memory:
+                    ...
         """
-        with closing(
-            sqlite3.connect(
-                conn_string,
-                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
-                check_same_thread=False,
+        with ExitStack() as stack:
+            conn = stack.enter_context(
+                closing(
+                    sqlite3.connect(
+                        conn_string,
+                        # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                        check_same_thread=False,
+                    )
+                )
+            )
+            reader_conns: list[sqlite3.Connection] = []
+            # in-memory databases are private to a connection, so can't be shared
+            if readers and conn.execute("PRAGMA database_list").fetchone()[2]:
+                for _ in range(readers):
+                    reader = stack.enter_context(
+                        closing(sqlite3.connect(conn_string, check_same_thread=False))
+                    )
+                    reader.execute("PRAGMA query_only = ON")
+                    reader_conns.append(reader)
+            yield cls(
+                conn,
+                readers=reader_conns,
+                indexed_metadata_keys=indexed_metadata_keys,
+                max_delta_chain=max_delta_chain,
             )
-        ) as conn:
-            yield cls(conn)
 
     def setup(self) -> None:
         """Set up the checkpoint database.
@@ -140,6 +209,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 type TEXT,
                 checkpoint BLOB,
                 metadata BLOB,
+                ts TEXT,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
             );
             CREATE TABLE IF NOT EXISTS writes (
@@ -153,11 +223,74 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
+            CREATE TABLE IF NOT EXISTS checkpoint_migrations (
+                v INTEGER PRIMARY KEY
+            );
             """
         )
+        for key in self.indexed_metadata_keys:
+            self.conn.execute(metadata_index_sql(key))
+        if not self.conn.execute(
+            "SELECT v FROM checkpoint_migrations WHERE v = ?",
+            (INLINE_CHECKPOINTS_MIGRATION,),
+        ).fetchone():
+            self._migrate_inline_checkpoints()
+            self.conn.execute(
+                "INSERT INTO checkpoint_migrations (v) VALUES (?)",
+                (INLINE_CHECKPOINTS_MIGRATION,),
+            )
+        self.conn.commit()
 
         self.is_setup = True
 
+    def _migrate_inline_checkpoints(self) -> None:
+        """Copy channel values of checkpoints stored inline into checkpoint_blobs.
+
+        Checkpoints written before channel values were stored as versioned blobs
+        keep their values inline. Newer checkpoints only store blobs for the channels
+        they changed, so the blobs of unchanged channels have to exist for every
+        older checkpoint too. This also backfills the `ts` column. It runs once.
+        """
+        columns = [
+            row[1] for row in self.conn.execute("PRAGMA table_info(checkpoints)")
+        ]
+        if "ts" not in columns:
+            self.conn.execute("ALTER TABLE checkpoints ADD COLUMN ts TEXT")
+        while rows := self.conn.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM checkpoints WHERE ts IS NULL LIMIT 100"
+        ).fetchall():
+            for thread_id, checkpoint_ns, checkpoint_id, type, checkpoint in rows:
+                checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+                if "channel_values" in checkpoint_:
+                    self.conn.executemany(
+                        UPSERT_CHECKPOINT_BLOBS_SQL,
+                        dump_blobs(
+                            self.serde,
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_values"],
+                            checkpoint_.get("channel_versions", {}),
+                        ),
+                    )
+                self.conn.execute(
+                    "UPDATE checkpoints SET ts = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (
+                        checkpoint_.get("ts", ""),
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                    ),
+                )
+
     @contextmanager
     def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
         """Get a cursor for the SQLite database.
@@ -181,6 +314,33 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor on a reader connection, if any.
+
+        The cursor runs inside a read transaction, so all queries issued through it
+        see the same snapshot of the database. Falls back to the writer connection
+        when no readers are configured.
+        """
+        if self.readers is None:
+            with self.cursor(transaction=False) as cur:
+                yield cur
+            return
+        if not self.is_setup:
+            with self.lock:
+                self.setup()
+        conn = self.readers.get()
+        try:
+            conn.execute("BEGIN")
+            cur = conn.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
+                conn.rollback()
+        finally:
+            self.readers.put(conn)
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -217,7 +377,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             CheckpointTuple(...)
         """  # noqa
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        with self.cursor(transaction=False) as cur:
+        with self._read_cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 cur.execute(
@@ -251,6 +411,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                checkpoint_ = self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -263,7 +426,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 # deserialize the checkpoint and metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    checkpoint_,
                     cast(
                         CheckpointMetadata,
                         json.loads(metadata) if metadata is not None else {},
@@ -331,7 +494,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        with self.cursor(transaction=False) as cur, closing(self.conn.cursor()) as wcur:
+        with self._read_cursor() as cur, closing(cur.connection.cursor()) as wcur:
             cur.execute(query, param_values)
             for (
                 thread_id,
@@ -342,6 +505,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                checkpoint_ = self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -354,7 +520,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    checkpoint_,
                     cast(
                         CheckpointMetadata,
                         json.loads(metadata) if metadata is not None else {},
@@ -376,6 +542,72 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        Channel values and pending writes are never loaded. Checkpoints are ordered
+        by checkpoint ID in descending order, so the `config` of the last item can
+        be passed as `before` to fetch the next page.
+
+        Args:
+            config: The config to use for listing the checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: The maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of checkpoint metadata tuples.
+        """
+        where, param_values = search_where(config, filter, before)
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata, ts
+        FROM checkpoints
+        {where}
+        ORDER BY checkpoint_id DESC"""
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._read_cursor() as cur:
+            cur.execute(query, param_values)
+            for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                ts,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    cast(
+                        CheckpointMetadata,
+                        json.loads(metadata) if metadata is not None else {},
+                    ),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                    ts or None,
+                )
+
     def put(
         self,
         config: RunnableConfig,
@@ -409,13 +641,25 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        copy = checkpoint.copy()
+        values: dict[str, Any] = copy.pop("channel_values", {})  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = json.dumps(
             get_checkpoint_metadata(config, metadata), ensure_ascii=False
         ).encode("utf-8", "ignore")
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self.delta,
+        )
         with self.cursor() as cur:
+            if blobs:
+                cur.executemany(UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
             cur.execute(
-                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                 (
                     str(config["configurable"]["thread_id"]),
                     checkpoint_ns,
@@ -424,8 +668,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     type_,
                     serialized_checkpoint,
                     serialized_metadata,
+                    checkpoint["ts"],
                 ),
             )
+        if self.delta is not None:
+            self.delta.commit(str(thread_id), checkpoint_ns)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -491,6 +738,45 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 "DELETE FROM writes WHERE thread_id = ?",
                 (str(thread_id),),
             )
+            cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+                (str(thread_id),),
+            )
+        if self.delta is not None:
+            self.delta.forget(str(thread_id))
+
+    def _load_checkpoint(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        # channel values are stored as versioned blobs, except in checkpoints
+        # written before that, which still carry their values inline
+        if "channel_values" not in checkpoint_:
+            checkpoint_["channel_values"] = {}
+            if versions := checkpoint_.get("channel_versions"):
+                where, param_values = blobs_where(
+                    thread_id, checkpoint_ns, versions.items()
+                )
+                cur.execute(
+                    f"SELECT channel, type, blob FROM checkpoint_blobs {where}",
+                    param_values,
+                )
+                blobs = cur.fetchall()
+                bases: list[Any] = []
+                if pairs := delta_bases(self.serde, blobs):
+                    where, param_values = blobs_where(thread_id, checkpoint_ns, pairs)
+                    cur.execute(
+                        f"SELECT channel, version, type, blob FROM checkpoint_blobs {where}",
+                        param_values,
+                    )
+                    bases = cur.fetchall()
+                checkpoint_["channel_values"] = load_blobs(self.serde, blobs, bases)
+        return checkpoint_
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
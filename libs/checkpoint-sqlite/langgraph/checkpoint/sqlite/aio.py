@@ -3,8 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import random
-from collections.abc import AsyncIterator, Callable, Iterator, Sequence
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any, TypeVar, cast
 
 import aiosqlite
@@ -15,14 +15,25 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.serde.delta import DeltaEncoder
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INLINE_CHECKPOINTS_MIGRATION,
+    UPSERT_CHECKPOINT_BLOBS_SQL,
+    blobs_where,
+    delta_bases,
+    dump_blobs,
+    load_blobs,
+    metadata_index_sql,
+    search_where,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -105,6 +116,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
     """
 
     lock: asyncio.Lock
+    readers: asyncio.Queue[aiosqlite.Connection] | None
     is_setup: bool
 
     def __init__(
@@ -112,6 +124,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         conn: aiosqlite.Connection,
         *,
         serde: SerializerProtocol | None = None,
+        readers: Sequence[aiosqlite.Connection] = (),
+        indexed_metadata_keys: Sequence[str] = ("source", "step"),
+        max_delta_chain: int = 0,
     ):
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
@@ -119,22 +134,65 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.is_setup = False
+        self.readers = None
+        self.indexed_metadata_keys = indexed_metadata_keys
+        self.delta = (
+            DeltaEncoder(self.serde, max_chain=max_delta_chain)
+            if max_delta_chain > 0
+            else None
+        )
+        if readers:
+            self.readers = asyncio.Queue()
+            for reader in readers:
+                self.readers.put_nowait(reader)
 
     @classmethod
     @asynccontextmanager
     async def from_conn_string(
-        cls, conn_string: str
+        cls,
+        conn_string: str,
+        *,
+        readers: int = 0,
+        indexed_metadata_keys: Sequence[str] = ("source", "step"),
+        max_delta_chain: int = 0,
     ) -> AsyncIterator[AsyncSqliteSaver]:
         """Create a new AsyncSqliteSaver instance from a connection string.
 
         Args:
             conn_string: The SQLite connection string.
+            readers: The number of read-only connections to open alongside the
+                writer connection. Reads (`aget_tuple`, `alist`, `alist_metadata`)
+                are served from this pool so they no longer wait on writes.
+                Ignored for in-memory databases. Defaults to 0.
+            indexed_metadata_keys: Metadata keys to index, so that filtering on them
+                with `filter=...` doesn't scan the whole table.
+                Defaults to ("source", "step").
+            max_delta_chain: Store list channel values that only grew since their
+                previous version as the appended items, with a full copy at least
+                every `max_delta_chain` versions. Defaults to 0 (always full copies).
 
         Yields:
             AsyncSqliteSaver: A new AsyncSqliteSaver instance.
         """
-        async with aiosqlite.connect(conn_string) as conn:
-            yield cls(conn)
+        async with AsyncExitStack() as stack:
+            conn = await stack.enter_async_context(aiosqlite.connect(conn_string))
+            reader_conns: list[aiosqlite.Connection] = []
+            async with conn.execute("PRAGMA database_list") as cur:
+                row = await cur.fetchone()
+            # in-memory databases are private to a connection, so can't be shared
+            if readers and row is not None and row[2]:
+                for _ in range(readers):
+                    reader = await stack.enter_async_context(
+                        aiosqlite.connect(conn_string)
+                    )
+                    await reader.execute("PRAGMA query_only = ON")
+                    reader_conns.append(reader)
+            yield cls(
+                conn,
+                readers=reader_conns,
+                indexed_metadata_keys=indexed_metadata_keys,
+                max_delta_chain=max_delta_chain,
+            )
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
@@ -210,6 +268,47 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             except StopAsyncIteration:
                 break
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of matching checkpoint metadata tuples.
+        """
+        try:
+            # check if we are in the main thread, only bg threads can block
+            # we don't check in other methods to avoid the overhead
+            if asyncio.get_running_loop() is self.loop:
+                raise asyncio.InvalidStateError(
+                    "Synchronous calls to AsyncSqliteSaver are only allowed from a "
+                    "different thread. From the main thread, use the async interface. "
+                    "For example, use `checkpointer.alist_metadata(...)` or `await "
+                    "graph.ainvoke(...)`."
+                )
+        except RuntimeError:
+            pass
+        aiter_ = self.alist_metadata(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    anext(aiter_),  # type: ignore[arg-type]  # noqa: F821
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
     def put(
         self,
         config: RunnableConfig,
@@ -278,6 +377,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         already exist. It is called automatically when needed and should not be called
         directly by the user.
         """
+        if self.is_setup:
+            return
         async with self.lock:
             if self.is_setup:
                 return
@@ -294,6 +395,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     type TEXT,
                     checkpoint BLOB,
                     metadata BLOB,
+                    ts TEXT,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
                 );
                 CREATE TABLE IF NOT EXISTS writes (
@@ -307,12 +409,102 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
+                CREATE TABLE IF NOT EXISTS checkpoint_migrations (
+                    v INTEGER PRIMARY KEY
+                );
                 """
             ):
-                await self.conn.commit()
+                pass
+            for key in self.indexed_metadata_keys:
+                await self.conn.execute(metadata_index_sql(key))
+            async with self.conn.execute(
+                "SELECT v FROM checkpoint_migrations WHERE v = ?",
+                (INLINE_CHECKPOINTS_MIGRATION,),
+            ) as cur:
+                migrated = await cur.fetchone()
+            if not migrated:
+                await self._migrate_inline_checkpoints()
+                await self.conn.execute(
+                    "INSERT INTO checkpoint_migrations (v) VALUES (?)",
+                    (INLINE_CHECKPOINTS_MIGRATION,),
+                )
+            await self.conn.commit()
 
             self.is_setup = True
 
+    async def _migrate_inline_checkpoints(self) -> None:
+        """Copy channel values of checkpoints stored inline into checkpoint_blobs.
+
+        Checkpoints written before channel values were stored as versioned blobs
+        keep their values inline. Newer checkpoints only store blobs for the channels
+        they changed, so the blobs of unchanged channels have to exist for every
+        older checkpoint too. This also backfills the `ts` column. It runs once.
+        """
+        async with self.conn.execute("PRAGMA table_info(checkpoints)") as cur:
+            columns = [row[1] async for row in cur]
+        if "ts" not in columns:
+            await self.conn.execute("ALTER TABLE checkpoints ADD COLUMN ts TEXT")
+        while True:
+            async with self.conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, type, checkpoint FROM checkpoints WHERE ts IS NULL LIMIT 100"
+            ) as cur:
+                rows = await cur.fetchall()
+            if not rows:
+                break
+            for thread_id, checkpoint_ns, checkpoint_id, type, checkpoint in rows:
+                checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+                if "channel_values" in checkpoint_:
+                    await self.conn.executemany(
+                        UPSERT_CHECKPOINT_BLOBS_SQL,
+                        dump_blobs(
+                            self.serde,
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_values"],
+                            checkpoint_.get("channel_versions", {}),
+                        ),
+                    )
+                await self.conn.execute(
+                    "UPDATE checkpoints SET ts = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (
+                        checkpoint_.get("ts", ""),
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                    ),
+                )
+
+    @asynccontextmanager
+    async def _read_conn(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Get a reader connection, if any.
+
+        The connection is inside a read transaction, so all queries issued through it
+        see the same snapshot of the database. Falls back to the writer connection
+        (holding the lock) when no readers are configured.
+        """
+        if self.readers is None:
+            async with self.lock:
+                yield self.conn
+            return
+        conn = await self.readers.get()
+        try:
+            await conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                await conn.rollback()
+        finally:
+            self.readers.put_nowait(conn)
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -329,7 +521,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         """
         await self.setup()
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        async with self.lock, self.conn.cursor() as cur:
+        async with self._read_conn() as conn, conn.cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 await cur.execute(
@@ -363,6 +555,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                checkpoint_ = await self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -375,7 +570,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 # deserialize the checkpoint and metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    checkpoint_,
                     cast(
                         CheckpointMetadata,
                         (json.loads(metadata) if metadata is not None else {}),
@@ -428,9 +623,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         if limit:
             query += f" LIMIT {limit}"
         async with (
-            self.lock,
-            self.conn.execute(query, params) as cur,
-            self.conn.cursor() as wcur,
+            self._read_conn() as conn,
+            conn.execute(query, params) as cur,
+            conn.cursor() as wcur,
         ):
             async for (
                 thread_id,
@@ -441,6 +636,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                checkpoint_ = await self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -453,7 +651,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    checkpoint_,
                     cast(
                         CheckpointMetadata,
                         (json.loads(metadata) if metadata is not None else {}),
@@ -475,6 +673,72 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     ],
                 )
 
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database asynchronously.
+
+        Channel values and pending writes are never loaded. Checkpoints are ordered
+        by checkpoint ID in descending order, so the `config` of the last item can
+        be passed as `before` to fetch the next page.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        await self.setup()
+        where, params = search_where(config, filter, before)
+        query = f"""SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata, ts
+        FROM checkpoints
+        {where}
+        ORDER BY checkpoint_id DESC"""
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._read_conn() as conn, conn.execute(query, params) as cur:
+            async for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                ts,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    cast(
+                        CheckpointMetadata,
+                        (json.loads(metadata) if metadata is not None else {}),
+                    ),
+                    (
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                    ts or None,
+                )
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -499,14 +763,25 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        copy = checkpoint.copy()
+        values: dict[str, Any] = copy.pop("channel_values", {})  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = json.dumps(
             get_checkpoint_metadata(config, metadata), ensure_ascii=False
         ).encode("utf-8", "ignore")
-        async with (
-            self.lock,
-            self.conn.execute(
-                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self.delta,
+        )
+        async with self.lock, self.conn.cursor() as cur:
+            if blobs:
+                await cur.executemany(UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+            await cur.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                 (
                     str(config["configurable"]["thread_id"]),
                     checkpoint_ns,
@@ -515,10 +790,12 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     type_,
                     serialized_checkpoint,
                     serialized_metadata,
+                    checkpoint["ts"],
                 ),
-            ),
-        ):
+            )
             await self.conn.commit()
+        if self.delta is not None:
+            self.delta.commit(str(thread_id), checkpoint_ns)
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -586,7 +863,44 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 "DELETE FROM writes WHERE thread_id = ?",
                 (str(thread_id),),
             )
+            await cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+                (str(thread_id),),
+            )
             await self.conn.commit()
+        if self.delta is not None:
+            self.delta.forget(str(thread_id))
+
+    async def _load_checkpoint(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type: str,
+        checkpoint: bytes,
+    ) -> Checkpoint:
+        checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        # channel values are stored as versioned blobs, except in checkpoints
+        # written before that, which still carry their values inline
+        if "channel_values" not in checkpoint_:
+            checkpoint_["channel_values"] = {}
+            if versions := checkpoint_.get("channel_versions"):
+                where, params = blobs_where(thread_id, checkpoint_ns, versions.items())
+                await cur.execute(
+                    f"SELECT channel, type, blob FROM checkpoint_blobs {where}",
+                    params,
+                )
+                blobs = await cur.fetchall()
+                bases: Iterable[Any] = ()
+                if pairs := delta_bases(self.serde, blobs):
+                    where, params = blobs_where(thread_id, checkpoint_ns, pairs)
+                    await cur.execute(
+                        f"SELECT channel, version, type, blob FROM checkpoint_blobs {where}",
+                        params,
+                    )
+                    bases = await cur.fetchall()
+                checkpoint_["channel_values"] = load_blobs(self.serde, blobs, bases)
+        return checkpoint_
 
     def get_next_version(self, current: str | None, channel: None) -> str:
         """Generate the next version ID for a channel.
@@ -0,0 +1,732 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, cast
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointMetadataTuple,
+    CheckpointTuple,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.checkpoint.sqlite.utils import metadata_index_sql, search_where
+
+SETUP_SQL = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS shallow_checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata BLOB,
+    ts TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns)
+);
+CREATE TABLE IF NOT EXISTS shallow_checkpoint_blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel)
+);
+CREATE TABLE IF NOT EXISTS shallow_writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+SELECT_SQL = "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM shallow_checkpoints "
+
+SELECT_METADATA_SQL = "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, metadata, ts FROM shallow_checkpoints "
+
+SELECT_BLOBS_SQL = "SELECT channel, type, blob FROM shallow_checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ?"
+
+SELECT_WRITES_SQL = "SELECT task_id, channel, type, value FROM shallow_writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx"
+
+DELETE_SUPERSEDED_WRITES_SQL = "DELETE FROM shallow_writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id NOT IN (?, ?)"
+
+UPSERT_CHECKPOINT_BLOBS_SQL = "INSERT OR REPLACE INTO shallow_checkpoint_blobs (thread_id, checkpoint_ns, channel, type, blob) VALUES (?, ?, ?, ?, ?)"
+
+UPSERT_CHECKPOINTS_SQL = "INSERT OR REPLACE INTO shallow_checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+UPSERT_WRITES_SQL = "INSERT OR REPLACE INTO shallow_writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_WRITES_SQL = "INSERT OR IGNORE INTO shallow_writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def _dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: dict[str, Any],
+    versions: ChannelVersions,
+) -> list[tuple[str, str, str, str, bytes | None]]:
+    return [
+        (
+            thread_id,
+            checkpoint_ns,
+            k,
+            *(serde.dumps_typed(values[k]) if k in values else ("empty", None)),
+        )
+        for k in versions
+    ]
+
+
+def _parent_config(
+    thread_id: str, checkpoint_ns: str, parent_checkpoint_id: str | None
+) -> RunnableConfig | None:
+    if not parent_checkpoint_id:
+        return None
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": parent_checkpoint_id,
+        }
+    }
+
+
+class ShallowSqliteSaver(SqliteSaver):
+    """A checkpoint saver that stores ONLY the most recent checkpoint of each thread
+    in a SQLite database.
+
+    Each put() overwrites the previous checkpoint in place and drops the writes it
+    superseded, so storage grows with the number of threads rather than the number
+    of steps. It supports most of the LangGraph persistence functionality with the
+    exception of time travel.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.sqlite.shallow import ShallowSqliteSaver
+        >>> from langgraph.graph import StateGraph
+        >>>
+        >>> builder = StateGraph(int)
+        >>> builder.add_node("add_one", lambda x: x + 1)
+        >>> builder.set_entry_point("add_one")
+        >>> builder.set_finish_point("add_one")
+        >>> with ShallowSqliteSaver.from_conn_string("checkpoints.sqlite") as memory:
+        >>>     graph = builder.compile(checkpointer=memory)
+        >>>     graph.invoke(1, {"configurable": {"thread_id": "thread-1"}})
+    """
+
+    def setup(self) -> None:
+        """Set up the checkpoint database.
+
+        This method creates the necessary tables in the SQLite database if they don't
+        already exist. It is called automatically when needed and should not be called
+        directly by the user.
+        """
+        if self.is_setup:
+            return
+
+        self.conn.executescript(SETUP_SQL)
+        for key in self.indexed_metadata_keys:
+            self.conn.execute(metadata_index_sql(key, "shallow_checkpoints"))
+        self.conn.commit()
+
+        self.is_setup = True
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get the checkpoint tuple of a thread from the database.
+
+        For ShallowSqliteSaver, this is the most recent checkpoint of the thread,
+        regardless of the `checkpoint_id` in the config.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        with self._read_cursor() as cur:
+            cur.execute(
+                SELECT_SQL + "WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns),
+            )
+            if value := cur.fetchone():
+                return self._load_tuple(cur, *value)
+        return None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints from the database.
+
+        For ShallowSqliteSaver, this method returns ONLY the most recent checkpoint
+        of each matching thread.
+
+        Args:
+            config: The config to use for listing the checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: The maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of checkpoint tuples.
+        """
+        where, param_values = search_where(config, filter, before)
+        query = SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._read_cursor() as cur:
+            cur.execute(query, param_values)
+            for value in cur.fetchall():
+                yield self._load_tuple(cur, *value)
+
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database.
+
+        For ShallowSqliteSaver, this method returns ONLY the most recent checkpoint
+        of each matching thread.
+
+        Args:
+            config: The config to use for listing the checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: The maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of checkpoint metadata tuples.
+        """
+        where, param_values = search_where(config, filter, before)
+        query = SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        with self._read_cursor() as cur:
+            cur.execute(query, param_values)
+            for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                ts,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    cast(
+                        CheckpointMetadata,
+                        json.loads(metadata) if metadata is not None else {},
+                    ),
+                    _parent_config(thread_id, checkpoint_ns, parent_checkpoint_id),
+                    ts,
+                )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to the database.
+
+        For ShallowSqliteSaver, this method overwrites the previous checkpoint of the
+        thread, and deletes writes that don't belong to the new checkpoint or its parent.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            RunnableConfig: Updated configuration after storing the checkpoint.
+        """
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+        copy = checkpoint.copy()
+        values: dict[str, Any] = copy.pop("channel_values", {})  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
+        serialized_metadata = json.dumps(
+            get_checkpoint_metadata(config, metadata), ensure_ascii=False
+        ).encode("utf-8", "ignore")
+        blobs = _dump_blobs(self.serde, thread_id, checkpoint_ns, values, new_versions)
+        with self.cursor() as cur:
+            cur.execute(
+                DELETE_SUPERSEDED_WRITES_SQL,
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    parent_checkpoint_id or "",
+                ),
+            )
+            if blobs:
+                cur.executemany(UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+            cur.execute(
+                UPSERT_CHECKPOINTS_SQL,
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    parent_checkpoint_id,
+                    type_,
+                    serialized_checkpoint,
+                    serialized_metadata,
+                    checkpoint["ts"],
+                ),
+            )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes linked to a checkpoint.
+
+        Args:
+            config: Configuration of the related checkpoint.
+            writes: List of writes to store, each as (channel, value) pair.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        query = (
+            UPSERT_WRITES_SQL
+            if all(w[0] in WRITES_IDX_MAP for w in writes)
+            else INSERT_WRITES_SQL
+        )
+        with self.cursor() as cur:
+            cur.executemany(
+                query,
+                [
+                    (
+                        str(config["configurable"]["thread_id"]),
+                        str(config["configurable"]["checkpoint_ns"]),
+                        str(config["configurable"]["checkpoint_id"]),
+                        task_id,
+                        WRITES_IDX_MAP.get(channel, idx),
+                        channel,
+                        *self.serde.dumps_typed(value),
+                    )
+                    for idx, (channel, value) in enumerate(writes)
+                ],
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete the checkpoint and writes associated with a thread ID.
+
+        Args:
+            thread_id: The thread ID to delete.
+
+        Returns:
+            None
+        """
+        with self.cursor() as cur:
+            for table in (
+                "shallow_checkpoints",
+                "shallow_checkpoint_blobs",
+                "shallow_writes",
+            ):
+                cur.execute(
+                    f"DELETE FROM {table} WHERE thread_id = ?", (str(thread_id),)
+                )
+
+    def _load_tuple(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        parent_checkpoint_id: str | None,
+        type: str,
+        checkpoint: bytes,
+        metadata: bytes | None,
+    ) -> CheckpointTuple:
+        checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        cur.execute(SELECT_BLOBS_SQL, (thread_id, checkpoint_ns))
+        versions = checkpoint_.get("channel_versions", {})
+        checkpoint_["channel_values"] = {
+            channel: self.serde.loads_typed((type, blob))
+            for channel, type, blob in cur.fetchall()
+            if type != "empty" and channel in versions
+        }
+        cur.execute(SELECT_WRITES_SQL, (thread_id, checkpoint_ns, checkpoint_id))
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint_,
+            cast(
+                CheckpointMetadata,
+                json.loads(metadata) if metadata is not None else {},
+            ),
+            _parent_config(thread_id, checkpoint_ns, parent_checkpoint_id),
+            [
+                (task_id, channel, self.serde.loads_typed((type, value)))
+                for task_id, channel, type, value in cur.fetchall()
+            ],
+        )
+
+
+class AsyncShallowSqliteSaver(AsyncSqliteSaver):
+    """An asynchronous checkpoint saver that stores ONLY the most recent checkpoint
+    of each thread in a SQLite database.
+
+    Each aput() overwrites the previous checkpoint in place and drops the writes it
+    superseded, so storage grows with the number of threads rather than the number
+    of steps. It supports most of the LangGraph persistence functionality with the
+    exception of time travel.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.sqlite.shallow import AsyncShallowSqliteSaver
+        >>> async with AsyncShallowSqliteSaver.from_conn_string("checkpoints.sqlite") as saver:
+        >>>     graph = builder.compile(checkpointer=saver)
+        >>>     await graph.ainvoke(1, {"configurable": {"thread_id": "thread-1"}})
+    """
+
+    async def setup(self) -> None:
+        """Set up the checkpoint database asynchronously.
+
+        This method creates the necessary tables in the SQLite database if they don't
+        already exist. It is called automatically when needed and should not be called
+        directly by the user.
+        """
+        if self.is_setup:
+            return
+        async with self.lock:
+            if self.is_setup:
+                return
+            if not self.conn.is_alive():
+                await self.conn
+            async with self.conn.executescript(SETUP_SQL):
+                pass
+            for key in self.indexed_metadata_keys:
+                await self.conn.execute(metadata_index_sql(key, "shallow_checkpoints"))
+            await self.conn.commit()
+
+            self.is_setup = True
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get the checkpoint tuple of a thread from the database asynchronously.
+
+        For AsyncShallowSqliteSaver, this is the most recent checkpoint of the thread,
+        regardless of the `checkpoint_id` in the config.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        await self.setup()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        async with self._read_conn() as conn, conn.cursor() as cur:
+            await cur.execute(
+                SELECT_SQL + "WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns),
+            )
+            if value := await cur.fetchone():
+                return await self._aload_tuple(cur, *value)
+        return None
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints from the database asynchronously.
+
+        For AsyncShallowSqliteSaver, this method returns ONLY the most recent
+        checkpoint of each matching thread.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An asynchronous iterator of matching checkpoint tuples.
+        """
+        await self.setup()
+        where, params = search_where(config, filter, before)
+        query = SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._read_conn() as conn, conn.cursor() as cur:
+            await cur.execute(query, params)
+            for value in await cur.fetchall():
+                yield await self._aload_tuple(cur, *value)
+
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the database asynchronously.
+
+        For AsyncShallowSqliteSaver, this method returns ONLY the most recent
+        checkpoint of each matching thread.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An asynchronous iterator of matching checkpoint metadata tuples.
+        """
+        await self.setup()
+        where, params = search_where(config, filter, before)
+        query = SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        if limit:
+            query += f" LIMIT {limit}"
+        async with self._read_conn() as conn, conn.execute(query, params) as cur:
+            async for (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                parent_checkpoint_id,
+                metadata,
+                ts,
+            ) in cur:
+                yield CheckpointMetadataTuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    cast(
+                        CheckpointMetadata,
+                        json.loads(metadata) if metadata is not None else {},
+                    ),
+                    _parent_config(thread_id, checkpoint_ns, parent_checkpoint_id),
+                    ts,
+                )
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to the database asynchronously.
+
+        For AsyncShallowSqliteSaver, this method overwrites the previous checkpoint of
+        the thread, and deletes writes that don't belong to the new checkpoint or its
+        parent.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            RunnableConfig: Updated configuration after storing the checkpoint.
+        """
+        await self.setup()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+        copy = checkpoint.copy()
+        values: dict[str, Any] = copy.pop("channel_values", {})  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
+        serialized_metadata = json.dumps(
+            get_checkpoint_metadata(config, metadata), ensure_ascii=False
+        ).encode("utf-8", "ignore")
+        blobs = _dump_blobs(self.serde, thread_id, checkpoint_ns, values, new_versions)
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(
+                DELETE_SUPERSEDED_WRITES_SQL,
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    parent_checkpoint_id or "",
+                ),
+            )
+            if blobs:
+                await cur.executemany(UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+            await cur.execute(
+                UPSERT_CHECKPOINTS_SQL,
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    parent_checkpoint_id,
+                    type_,
+                    serialized_checkpoint,
+                    serialized_metadata,
+                    checkpoint["ts"],
+                ),
+            )
+            await self.conn.commit()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes linked to a checkpoint asynchronously.
+
+        Args:
+            config: Configuration of the related checkpoint.
+            writes: List of writes to store, each as (channel, value) pair.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        query = (
+            UPSERT_WRITES_SQL
+            if all(w[0] in WRITES_IDX_MAP for w in writes)
+            else INSERT_WRITES_SQL
+        )
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.executemany(
+                query,
+                [
+                    (
+                        str(config["configurable"]["thread_id"]),
+                        str(config["configurable"]["checkpoint_ns"]),
+                        str(config["configurable"]["checkpoint_id"]),
+                        task_id,
+                        WRITES_IDX_MAP.get(channel, idx),
+                        channel,
+                        *self.serde.dumps_typed(value),
+                    )
+                    for idx, (channel, value) in enumerate(writes)
+                ],
+            )
+            await self.conn.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete the checkpoint and writes associated with a thread ID.
+
+        Args:
+            thread_id: The thread ID to delete.
+
+        Returns:
+            None
+        """
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            for table in (
+                "shallow_checkpoints",
+                "shallow_checkpoint_blobs",
+                "shallow_writes",
+            ):
+                await cur.execute(
+                    f"DELETE FROM {table} WHERE thread_id = ?", (str(thread_id),)
+                )
+            await self.conn.commit()
+
+    async def _aload_tuple(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        parent_checkpoint_id: str | None,
+        type: str,
+        checkpoint: bytes,
+        metadata: bytes | None,
+    ) -> CheckpointTuple:
+        checkpoint_: Checkpoint = self.serde.loads_typed((type, checkpoint))
+        await cur.execute(SELECT_BLOBS_SQL, (thread_id, checkpoint_ns))
+        versions = checkpoint_.get("channel_versions", {})
+        checkpoint_["channel_values"] = {
+            channel: self.serde.loads_typed((type, blob))
+            for channel, type, blob in await cur.fetchall()
+            if type != "empty" and channel in versions
+        }
+        await cur.execute(SELECT_WRITES_SQL, (thread_id, checkpoint_ns, checkpoint_id))
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint_,
+            cast(
+                CheckpointMetadata,
+                json.loads(metadata) if metadata is not None else {},
+            ),
+            _parent_config(thread_id, checkpoint_ns, parent_checkpoint_id),
+            [
+                (task_id, channel, self.serde.loads_typed((type, value)))
+                for task_id, channel, type, value in await cur.fetchall()
+            ],
+        )
+
+
+__all__ = ["ShallowSqliteSaver", "AsyncShallowSqliteSaver"]
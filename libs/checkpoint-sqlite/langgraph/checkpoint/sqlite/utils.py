@@ -1,11 +1,43 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import ChannelVersions, get_checkpoint_id
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.delta import (
+    DeltaEncoder,
+    is_delta,
+    join_delta,
+    loads_delta,
+)
+from langgraph.checkpoint.serde.lazy import loads_typed_lazy
+
+# version recorded in checkpoint_migrations once the channel values of checkpoints
+# stored inline have been copied into checkpoint_blobs
+INLINE_CHECKPOINTS_MIGRATION = 1
+
+UPSERT_CHECKPOINT_BLOBS_SQL = "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)"
+
+_METADATA_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def metadata_index_sql(key: str, table: str = "checkpoints") -> str:
+    """Return the statement creating an index on a metadata key.
+
+    The indexed expression is the one emitted by `_metadata_predicate`, so
+    SQLite uses the index for `list(filter=...)` without any query changes.
+    """
+    if not _METADATA_KEY_RE.match(key):
+        raise ValueError(f"Invalid metadata key for index: {key!r}")
+    return (
+        f"CREATE INDEX IF NOT EXISTS {table}_metadata_{key}_idx ON {table} "
+        f"(json_extract(CAST(metadata AS TEXT), '$.{key}'), thread_id, checkpoint_ns, checkpoint_id)"
+    )
 
 
 def _metadata_predicate(
@@ -93,3 +125,90 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def blobs_where(
+    thread_id: str, checkpoint_ns: str, versions: Iterable[tuple[str, Any]]
+) -> tuple[str, Sequence[Any]]:
+    """Return a WHERE clause matching the blobs of the given (channel, version) pairs.
+
+    Channel values are stored once per (channel, version) in the
+    `checkpoint_blobs` table, so loading a checkpoint selects exactly the
+    versions referenced by its `channel_versions`.
+    """
+    param_values: list[Any] = [thread_id, checkpoint_ns]
+    for channel, version in versions:
+        param_values.extend((channel, str(version)))
+    pairs = ", ".join("(?, ?)" for _ in range((len(param_values) - 2) // 2))
+    return (
+        f"WHERE thread_id = ? AND checkpoint_ns = ? AND (channel, version) IN (VALUES {pairs})",
+        param_values,
+    )
+
+
+def dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: dict[str, Any],
+    versions: ChannelVersions,
+    delta: DeltaEncoder | None = None,
+) -> list[tuple[str, str, str, str, str, bytes | None]]:
+    """Serialize channel values into `checkpoint_blobs` rows, one per version.
+
+    With a `delta` encoder, list values that only grew since their previous
+    version are serialized as the appended items.
+    """
+    if delta is not None:
+        typed = delta.dumps_typed(
+            thread_id, checkpoint_ns, values, {k: str(v) for k, v in versions.items()}
+        )
+    else:
+        typed = {k: serde.dumps_typed(v) for k, v in values.items() if k in versions}
+    return [
+        (
+            thread_id,
+            checkpoint_ns,
+            k,
+            str(ver),
+            *(typed[k] if k in typed else ("empty", None)),
+        )
+        for k, ver in versions.items()
+    ]
+
+
+def delta_bases(
+    serde: SerializerProtocol, blobs: Iterable[tuple[str, str, bytes | None]]
+) -> list[tuple[str, str]]:
+    """Return the (channel, version) of the blobs that delta blobs are built upon."""
+    return [
+        (channel, version)
+        for channel, type, blob in blobs
+        if is_delta(type)
+        for version in loads_delta(serde, (type, blob or b""))[0]
+    ]
+
+
+def load_blobs(
+    serde: SerializerProtocol,
+    blobs: Iterable[tuple[str, str, bytes | None]],
+    bases: Iterable[tuple[str, str, str, bytes | None]] = (),
+) -> dict[str, Any]:
+    """Deserialize (channel, type, blob) rows into channel values.
+
+    Delta blobs are rebuilt from `bases`, the (channel, version, type, blob) rows
+    of the versions returned by `delta_bases`.
+    """
+    bases_by_channel: defaultdict[str, dict[str, tuple[str, bytes]]] = defaultdict(dict)
+    for channel, version, type, blob in bases:
+        bases_by_channel[channel][version] = (type, blob or b"")
+    values: dict[str, Any] = {}
+    for channel, type, blob in blobs:
+        if type == "empty":
+            continue
+        if is_delta(type):
+            chain, items = loads_delta(serde, (type, blob or b""))
+            values[channel] = join_delta(serde, chain, items, bases_by_channel[channel])
+        else:
+            values[channel] = loads_typed_lazy(serde, (type, blob or b""))
+    return values
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from collections import defaultdict
 from collections.abc import AsyncIterator, Callable, Iterable, Sequence
@@ -17,10 +18,12 @@ from langgraph.store.base import (
     Op,
     PutOp,
     Result,
+    SearchItem,
     SearchOp,
     TTLConfig,
 )
 from langgraph.store.base.batch import AsyncBatchedBaseStore
+from langgraph.store.base.embed import _areindex_batches, _get_index_id
 
 from langgraph.store.sqlite.base import (
     _PLACEHOLDER,
@@ -86,6 +89,8 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
         This class requires the aiosqlite package. Install with `pip install aiosqlite`.
     """
 
+    supports_cursor = True
+
     def __init__(
         self,
         conn: aiosqlite.Connection,
@@ -176,6 +181,10 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
                     "INSERT INTO store_migrations (v) VALUES (?)", (v,)
                 )
 
+            # Index the filter fields
+            for sql in self._get_filter_index_sql():
+                await self.conn.execute(sql)
+
             # Apply vector migrations if index config is provided
             if self.index_config:
                 # Create vector migrations table if it doesn't exist
@@ -209,6 +218,10 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
                         "INSERT INTO vector_migrations (v) VALUES (?)", (v,)
                     )
 
+                # Quantize the vectors if configured
+                for sql in self._get_quantized_vector_sql():
+                    await self.conn.execute(sql)
+
             self.is_setup = True
 
     @asynccontextmanager
@@ -236,21 +249,109 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
                     if transaction:
                         await self.conn.execute("COMMIT")
 
-    async def sweep_ttl(self) -> int:
+    async def areindex(
+        self,
+        namespace_prefix: tuple[str, ...] = (),
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+        force: bool = False,
+    ) -> int:
+        """Re-embed the fields of stored items after the index config changed.
+
+        Items are read in batches, and each of their fields is embedded again only if
+        its text, or the embedding model, changed since the field was embedded. The
+        vectors of fields no longer in the `fields` of the index config are deleted.
+        Fields embedded before the store recorded text hashes are all embedded again.
+        An interrupted reindex resumes by running it again, since fields already
+        reindexed are skipped.
+
+        Note:
+            Embedding functions are identified by name, so a function that starts
+            calling another model is not seen as a model change. Reindex with
+            `force=True` to embed every field again in that case.
+
+        Args:
+            namespace_prefix: Prefix of the namespaces of the items to reindex.
+                Defaults to all items.
+            batch_size: Number of items read and embedded at once.
+            max_concurrency: Maximum number of batches embedded at once.
+            force: Whether to embed every field again, even those whose text and
+                embedding model did not change.
+
+        Returns:
+            int: The number of texts embedded.
+        """
+        if not self.index_config or not self.embeddings:
+            raise ValueError("Reindexing requires an index configuration.")
+        items = self.asearch_iter(
+            namespace_prefix, page_size=batch_size, refresh_ttl=False
+        )
+        return await _areindex_batches(
+            functools.partial(self._areindex, force=force),
+            items,
+            batch_size,
+            max_concurrency,
+        )
+
+    async def _areindex(self, items: list[SearchItem], force: bool = False) -> int:
+        assert self.index_config is not None and self.embeddings is not None
+        index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+        query, params = self._get_reindex_read_query(items)
+        async with self._cursor(transaction=False) as cur:
+            await cur.execute(query, params)
+            rows = await cur.fetchall()
+        to_embed, stale = self._get_reindex_texts(rows, index_id, force)
+        texts = list(dict.fromkeys(text for _, _, _, text, _ in to_embed))
+        vectors = await self.embeddings.aembed_documents(texts) if texts else []
+        queries = self._get_reindex_queries(
+            to_embed, dict(zip(texts, vectors, strict=True)), stale, index_id
+        )
+        if queries:
+            async with self._cursor() as cur:
+                for query, params in queries:
+                    await cur.execute(query, params)
+        return len(texts)
+
+    async def sweep_ttl(self, *, batch_size: int | None = None) -> int:
         """Delete expired store items based on TTL.
 
+        Args:
+            batch_size: Maximum number of items deleted per transaction. Defaults to
+                the `sweep_batch_size` of the TTL config, or 1000.
+
         Returns:
             int: The number of deleted items.
         """
-        async with self._cursor() as cur:
-            await cur.execute(
-                """
-                DELETE FROM store
-                WHERE expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP
-                """
-            )
-            deleted_count = cur.rowcount
-            return deleted_count
+        deleted_count = 0
+        async for deleted in self.sweep_ttl_batches(batch_size=batch_size):
+            deleted_count += deleted
+        return deleted_count
+
+    async def sweep_ttl_batches(
+        self, *, batch_size: int | None = None
+    ) -> AsyncIterator[int]:
+        """Delete expired store items in batches, oldest first.
+
+        Each batch is deleted in its own transaction, so other operations can run
+        between batches while a large number of expired items is deleted.
+
+        Args:
+            batch_size: Maximum number of items deleted per batch. Defaults to the
+                `sweep_batch_size` of the TTL config, or 1000.
+
+        Yields:
+            int: The number of items deleted by each batch.
+        """
+        query, batch_size = self._get_sweep_ttl_query(batch_size)
+        while True:
+            async with self._cursor() as cur:
+                await cur.execute(query, (batch_size,))
+                deleted = cur.rowcount
+            if deleted:
+                yield deleted
+            if deleted < batch_size:
+                return
 
     async def start_ttl_sweeper(
         self, sweep_interval_minutes: int | None = None
@@ -285,7 +386,12 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
                     except asyncio.TimeoutError:
                         pass
 
-                    expired_items = await self.sweep_ttl()
+                    expired_items = 0
+                    async for deleted in self.sweep_ttl_batches():
+                        expired_items += deleted
+                        logger.debug(f"Store swept {deleted} expired items")
+                        if self._ttl_stop_event.is_set():
+                            break
                     if expired_items > 0:
                         logger.info(f"Store swept {expired_items} expired items")
                 except asyncio.CancelledError:
@@ -481,15 +587,12 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
             vectors = await self.embeddings.aembed_documents(
                 [param[-1] for param in txt_params]
             )
-
-            # Convert vectors to SQLite-friendly format
-            vector_params = []
-            for (ns, k, pathname, _), vector in zip(txt_params, vectors, strict=False):
-                vector_params.extend(
-                    [ns, k, pathname, sqlite_vec.serialize_float32(vector)]
-                )
-
-            queries.append((query, vector_params))
+            assert self.index_config is not None
+            index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+            queries.append(
+                (query, self._get_vector_params(txt_params, vectors, index_id))
+            )
+            queries.extend(self._get_quantized_vector_queries(txt_params))
 
         for query, params in queries:
             await cur.execute(query, params)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import concurrent.futures
 import datetime
+import functools
 import logging
 import re
 import sqlite3
@@ -29,6 +30,12 @@ from langgraph.store.base import (
     get_text_at_path,
     tokenize_path,
 )
+from langgraph.store.base.embed import (
+    _get_index_id,
+    _get_indexed_texts,
+    _hash_text,
+    _reindex_batches,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteStore does not support async methods. "
@@ -83,14 +90,46 @@ CREATE TABLE IF NOT EXISTS store_vectors (
     PRIMARY KEY (prefix, key, field_name),
     FOREIGN KEY (prefix, key) REFERENCES store(prefix, key) ON DELETE CASCADE
 );
+""",
+    """
+-- Hash of the embedded text and of the embedding model, to skip unchanged fields
+-- when reindexing
+ALTER TABLE store_vectors
+ADD COLUMN text_hash BLOB;
 """,
 ]
 
 
-class SqliteIndexConfig(IndexConfig):
+class SqliteIndexConfig(IndexConfig, total=False):
     """Configuration for vector embeddings in SQLite store."""
 
-    pass
+    quantization: Literal["int8", "binary"] | None
+    """Quantize the vectors scanned by vector searches.
+
+    With quantization, searches rank the vectors by their distance to the query
+    on a compact copy of the vectors, then rescore the best candidates exactly
+    against the stored float32 vectors:
+
+    - "int8": 1 byte per dimension, 4x smaller than float32, with a small loss
+        of recall. Expects embeddings with values in [-1, 1].
+    - "binary": 1 bit per dimension, 32x smaller than float32, ranked by
+        Hamming distance. Works best with embeddings of many dimensions.
+
+    Defaults to None, which scans the float32 vectors.
+    """
+
+    rescore_multiplier: int
+    """The number of candidates rescored exactly, as a multiple of the number of
+    results needed. Defaults to 4 for "int8" and 10 for "binary" quantization.
+    """
+
+
+# (quantization mode) -> (function quantizing a vector, function reading it back)
+_QUANTIZATIONS = {
+    "int8": ("vec_quantize_int8({}, 'unit')", "vec_int8"),
+    "binary": ("vec_quantize_binary({})", "vec_bit"),
+}
+_DEFAULT_RESCORE_MULTIPLIERS = {"int8": 4, "binary": 10}
 
 
 def _namespace_to_text(
@@ -211,8 +250,32 @@ class BaseSqliteStore:
     MIGRATIONS = MIGRATIONS
     VECTOR_MIGRATIONS = VECTOR_MIGRATIONS
     supports_ttl = True
+    supports_cursor = True
     index_config: SqliteIndexConfig | None = None
     ttl_config: TTLConfig | None = None
+    _deserializer: Callable[[bytes | str | orjson.Fragment], dict[str, Any]] | None = (
+        None
+    )
+
+    def _get_sweep_ttl_query(self, batch_size: int | None) -> tuple[str, int]:
+        """Build the query deleting a batch of expired items, oldest first.
+
+        Returns the query and the maximum number of items it deletes. The items are
+        selected through the partial index on expires_at.
+        """
+        batch_size = (
+            batch_size or (self.ttl_config or {}).get("sweep_batch_size") or 1000
+        )
+        query = """
+            DELETE FROM store
+            WHERE rowid IN (
+                SELECT rowid FROM store
+                WHERE expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP
+                ORDER BY expires_at
+                LIMIT ?
+            )
+        """
+        return query, batch_size
 
     def _get_batch_GET_ops_queries(
         self, get_ops: Sequence[tuple[int, GetOp]]
@@ -347,7 +410,7 @@ class BaseSqliteStore:
                         for i, text in enumerate(texts):
                             pathname = f"{path}.{i}" if len(texts) > 1 else path
                             vector_values.append(
-                                "(?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                                "(?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
                             )
                             embedding_request_params.append((ns, k, pathname, text))
 
@@ -361,7 +424,7 @@ class BaseSqliteStore:
             if vector_values:
                 values_str = ",".join(vector_values)
                 query = f"""
-                    INSERT OR REPLACE INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
+                    INSERT OR REPLACE INTO store_vectors (prefix, key, field_name, embedding, text_hash, created_at, updated_at)
                     VALUES {values_str}
                 """
                 embedding_request = (query, embedding_request_params)
@@ -468,37 +531,93 @@ class BaseSqliteStore:
                     else:
                         prefix_filter_str = ""
 
-                # We use a CTE to compute scores, with a SQLite-compatible approach for distinct results
-                base_query = f"""
-                    WITH scored AS (
-                        SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at, s.expires_at, s.ttl_minutes,
-                            {score_expr} AS score
-                        FROM store s
-                        JOIN store_vectors sv ON s.prefix = sv.prefix AND s.key = sv.key
-                        {prefix_filter_str}
-                            ORDER BY score DESC 
+                if quantization := self.index_config.get("quantization"):
+                    # Rank the quantized vectors, then rescore the best candidates
+                    quantize, read = _QUANTIZATIONS[quantization]
+                    if quantization == "binary":
+                        distance = "vec_distance_hamming"
+                    elif distance_type == "l2":
+                        distance = "vec_distance_L2"
+                    elif distance_type == "inner_product":
+                        distance = "vec_distance_L1"
+                    else:
+                        distance = "vec_distance_cosine"
+                    base_query = f"""
+                        WITH candidates AS (
+                            SELECT q.prefix, q.key, q.field_name
+                            FROM store s
+                            JOIN store_vectors_{quantization} q ON s.prefix = q.prefix AND s.key = q.key
+                            {prefix_filter_str}
+                            ORDER BY {distance}({read}(q.embedding), {quantize.format("?")})
+                            LIMIT ?
+                        ),
+                        scored AS (
+                            SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at, s.expires_at, s.ttl_minutes,
+                                {score_expr} AS score
+                            FROM candidates c
+                            JOIN store_vectors sv ON sv.prefix = c.prefix AND sv.key = c.key AND sv.field_name = c.field_name
+                            JOIN store s ON s.prefix = sv.prefix AND s.key = sv.key
+                            ORDER BY score DESC
+                            LIMIT ?
+                        ),
+                        ranked AS (
+                            SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score,
+                                    ROW_NUMBER() OVER (PARTITION BY prefix, key ORDER BY score DESC) as rn
+                            FROM scored
+                        )
+                        SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score
+                        FROM ranked
+                        WHERE rn = 1
+                            ORDER BY score DESC
                         LIMIT ?
-                    ),
-                    ranked AS (
-                        SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score,
-                                ROW_NUMBER() OVER (PARTITION BY prefix, key ORDER BY score DESC) as rn
-                        FROM scored
+                        OFFSET ?
+                        """
+                    multiplier = self.index_config.get(
+                        "rescore_multiplier",
+                        _DEFAULT_RESCORE_MULTIPLIERS[quantization],
                     )
-                    SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score
-                    FROM ranked
-                    WHERE rn = 1
-                        ORDER BY score DESC
-                    LIMIT ?
-                    OFFSET ?
-                    """
-                params = [
-                    _PLACEHOLDER,  # Vector placeholder
-                    *ns_args,
-                    *filter_params,
-                    op.limit * 2,  # Expanded limit for better results
-                    op.limit,
-                    op.offset,
-                ]
+                    params = [
+                        *ns_args,
+                        *filter_params,
+                        _PLACEHOLDER,  # Quantized vector placeholder
+                        (op.limit + op.offset) * 2 * multiplier,
+                        _PLACEHOLDER,  # Vector placeholder
+                        op.limit * 2,  # Expanded limit for better results
+                        op.limit,
+                        op.offset,
+                    ]
+                else:
+                    # We use a CTE to compute scores, with a SQLite-compatible approach for distinct results
+                    base_query = f"""
+                        WITH scored AS (
+                            SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at, s.expires_at, s.ttl_minutes,
+                                {score_expr} AS score
+                            FROM store s
+                            JOIN store_vectors sv ON s.prefix = sv.prefix AND s.key = sv.key
+                            {prefix_filter_str}
+                                ORDER BY score DESC 
+                            LIMIT ?
+                        ),
+                        ranked AS (
+                            SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score,
+                                    ROW_NUMBER() OVER (PARTITION BY prefix, key ORDER BY score DESC) as rn
+                            FROM scored
+                        )
+                        SELECT prefix, key, value, created_at, updated_at, expires_at, ttl_minutes, score
+                        FROM ranked
+                        WHERE rn = 1
+                            ORDER BY score DESC
+                        LIMIT ?
+                        OFFSET ?
+                        """
+                    params = [
+                        _PLACEHOLDER,  # Vector placeholder
+                        *ns_args,
+                        *filter_params,
+                        op.limit * 2,  # Expanded limit for better results
+                        op.limit,
+                        op.offset,
+                    ]
             # Regular search branch (no vector search)
             else:
                 base_query = """
@@ -512,7 +631,13 @@ class BaseSqliteStore:
                     params.extend(filter_params)
                     base_query += " AND " + " AND ".join(filter_conditions)
 
-                base_query += " ORDER BY updated_at DESC"
+                if op.after is not None:
+                    # keyset pagination, in (prefix, key) order
+                    base_query += " AND (prefix, key) > (?, ?)"
+                    params.extend([_namespace_to_text(op.after[0]), op.after[1]])
+                    base_query += " ORDER BY prefix, key"
+                else:
+                    base_query += " ORDER BY updated_at DESC"
                 base_query += " LIMIT ? OFFSET ?"
                 params.extend([op.limit, op.offset])
 
@@ -562,6 +687,14 @@ class BaseSqliteStore:
                             "Unknown match_type in list_namespaces: %s", cond.match_type
                         )
 
+            after_params: list[Any] = []
+            if op.after is not None:
+                # namespaces are truncated to a prefix of themselves, which
+                # can only come after the cursor if they do
+                where_clauses.append("prefix > ?")
+                params.append(_namespace_to_text(op.after))
+                after_params.append(_namespace_to_text(op.after))
+
             where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
             if op.max_depth is not None:
@@ -609,11 +742,14 @@ class BaseSqliteStore:
                     )
                     SELECT DISTINCT truncated AS prefix
                     FROM split
-                    WHERE depth = ? OR remainder = ''
+                    WHERE (depth = ? OR remainder = '')
+                        {"AND truncated > ?" if after_params else ""}
                     ORDER BY prefix
                     LIMIT ? OFFSET ?
                 """
-                params.extend([op.max_depth, op.max_depth, op.limit, op.offset])
+                params.extend(
+                    [op.max_depth, op.max_depth, *after_params, op.limit, op.offset]
+                )
 
             else:
                 query = f"""
@@ -629,6 +765,226 @@ class BaseSqliteStore:
 
         return queries
 
+    def _get_filter_index_sql(self) -> list[str]:
+        """Statements creating the indexes of the `filter_fields` of the index config.
+
+        Each field gets an index on its JSON value, used by equality and string
+        comparisons, and one on its numeric value, used by numeric ranges.
+        """
+        statements = []
+        for field in (self.index_config or {}).get("filter_fields") or []:
+            _validate_filter_key(field)
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS "store_filter_{field}_idx" '
+                f"ON store (json_extract(value, '$.{field}'));"
+            )
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS "store_filter_{field}_num_idx" '
+                f"ON store (CAST(json_extract(value, '$.{field}') AS REAL));"
+            )
+        return statements
+
+    def _get_quantized_vector_sql(self) -> list[str]:
+        """Statements creating the table of the quantized vectors, and quantizing the
+        vectors stored before quantization was enabled.
+
+        The tables of the other quantization modes are dropped, since vectors are
+        only quantized with the mode of the index config.
+        """
+        quantization = (self.index_config or {}).get("quantization")
+        statements = [
+            f"DROP TABLE IF EXISTS store_vectors_{mode}"
+            for mode in _QUANTIZATIONS
+            if mode != quantization
+        ]
+        if quantization:
+            quantize, _ = _QUANTIZATIONS[quantization]
+            table = f"store_vectors_{quantization}"
+            statements.append(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    prefix text NOT NULL,
+                    key text NOT NULL,
+                    field_name text NOT NULL,
+                    embedding BLOB,
+                    PRIMARY KEY (prefix, key, field_name),
+                    FOREIGN KEY (prefix, key) REFERENCES store(prefix, key) ON DELETE CASCADE
+                )
+                """
+            )
+            statements.append(
+                f"""
+                INSERT INTO {table} (prefix, key, field_name, embedding)
+                SELECT sv.prefix, sv.key, sv.field_name, {quantize.format("sv.embedding")}
+                FROM store_vectors sv
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table} q
+                    WHERE q.prefix = sv.prefix AND q.key = sv.key AND q.field_name = sv.field_name
+                )
+                """
+            )
+        return statements
+
+    def _get_vector_params(
+        self,
+        txt_params: Sequence[tuple[str, str, str, str]],
+        vectors: Sequence[list[float]],
+        index_id: str,
+    ) -> list[Any]:
+        """Parameters inserting the vectors of the (prefix, key, field, text) rows."""
+        vector_params: list[Any] = []
+        for (ns, k, pathname, text), vector in zip(txt_params, vectors, strict=False):
+            vector_params.extend(
+                [
+                    ns,
+                    k,
+                    pathname,
+                    sqlite_vec.serialize_float32(vector),
+                    _hash_text(index_id, text),
+                ]
+            )
+        return vector_params
+
+    def _get_reindex_read_query(self, items: Sequence[Item]) -> tuple[str, list[str]]:
+        """Query the current values of the items, and the text hashes of their
+        vectors, for reindexing."""
+        values_str = ",".join(["(?, ?)"] * len(items))
+        query = f"""
+            SELECT s.prefix, s.key, s.value, v.field_name, v.text_hash
+            FROM store s
+            LEFT JOIN store_vectors v ON v.prefix = s.prefix AND v.key = s.key
+            WHERE (s.prefix, s.key) IN (VALUES {values_str})
+        """
+        params = [
+            p for item in items for p in (_namespace_to_text(item.namespace), item.key)
+        ]
+        return query, params
+
+    def _get_reindex_texts(
+        self, rows: Iterable[Sequence[Any]], index_id: str, force: bool = False
+    ) -> tuple[
+        list[tuple[str, str, str, str, bytes | None]], list[tuple[str, str, str]]
+    ]:
+        """Compare the texts of the items read to the hashes of their vectors.
+
+        Returns the (prefix, key, field, text, stored hash) of the fields to embed
+        again, and the (prefix, key, field) of the vectors of the fields that are no
+        longer indexed.
+        """
+        assert self.index_config is not None
+        values: dict[tuple[str, str], Any] = {}
+        hashes: dict[tuple[str, str], dict[str, bytes | None]] = defaultdict(dict)
+        for prefix, key, value, field_name, text_hash in rows:
+            values[(prefix, key)] = value
+            if field_name is not None:
+                hashes[(prefix, key)][field_name] = text_hash
+        to_embed: list[tuple[str, str, str, str, bytes | None]] = []
+        stale: list[tuple[str, str, str]] = []
+        for (ns, key), value in values.items():
+            stored = hashes.get((ns, key), {})
+            texts = dict(
+                _get_indexed_texts(
+                    (self._deserializer or _json_loads)(value),
+                    self.index_config["__tokenized_fields"],
+                )
+            )
+            stale.extend((ns, key, path) for path in stored if path not in texts)
+            for path, text in texts.items():
+                text_hash = stored.get(path)
+                if (
+                    force
+                    or text_hash is None
+                    or text_hash != _hash_text(index_id, text)
+                ):
+                    to_embed.append((ns, key, path, text, text_hash))
+        return to_embed, stale
+
+    def _get_reindex_queries(
+        self,
+        to_embed: Sequence[tuple[str, str, str, str, bytes | None]],
+        vectors: dict[str, list[float]],
+        stale: Sequence[tuple[str, str, str]],
+        index_id: str,
+    ) -> list[tuple[str, Sequence]]:
+        """Queries storing the vectors of the fields embedded again, and deleting the
+        vectors of the fields that are no longer indexed.
+
+        A vector is only stored if the hash stored for its field did not change since
+        it was read, so that vectors put in the meantime are not overwritten, and only
+        if the item was not deleted.
+        """
+        queries: list[tuple[str, Sequence]] = []
+        quantization = (self.index_config or {}).get("quantization")
+        if stale:
+            values_str = ",".join(["(?, ?, ?)"] * len(stale))
+            params = [p for row in stale for p in row]
+            for table in (
+                ["store_vectors", f"store_vectors_{quantization}"]
+                if quantization
+                else ["store_vectors"]
+            ):
+                queries.append(
+                    (
+                        f"""
+                        DELETE FROM {table}
+                        WHERE (prefix, key, field_name) IN (VALUES {values_str})
+                        """,
+                        params,
+                    )
+                )
+        if to_embed:
+            values_str = ",".join(["(?, ?, ?, ?, ?, ?)"] * len(to_embed))
+            query = f"""
+                INSERT INTO store_vectors (prefix, key, field_name, embedding, text_hash, created_at, updated_at)
+                SELECT t.column1, t.column2, t.column3, t.column4, t.column5, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                FROM (VALUES {values_str}) AS t
+                JOIN store s ON s.prefix = t.column1 AND s.key = t.column2
+                LEFT JOIN store_vectors v
+                    ON v.prefix = t.column1 AND v.key = t.column2 AND v.field_name = t.column3
+                WHERE v.text_hash IS t.column6
+                ON CONFLICT (prefix, key, field_name) DO UPDATE SET
+                    embedding = excluded.embedding,
+                    text_hash = excluded.text_hash,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+            params = [
+                p
+                for ns, k, pathname, text, text_hash in to_embed
+                for p in (
+                    ns,
+                    k,
+                    pathname,
+                    sqlite_vec.serialize_float32(vectors[text]),
+                    _hash_text(index_id, text),
+                    text_hash,
+                )
+            ]
+            queries.append((query, params))
+            queries.extend(
+                self._get_quantized_vector_queries(
+                    [(ns, k, pathname, text) for ns, k, pathname, text, _ in to_embed]
+                )
+            )
+        return queries
+
+    def _get_quantized_vector_queries(
+        self, txt_params: Sequence[tuple[str, str, str, str]]
+    ) -> list[tuple[str, Sequence]]:
+        """Queries quantizing the vectors just inserted, if quantization is enabled."""
+        quantization = (self.index_config or {}).get("quantization")
+        if not quantization or not txt_params:
+            return []
+        quantize, _ = _QUANTIZATIONS[quantization]
+        values_str = ",".join(["(?, ?, ?)"] * len(txt_params))
+        query = f"""
+            INSERT OR REPLACE INTO store_vectors_{quantization} (prefix, key, field_name, embedding)
+            SELECT prefix, key, field_name, {quantize.format("embedding")}
+            FROM store_vectors
+            WHERE (prefix, key, field_name) IN (VALUES {values_str})
+        """
+        params = [p for ns, k, pathname, _ in txt_params for p in (ns, k, pathname)]
+        return [(query, params)]
+
     def _get_filter_condition(self, key: str, op: str, value: Any) -> tuple[str, list]:
         """Helper to generate filter conditions."""
         _validate_filter_key(key)
@@ -787,6 +1143,7 @@ class SqliteStore(BaseSqliteStore, BaseStore):
     MIGRATIONS = MIGRATIONS
     VECTOR_MIGRATIONS = VECTOR_MIGRATIONS
     supports_ttl = True
+    supports_cursor = True
 
     def __init__(
         self,
@@ -1042,6 +1399,10 @@ class SqliteStore(BaseSqliteStore, BaseStore):
                 self.conn.executescript(sql)
                 self.conn.execute("INSERT INTO store_migrations (v) VALUES (?)", (v,))
 
+            # Index the filter fields
+            for sql in self._get_filter_index_sql():
+                self.conn.execute(sql)
+
             # Apply vector migrations if index config is provided
             if self.index_config:
                 # Create vector migrations table if it doesn't exist
@@ -1075,23 +1436,110 @@ class SqliteStore(BaseSqliteStore, BaseStore):
                         "INSERT INTO vector_migrations (v) VALUES (?)", (v,)
                     )
 
+                # Quantize the vectors if configured
+                for sql in self._get_quantized_vector_sql():
+                    self.conn.execute(sql)
+
             self.is_setup = True
 
-    def sweep_ttl(self) -> int:
+    def reindex(
+        self,
+        namespace_prefix: tuple[str, ...] = (),
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+        force: bool = False,
+    ) -> int:
+        """Re-embed the fields of stored items after the index config changed.
+
+        Items are read in batches, and each of their fields is embedded again only if
+        its text, or the embedding model, changed since the field was embedded. The
+        vectors of fields no longer in the `fields` of the index config are deleted.
+        Fields embedded before the store recorded text hashes are all embedded again.
+        An interrupted reindex resumes by running it again, since fields already
+        reindexed are skipped.
+
+        Note:
+            Embedding functions are identified by name, so a function that starts
+            calling another model is not seen as a model change. Reindex with
+            `force=True` to embed every field again in that case.
+
+        Args:
+            namespace_prefix: Prefix of the namespaces of the items to reindex.
+                Defaults to all items.
+            batch_size: Number of items read and embedded at once.
+            max_concurrency: Maximum number of batches embedded at once.
+            force: Whether to embed every field again, even those whose text and
+                embedding model did not change.
+
+        Returns:
+            int: The number of texts embedded.
+        """
+        if not self.index_config or not self.embeddings:
+            raise ValueError("Reindexing requires an index configuration.")
+        items = self.search_iter(
+            namespace_prefix, page_size=batch_size, refresh_ttl=False
+        )
+        return _reindex_batches(
+            functools.partial(self._reindex, force=force),
+            items,
+            batch_size,
+            max_concurrency,
+        )
+
+    def _reindex(self, items: list[SearchItem], force: bool = False) -> int:
+        assert self.index_config is not None and self.embeddings is not None
+        index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+        query, params = self._get_reindex_read_query(items)
+        with self._cursor(transaction=False) as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+        to_embed, stale = self._get_reindex_texts(rows, index_id, force)
+        texts = list(dict.fromkeys(text for _, _, _, text, _ in to_embed))
+        vectors = self.embeddings.embed_documents(texts) if texts else []
+        queries = self._get_reindex_queries(
+            to_embed, dict(zip(texts, vectors, strict=True)), stale, index_id
+        )
+        if queries:
+            with self._cursor() as cur:
+                for query, params in queries:
+                    cur.execute(query, params)
+        return len(texts)
+
+    def sweep_ttl(self, *, batch_size: int | None = None) -> int:
         """Delete expired store items based on TTL.
 
+        Args:
+            batch_size: Maximum number of items deleted per transaction. Defaults to
+                the `sweep_batch_size` of the TTL config, or 1000.
+
         Returns:
             int: The number of deleted items.
         """
-        with self._cursor() as cur:
-            cur.execute(
-                """
-                DELETE FROM store
-                WHERE expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP
-                """
-            )
-            deleted_count = cur.rowcount
-            return deleted_count
+        return sum(self.sweep_ttl_batches(batch_size=batch_size))
+
+    def sweep_ttl_batches(self, *, batch_size: int | None = None) -> Iterator[int]:
+        """Delete expired store items in batches, oldest first.
+
+        Each batch is deleted in its own transaction, so other operations can run
+        between batches while a large number of expired items is deleted.
+
+        Args:
+            batch_size: Maximum number of items deleted per batch. Defaults to the
+                `sweep_batch_size` of the TTL config, or 1000.
+
+        Yields:
+            int: The number of items deleted by each batch.
+        """
+        query, batch_size = self._get_sweep_ttl_query(batch_size)
+        while True:
+            with self._cursor() as cur:
+                cur.execute(query, (batch_size,))
+                deleted = cur.rowcount
+            if deleted:
+                yield deleted
+            if deleted < batch_size:
+                return
 
     def start_ttl_sweeper(
         self, sweep_interval_minutes: int | None = None
@@ -1131,7 +1579,12 @@ class SqliteStore(BaseSqliteStore, BaseStore):
                         break
 
                     try:
-                        expired_items = self.sweep_ttl()
+                        expired_items = 0
+                        for deleted in self.sweep_ttl_batches():
+                            expired_items += deleted
+                            logger.debug(f"Store swept {deleted} expired items")
+                            if self._ttl_stop_event.is_set():
+                                break
                         if expired_items > 0:
                             logger.info(f"Store swept {expired_items} expired items")
                     except Exception as exc:
@@ -1301,15 +1754,12 @@ class SqliteStore(BaseSqliteStore, BaseStore):
             vectors = self.embeddings.embed_documents(
                 [param[-1] for param in txt_params]
             )
-
-            # Convert vectors to SQLite-friendly format
-            vector_params = []
-            for (ns, k, pathname, _), vector in zip(txt_params, vectors, strict=False):
-                vector_params.extend(
-                    [ns, k, pathname, sqlite_vec.serialize_float32(vector)]
-                )
-
-            queries.append((query, vector_params))
+            assert self.index_config is not None
+            index_id = _get_index_id(self.embeddings, self.index_config["dims"])
+            queries.append(
+                (query, self._get_vector_params(txt_params, vectors, index_id))
+            )
+            queries.extend(self._get_quantized_vector_queries(txt_params))
 
         for query, params in queries:
             cur.execute(query, params)
@@ -1455,9 +1905,20 @@ def _ensure_index_config(
             tokenized.append((p, toks))
             tot += len(toks)
     index_config["__tokenized_fields"] = tokenized
+    quantization = index_config.get("quantization")
+    if quantization is not None and quantization not in _QUANTIZATIONS:
+        raise ValueError(
+            f"Quantization must be one of {list(_QUANTIZATIONS)} or None. "
+            f"Got {quantization}"
+        )
+    if index_config.get("rescore_multiplier", 1) < 1:
+        raise ValueError("rescore_multiplier must be at least 1")
     index_config["__estimated_num_vectors"] = tot
     embeddings = ensure_embeddings(
         index_config.get("embed"),
+        cache=index_config.get("cache"),
+        batch_size=index_config.get("embed_batch_size"),
+        max_concurrency=index_config.get("embed_concurrency"),
     )
     return embeddings, index_config
 
@@ -1,3 +1,6 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -8,8 +11,10 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.checkpoint.sqlite.shallow import AsyncShallowSqliteSaver
 
 
 class TestAsyncSqliteSaver:
@@ -114,3 +119,207 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_alist_metadata(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+            results = [c async for c in saver.alist_metadata(None)]
+            assert len(results) == 3
+            assert [r.config for r in results] == [
+                r.config async for r in saver.alist(None)
+            ]
+
+            filtered = [c async for c in saver.alist_metadata(None, filter={"step": 1})]
+            assert len(filtered) == 1
+            assert filtered[0].metadata == self.metadata_2
+
+    async def test_channel_values_stored_by_version(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            chkpnt["channel_values"] = {"messages": ["hi"] * 100, "count": 1}
+            chkpnt["channel_versions"] = {"messages": "1", "count": "1"}
+            config = await saver.aput(config, chkpnt, {}, chkpnt["channel_versions"])
+
+            # only "count" changed, so only its new version is written
+            next_chkpnt = create_checkpoint(chkpnt, None, 1)
+            next_chkpnt["channel_values"] = {"messages": ["hi"] * 100, "count": 2}
+            next_chkpnt["channel_versions"] = {"messages": "1", "count": "2"}
+            await saver.aput(config, next_chkpnt, {}, {"count": "2"})
+
+            async with saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs"
+            ) as cur:
+                assert sorted(await cur.fetchall()) == [
+                    ("count", "1"),
+                    ("count", "2"),
+                    ("messages", "1"),
+                ]
+
+            latest = await saver.aget_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert latest is not None
+            assert latest.checkpoint["channel_values"] == {
+                "messages": ["hi"] * 100,
+                "count": 2,
+            }
+            first = await saver.aget_tuple(config)
+            assert first is not None
+            assert first.checkpoint["channel_values"] == {
+                "messages": ["hi"] * 100,
+                "count": 1,
+            }
+            assert [
+                c.checkpoint["channel_values"]["count"] async for c in saver.alist(None)
+            ] == [2, 1]
+
+            await saver.adelete_thread("thread-1")
+            async with saver.conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_blobs"
+            ) as cur:
+                assert await cur.fetchone() == (0,)
+
+    async def test_delta_channel_values(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(
+            ":memory:", max_delta_chain=2
+        ) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            values = [[], ["a"], ["a", "b"], ["a", "b", "c"], ["x"], ["x", "y"]]
+            for i, messages in enumerate(values, 1):
+                chkpnt = create_checkpoint(chkpnt, None, i)
+                chkpnt["channel_values"] = {"messages": messages}
+                chkpnt["channel_versions"] = {"messages": str(i)}
+                config = await saver.aput(
+                    config, chkpnt, {}, chkpnt["channel_versions"]
+                )
+
+            async with saver.conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_blobs WHERE type LIKE 'delta:%'"
+            ) as cur:
+                assert await cur.fetchone() == (3,)
+            assert [
+                c.checkpoint["channel_values"]["messages"]
+                async for c in saver.alist(None)
+            ] == values[::-1]
+
+    async def test_legacy_inline_channel_values(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "checkpoints.sqlite")
+        # checkpoints written before versioned blobs carry values inline
+        chkpnt = empty_checkpoint()
+        chkpnt["channel_values"] = {"messages": ["hi"], "count": 1}
+        chkpnt["channel_versions"] = {"messages": "1", "count": "1"}
+        with closing(sqlite3.connect(db)) as conn:
+            conn.execute(
+                "CREATE TABLE checkpoints (thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL, parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata BLOB, PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    chkpnt["id"],
+                    None,
+                    *JsonPlusSerializer().dumps_typed(chkpnt),
+                    b"{}",
+                ),
+            )
+            # the application sharing the database uses user_version
+            conn.execute("PRAGMA user_version = 3")
+            conn.commit()
+
+        async with AsyncSqliteSaver.from_conn_string(db) as saver:
+            config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+            legacy = await saver.aget_tuple(config)
+            assert legacy is not None
+            assert legacy.checkpoint["channel_values"] == {
+                "messages": ["hi"],
+                "count": 1,
+            }
+            # setup() backfills ts and copies the inline values into blobs
+            assert [m.ts async for m in saver.alist_metadata(config)] == [chkpnt["ts"]]
+
+            next_chkpnt = create_checkpoint(chkpnt, None, 1)
+            next_chkpnt["channel_values"] = {"messages": ["hi"], "count": 2}
+            next_chkpnt["channel_versions"] = {"messages": "1", "count": "2"}
+            await saver.aput(legacy.config, next_chkpnt, {}, {"count": "2"})
+            latest = await saver.aget_tuple(config)
+            assert latest is not None
+            assert latest.checkpoint["channel_values"] == {
+                "messages": ["hi"],
+                "count": 2,
+            }
+
+    async def test_readers(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "checkpoints.sqlite")
+        async with AsyncSqliteSaver.from_conn_string(db, readers=2) as saver:
+            assert saver.readers is not None
+            assert saver.readers.qsize() == 2
+
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saved = await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput_writes(saved, [("foo", "bar")], "task-1")
+
+            tup = await saver.aget_tuple(saved)
+            assert tup is not None
+            assert tup.checkpoint["id"] == self.chkpnt_2["id"]
+            assert tup.pending_writes == [("task-1", "foo", "bar")]
+            assert len([c async for c in saver.alist(None)]) == 2
+            assert len([c async for c in saver.alist_metadata(None)]) == 2
+
+            # reads don't wait on the writer lock
+            async with saver.lock:
+                assert await saver.aget_tuple(saved) is not None
+            assert saver.readers.qsize() == 2
+
+    async def test_readers_in_memory(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:", readers=2) as saver:
+            assert saver.readers is None
+            saved = await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert await saver.aget_tuple(saved) is not None
+
+    async def test_shallow(self) -> None:
+        async with AsyncShallowSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            configs = []
+            for step in range(3):
+                chkpnt = create_checkpoint(chkpnt, None, step)
+                chkpnt["channel_values"] = {"count": step, "static": "x"}
+                chkpnt["channel_versions"] = {"count": str(step + 1), "static": "1"}
+                config = await saver.aput(
+                    config,
+                    chkpnt,
+                    {"source": "loop", "step": step},
+                    chkpnt["channel_versions"]
+                    if step == 0
+                    else {"count": str(step + 1)},
+                )
+                await saver.aput_writes(config, [("foo", step)], "task-1")
+                configs.append(config)
+
+            async with saver.conn.execute(
+                "SELECT checkpoint_id FROM shallow_writes"
+            ) as cur:
+                assert sorted(r[0] for r in await cur.fetchall()) == sorted(
+                    c["configurable"]["checkpoint_id"] for c in configs[1:]
+                )
+
+            latest = await saver.aget_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert latest is not None
+            assert latest.config == configs[-1]
+            assert latest.checkpoint["channel_values"] == {"count": 2, "static": "x"}
+            assert latest.pending_writes == [("task-1", "foo", 2)]
+            assert [c.config async for c in saver.alist(None)] == [configs[-1]]
+            assert [m.ts async for m in saver.alist_metadata(None)] == [chkpnt["ts"]]
+
+            await saver.adelete_thread("thread-1")
+            assert await saver.aget_tuple(config) is None
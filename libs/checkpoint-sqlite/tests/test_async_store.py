@@ -495,6 +495,31 @@ async def test_embed_with_path(
         assert results[1].score < 0.9
 
 
+async def test_areindex(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that reindexing only embeds the fields whose text changed."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False)
+    temp_file.close()
+    try:
+        async with create_vector_store(
+            fake_embeddings, temp_file.name, text_fields=["text"]
+        ) as store:
+            for i in range(5):
+                await store.aput(("docs",), str(i), {"text": f"doc {i}"}, index=False)
+            assert await store.areindex(batch_size=2, max_concurrency=2) == 5
+            assert await store.areindex() == 0
+            assert await store.areindex(force=True) == 5
+            results = await store.asearch(("docs",), query="doc 3")
+            assert results[0].key == "3"
+
+        async with create_vector_store(
+            fake_embeddings, temp_file.name, text_fields=["text", "title"]
+        ) as store:
+            await store.aput(("docs",), "0", {"text": "doc 0", "title": "zero"})
+            assert await store.areindex() == 0
+    finally:
+        os.unlink(temp_file.name)
+
+
 async def test_basic_store_ops(
     fake_embeddings: CharacterEmbeddings,
 ) -> None:
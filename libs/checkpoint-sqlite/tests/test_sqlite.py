@@ -1,3 +1,6 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -8,8 +11,10 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.shallow import ShallowSqliteSaver
 from langgraph.checkpoint.sqlite.utils import _metadata_predicate, search_where
 
 
@@ -128,6 +133,308 @@ class TestSqliteSaver:
             assert len(search_results_7) == 1
             assert search_results_7[0].config["configurable"]["thread_id"] == "thread-2"
 
+    def test_list_metadata(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+
+            results = list(saver.list_metadata(None))
+            assert [r.config for r in results] == [r.config for r in saver.list(None)]
+            assert [r.metadata for r in results] == [
+                r.metadata for r in saver.list(None)
+            ]
+
+            filtered = list(saver.list_metadata(None, filter={"source": "input"}))
+            assert len(filtered) == 1
+            assert filtered[0].metadata == self.metadata_1
+            assert filtered[0].ts == self.chkpnt_1["ts"]
+            assert filtered[0].parent_config == self.config_1
+
+            # keyset pagination
+            page_1 = list(
+                saver.list_metadata(
+                    {"configurable": {"thread_id": "thread-2"}}, limit=1
+                )
+            )
+            page_2 = list(
+                saver.list_metadata(
+                    {"configurable": {"thread_id": "thread-2"}},
+                    before=page_1[0].config,
+                    limit=1,
+                )
+            )
+            assert len(page_1) == len(page_2) == 1
+            assert page_1[0].config != page_2[0].config
+
+    def test_channel_values_stored_by_version(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            chkpnt["channel_values"] = {"messages": ["hi"] * 100, "count": 1}
+            chkpnt["channel_versions"] = {"messages": "1", "count": "1"}
+            config = saver.put(config, chkpnt, {}, chkpnt["channel_versions"])
+
+            # only "count" changed, so only its new version is written
+            next_chkpnt = create_checkpoint(chkpnt, None, 1)
+            next_chkpnt["channel_values"] = {"messages": ["hi"] * 100, "count": 2}
+            next_chkpnt["channel_versions"] = {"messages": "1", "count": "2"}
+            saver.put(config, next_chkpnt, {}, {"count": "2"})
+
+            with saver.cursor() as cur:
+                cur.execute("SELECT channel, version FROM checkpoint_blobs")
+                assert sorted(cur.fetchall()) == [
+                    ("count", "1"),
+                    ("count", "2"),
+                    ("messages", "1"),
+                ]
+
+            latest = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert latest is not None
+            assert latest.checkpoint["channel_values"] == {
+                "messages": ["hi"] * 100,
+                "count": 2,
+            }
+            first = saver.get_tuple(config)
+            assert first is not None
+            assert first.checkpoint["channel_values"] == {
+                "messages": ["hi"] * 100,
+                "count": 1,
+            }
+
+            saver.delete_thread("thread-1")
+            with saver.cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM checkpoint_blobs")
+                assert cur.fetchone() == (0,)
+
+    def test_delta_channel_values(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:", max_delta_chain=2) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            configs = []
+            values = [[], ["a"], ["a", "b"], ["a", "b", "c"], ["x"], ["x", "y"]]
+            for i, messages in enumerate(values, 1):
+                chkpnt = create_checkpoint(chkpnt, None, i)
+                chkpnt["channel_values"] = {"messages": messages}
+                chkpnt["channel_versions"] = {"messages": str(i)}
+                config = saver.put(config, chkpnt, {}, chkpnt["channel_versions"])
+                configs.append(config)
+
+            with saver.cursor() as cur:
+                cur.execute(
+                    "SELECT version, type FROM checkpoint_blobs ORDER BY version"
+                )
+                # a full copy after 2 deltas, or when the list was rewritten
+                assert [(v, t.startswith("delta:")) for v, t in cur] == [
+                    ("1", False),
+                    ("2", True),
+                    ("3", True),
+                    ("4", False),
+                    ("5", False),
+                    ("6", True),
+                ]
+
+            for config, messages in zip(configs, values, strict=True):
+                saved = saver.get_tuple(config)
+                assert saved is not None
+                assert saved.checkpoint["channel_values"] == {"messages": messages}
+            assert [
+                c.checkpoint["channel_values"]["messages"] for c in saver.list(None)
+            ] == values[::-1]
+
+    def test_delta_channel_values_mutated_in_place(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:", max_delta_chain=2) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            messages = [{"content": "a"}]
+            chkpnt = create_checkpoint(empty_checkpoint(), None, 1)
+            chkpnt["channel_values"] = {"messages": messages}
+            chkpnt["channel_versions"] = {"messages": "1"}
+            config = saver.put(config, chkpnt, {}, chkpnt["channel_versions"])
+            # the item already written changes along with the append
+            messages[0]["content"] = "b"
+            messages.append({"content": "c"})
+            chkpnt = create_checkpoint(chkpnt, None, 2)
+            chkpnt["channel_values"] = {"messages": messages}
+            chkpnt["channel_versions"] = {"messages": "2"}
+            config = saver.put(config, chkpnt, {}, chkpnt["channel_versions"])
+
+            saved = saver.get_tuple(config)
+            assert saved is not None
+            assert saved.checkpoint["channel_values"] == {
+                "messages": [{"content": "b"}, {"content": "c"}]
+            }
+
+    def test_legacy_inline_channel_values(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "checkpoints.sqlite")
+        # checkpoints written before versioned blobs carry values inline
+        chkpnt = empty_checkpoint()
+        chkpnt["channel_values"] = {"messages": ["hi"], "count": 1}
+        chkpnt["channel_versions"] = {"messages": "1", "count": "1"}
+        with closing(sqlite3.connect(db)) as conn:
+            conn.execute(
+                "CREATE TABLE checkpoints (thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL, parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata BLOB, PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    chkpnt["id"],
+                    None,
+                    *JsonPlusSerializer().dumps_typed(chkpnt),
+                    b"{}",
+                ),
+            )
+            # the application sharing the database uses user_version
+            conn.execute("PRAGMA user_version = 3")
+            conn.commit()
+
+        with SqliteSaver.from_conn_string(db) as saver:
+            config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+            legacy = saver.get_tuple(config)
+            assert legacy is not None
+            assert legacy.checkpoint["channel_values"] == {
+                "messages": ["hi"],
+                "count": 1,
+            }
+            # setup() backfills ts and copies the inline values into blobs
+            assert [m.ts for m in saver.list_metadata(config)] == [chkpnt["ts"]]
+            with saver.cursor() as cur:
+                cur.execute("SELECT channel, version FROM checkpoint_blobs")
+                assert sorted(cur.fetchall()) == [("count", "1"), ("messages", "1")]
+
+            next_chkpnt = create_checkpoint(chkpnt, None, 1)
+            next_chkpnt["channel_values"] = {"messages": ["hi"], "count": 2}
+            next_chkpnt["channel_versions"] = {"messages": "1", "count": "2"}
+            saver.put(legacy.config, next_chkpnt, {}, {"count": "2"})
+            latest = saver.get_tuple(config)
+            assert latest is not None
+            assert latest.checkpoint["channel_values"] == {
+                "messages": ["hi"],
+                "count": 2,
+            }
+
+    def test_readers(self, tmp_path: Path) -> None:
+        db = str(tmp_path / "checkpoints.sqlite")
+        with SqliteSaver.from_conn_string(db, readers=2) as saver:
+            assert saver.readers is not None
+            assert saver.readers.qsize() == 2
+
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saved = saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put_writes(saved, [("foo", "bar")], "task-1")
+
+            # writes are visible from the readers as soon as they are committed
+            tup = saver.get_tuple(saved)
+            assert tup is not None
+            assert tup.checkpoint["id"] == self.chkpnt_2["id"]
+            assert tup.pending_writes == [("task-1", "foo", "bar")]
+            assert len(list(saver.list(None))) == 2
+            assert len(list(saver.list_metadata(None))) == 2
+
+            # readers can't write
+            reader = saver.readers.get()
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM checkpoints")
+            reader.rollback()
+            saver.readers.put(reader)
+
+            # a reader is checked out for the duration of the iteration
+            it = saver.list(None)
+            next(it)
+            assert saver.readers.qsize() == 1
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            assert len(list(it)) == 1
+            assert saver.readers.qsize() == 2
+            assert len(list(saver.list(None))) == 3
+
+    def test_readers_in_memory(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:", readers=2) as saver:
+            assert saver.readers is None
+            saved = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert saver.get_tuple(saved) is not None
+
+    def test_indexed_metadata_keys(self) -> None:
+        with SqliteSaver.from_conn_string(
+            ":memory:", indexed_metadata_keys=["source", "score"]
+        ) as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            assert [c.metadata for c in saver.list(None, filter={"score": 1})] == [
+                self.metadata_1
+            ]
+            with saver.cursor(transaction=False) as cur:
+                for filter, index in [
+                    ({"source": "loop"}, "checkpoints_metadata_source_idx"),
+                    ({"score": 1}, "checkpoints_metadata_score_idx"),
+                ]:
+                    where, param_values = search_where(None, filter)
+                    cur.execute(
+                        f"EXPLAIN QUERY PLAN SELECT checkpoint_id FROM checkpoints {where}",
+                        param_values,
+                    )
+                    assert any(index in row[-1] for row in cur.fetchall())
+
+        with pytest.raises(ValueError):
+            with SqliteSaver.from_conn_string(
+                ":memory:", indexed_metadata_keys=["bad key"]
+            ) as saver:
+                saver.setup()
+
+    def test_shallow(self) -> None:
+        with ShallowSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            configs = []
+            for step in range(3):
+                chkpnt = create_checkpoint(chkpnt, None, step)
+                chkpnt["channel_values"] = {"count": step, "static": "x"}
+                chkpnt["channel_versions"] = {"count": str(step + 1), "static": "1"}
+                config = saver.put(
+                    config,
+                    chkpnt,
+                    {"source": "loop", "step": step},
+                    chkpnt["channel_versions"]
+                    if step == 0
+                    else {"count": str(step + 1)},
+                )
+                saver.put_writes(config, [("foo", step)], "task-1")
+                configs.append(config)
+
+            with saver.cursor(transaction=False) as cur:
+                cur.execute("SELECT COUNT(*) FROM shallow_checkpoints")
+                assert cur.fetchone() == (1,)
+                cur.execute("SELECT COUNT(*) FROM shallow_checkpoint_blobs")
+                assert cur.fetchone() == (2,)
+                # writes are kept for the latest checkpoint and its parent
+                cur.execute("SELECT checkpoint_id FROM shallow_writes")
+                assert sorted(r[0] for r in cur.fetchall()) == sorted(
+                    c["configurable"]["checkpoint_id"] for c in configs[1:]
+                )
+
+            latest = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert latest is not None
+            assert latest.config == configs[-1]
+            assert latest.parent_config == configs[-2]
+            assert latest.checkpoint["channel_values"] == {"count": 2, "static": "x"}
+            assert latest.metadata == {"source": "loop", "step": 2}
+            assert latest.pending_writes == [("task-1", "foo", 2)]
+            assert [c.config for c in saver.list(None)] == [configs[-1]]
+            assert [c.config for c in saver.list(None, filter={"step": 1})] == []
+            assert [m.ts for m in saver.list_metadata(None)] == [chkpnt["ts"]]
+
+            saver.delete_thread("thread-1")
+            assert saver.get_tuple(config) is None
+
     def test_search_where(self) -> None:
         # call method / assertions
         expected_predicate_1 = "WHERE json_extract(CAST(metadata AS TEXT), '$.source') = ? AND json_extract(CAST(metadata AS TEXT), '$.step') = ? AND json_extract(CAST(metadata AS TEXT), '$.writes') = ? AND json_extract(CAST(metadata AS TEXT), '$.score') = ? AND checkpoint_id < ?"
@@ -113,6 +113,7 @@ def create_vector_store(
     text_fields: list[str] | None = None,
     distance_type: str = "cosine",
     conn_type: Literal["memory", "file"] = "memory",
+    quantization: Literal["int8", "binary"] | None = None,
 ) -> Generator[SqliteStore, None, None]:
     """Create a SqliteStore with vector search enabled."""
     index_config: SqliteIndexConfig = {
@@ -120,6 +121,7 @@ def create_vector_store(
         "embed": fake_embeddings,
         "text_fields": text_fields,
         "distance_type": distance_type,  # This is for API consistency but SQLite only supports cosine
+        "quantization": quantization,
     }
     if conn_type == "memory":
         conn_str = ":memory:"
@@ -247,6 +249,29 @@ def test_batch_put_ops(store: SqliteStore) -> None:
     assert item3 is None
 
 
+def test_search_iter(store: SqliteStore) -> None:
+    for i in range(25):
+        store.put(("docs", str(i % 3)), f"key{i:02d}", {"i": i})
+    store.put(("other",), "key", {"i": -1})
+    expected = sorted((("docs", str(i % 3)), f"key{i:02d}") for i in range(25))
+
+    items = list(store.search_iter(("docs",), page_size=4))
+    assert [(item.namespace, item.key) for item in items] == expected
+    items = list(store.search_iter(("docs",), filter={"i": {"$gte": 20}}))
+    assert sorted(item.value["i"] for item in items) == [20, 21, 22, 23, 24]
+
+    assert list(store.list_namespaces_iter(page_size=2)) == [
+        ("docs", "0"),
+        ("docs", "1"),
+        ("docs", "2"),
+        ("other",),
+    ]
+    assert list(store.list_namespaces_iter(max_depth=1, page_size=1)) == [
+        ("docs",),
+        ("other",),
+    ]
+
+
 def test_batch_search_ops(store: SqliteStore) -> None:
     # Setup test data
     test_data = [
@@ -594,6 +619,39 @@ def test_vector_search_with_filters(
         assert results[0].key == "doc3"
 
 
+def test_filter_fields_index(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that filters on the filter fields use their indexes."""
+    index_config: SqliteIndexConfig = {
+        "dims": fake_embeddings.dims,
+        "embed": fake_embeddings,
+        "filter_fields": ["color", "score"],
+    }
+    with SqliteStore.from_conn_string(":memory:", index=index_config) as store:
+        store.setup()
+        for i in range(100):
+            store.put(
+                ("test",),
+                f"doc{i}",
+                {"color": ["red", "green", "blue"][i % 3], "score": i / 10},
+                index=False,
+            )
+
+        results = store.search(("test",), filter={"color": "red"}, limit=100)
+        assert len(results) == 34
+        results = store.search(("test",), filter={"score": {"$gt": 9.5}})
+        assert {r.key for r in results} == {f"doc{i}" for i in range(96, 100)}
+
+        for filter, index in [
+            ({"color": "red"}, "store_filter_color_idx"),
+            ({"score": {"$gte": 4.0}}, "store_filter_score_num_idx"),
+        ]:
+            ((query, params, _),) = store._prepare_batch_search_queries(
+                [(0, SearchOp(("test",), filter=filter))]
+            )[0]
+            plan = store.conn.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+            assert any(index in row[-1] for row in plan), plan
+
+
 @pytest.mark.parametrize("distance_type", VECTOR_TYPES)
 def test_vector_search_pagination(
     fake_embeddings: CharacterEmbeddings,
@@ -817,6 +875,84 @@ def test_scores(
         assert results[0].score == pytest.approx(similarities[0], abs=1e-3)
 
 
+@pytest.mark.parametrize("quantization", ["int8", "binary"])
+def test_quantized_vector_search(
+    fake_embeddings: CharacterEmbeddings, quantization: Literal["int8", "binary"]
+) -> None:
+    """Test that searches on quantized vectors rescore the candidates exactly."""
+    docs = [
+        (f"doc{i}", {"text": "".join(chr(97 + j) for j in range(i + 1))})
+        for i in range(26)
+    ]
+    with create_vector_store(fake_embeddings, text_fields=["text"]) as store:
+        for key, doc in docs:
+            store.put(("test",), key, doc)
+        expected = store.search(("test",), query="abcde", limit=5)
+
+    with create_vector_store(
+        fake_embeddings, text_fields=["text"], quantization=quantization
+    ) as store:
+        for key, doc in docs:
+            store.put(("test",), key, doc)
+        # rescore all the vectors, so that results match the float32 search
+        store.index_config["rescore_multiplier"] = len(docs)
+        results = store.search(("test",), query="abcde", limit=5)
+        assert [(r.key, r.score) for r in results] == [
+            (r.key, pytest.approx(r.score)) for r in expected
+        ]
+        count = store.conn.execute(
+            f"SELECT COUNT(*) FROM store_vectors_{quantization}"
+        ).fetchone()[0]
+        assert count == len(docs)
+
+        # fewer candidates still rank the closest vector first
+        store.index_config["rescore_multiplier"] = 1
+        results = store.search(("test",), query="abcde", limit=5)
+        assert results[0].key == expected[0].key
+
+
+def test_reindex(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test that reindexing only embeds the fields whose text changed."""
+    temp_file = tempfile.NamedTemporaryFile(delete=False)
+    temp_file.close()
+    index_config: SqliteIndexConfig = {
+        "dims": fake_embeddings.dims,
+        "embed": fake_embeddings,
+        "text_fields": ["text"],
+    }
+    query = "SELECT key, field_name FROM store_vectors ORDER BY key, field_name"
+    try:
+        with SqliteStore.from_conn_string(temp_file.name, index=index_config) as store:
+            store.setup()
+            store.put(("docs",), "a", {"text": "apples", "title": "A"})
+            store.put(("docs",), "b", {"text": "bananas", "title": "B"}, index=False)
+            assert store.reindex() == 1
+            assert store.reindex() == 0
+            assert store.reindex(force=True) == 2
+
+        index_config["text_fields"] = ["text", "title"]
+        with SqliteStore.from_conn_string(temp_file.name, index=index_config) as store:
+            store.setup()
+            assert store.reindex(batch_size=1, max_concurrency=2) == 2
+            assert store.conn.execute(query).fetchall() == [
+                ("a", "text"),
+                ("a", "title"),
+                ("b", "text"),
+                ("b", "title"),
+            ]
+
+        index_config["text_fields"] = ["title"]
+        with SqliteStore.from_conn_string(temp_file.name, index=index_config) as store:
+            store.setup()
+            assert store.reindex() == 0
+            assert store.conn.execute(query).fetchall() == [
+                ("a", "title"),
+                ("b", "title"),
+            ]
+    finally:
+        os.unlink(temp_file.name)
+
+
 def test_nonnull_migrations() -> None:
     """Test that all migration statements are non-null."""
     _leading_comment_remover = re.compile(r"^/\*.*?\*/")
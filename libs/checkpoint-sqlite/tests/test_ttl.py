@@ -125,6 +125,23 @@ def test_ttl_sweeper(temp_db_file: str) -> None:
         store.stop_ttl_sweeper()
 
 
+def test_ttl_sweep_batches(temp_db_file: str) -> None:
+    """Test sweeping expired items in batches."""
+    with SqliteStore.from_conn_string(
+        temp_db_file, ttl={"default_ttl": 1 / 60, "sweep_batch_size": 2}
+    ) as store:
+        store.setup()
+
+        for i in range(5):
+            store.put(("test",), f"item{i}", {"value": i})
+        store.put(("test",), "permanent", {"value": -1}, ttl=None)
+
+        time.sleep(2)
+        assert list(store.sweep_ttl_batches()) == [2, 2, 1]
+        assert store.sweep_ttl(batch_size=10) == 0
+        assert [item.key for item in store.search(("test",))] == ["permanent"]
+
+
 @pytest.mark.flaky(retries=3)
 def test_ttl_custom_value(temp_db_file: str) -> None:
     """Test TTL with custom value per item."""
@@ -335,6 +352,24 @@ async def test_async_ttl_sweeper(temp_db_file: str) -> None:
         await store.stop_ttl_sweeper()
 
 
+@pytest.mark.asyncio
+async def test_async_ttl_sweep_batches(temp_db_file: str) -> None:
+    """Test sweeping expired items in batches with async API."""
+    async with AsyncSqliteStore.from_conn_string(
+        temp_db_file, ttl={"default_ttl": 1 / 60}
+    ) as store:
+        await store.setup()
+
+        for i in range(5):
+            await store.aput(("test",), f"item{i}", {"value": i})
+        await store.aput(("test",), "permanent", {"value": -1}, ttl=None)
+
+        await asyncio.sleep(2)
+        assert [n async for n in store.sweep_ttl_batches(batch_size=3)] == [3, 2]
+        assert await store.sweep_ttl() == 0
+        assert [item.key for item in await store.asearch(("test",))] == ["permanent"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.flaky(retries=3)
 async def test_async_search_with_ttl(temp_db_file: str) -> None:
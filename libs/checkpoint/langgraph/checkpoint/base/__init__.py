@@ -108,6 +108,17 @@ class CheckpointTuple(NamedTuple):
     pending_writes: list[PendingWrite] | None = None
 
 
+class CheckpointMetadataTuple(NamedTuple):
+    """A lightweight view of a checkpoint, without channel values or pending writes."""
+
+    config: RunnableConfig
+    metadata: CheckpointMetadata
+    parent_config: RunnableConfig | None = None
+    ts: str | None = None
+    """The timestamp of the checkpoint, if the saver can provide it without
+    loading the channel values."""
+
+
 class BaseCheckpointSaver(Generic[V]):
     """Base class for creating a graph checkpointer.
 
@@ -190,6 +201,37 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints that match the given criteria.
+
+        Unlike `list`, this does not load channel values or pending writes.
+        Checkpoints are returned newest first, so the `config` of the last item
+        can be passed as `before` to fetch the next page.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: List checkpoints created before this configuration.
+            limit: Maximum number of checkpoints to return.
+
+        Returns:
+            Iterator of matching checkpoint metadata tuples.
+        """
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield CheckpointMetadataTuple(
+                item.config,
+                item.metadata,
+                item.parent_config,
+                item.checkpoint.get("ts"),
+            )
+
     def put(
         self,
         config: RunnableConfig,
@@ -295,6 +337,37 @@ class BaseCheckpointSaver(Generic[V]):
         raise NotImplementedError
         yield
 
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """Asynchronously list the metadata of checkpoints that match the given criteria.
+
+        Unlike `alist`, this does not load channel values or pending writes.
+        Checkpoints are returned newest first, so the `config` of the last item
+        can be passed as `before` to fetch the next page.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: List checkpoints created before this configuration.
+            limit: Maximum number of checkpoints to return.
+
+        Returns:
+            Async iterator of matching checkpoint metadata tuples.
+        """
+        async for item in self.alist(config, filter=filter, before=before, limit=limit):
+            yield CheckpointMetadataTuple(
+                item.config,
+                item.metadata,
+                item.parent_config,
+                item.checkpoint.get("ts"),
+            )
+
     async def aput(
         self,
         config: RunnableConfig,
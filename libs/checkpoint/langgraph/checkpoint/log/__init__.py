@@ -0,0 +1,761 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, cast
+
+import ormsgpack
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    SerializerProtocol,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.base import BufferedSerializerProtocol
+from langgraph.checkpoint.serde.lazy import loads_typed_lazy
+
+logger = logging.getLogger(__name__)
+
+# crc32, record kind, sequence number, metadata length, data length
+HEADER = struct.Struct("<IBQII")
+
+RECORD_CHECKPOINT = 1
+RECORD_WRITES = 2
+RECORD_DELETE_THREAD = 3
+
+SEGMENT_SUFFIX = ".log"
+
+
+class _Segment:
+    """An append-only segment file, mapped into memory for reads."""
+
+    __slots__ = ("id", "path", "file", "mm", "view", "size", "dead")
+
+    def __init__(self, id: int, path: Path, capacity: int, size: int = 0) -> None:
+        self.id = id
+        self.path = path
+        self.file = open(path, "r+b" if path.exists() else "w+b", buffering=0)
+        # bytes past the last record are always zeroed, so a torn write can never
+        # be followed by a stale record when the log is replayed
+        self.file.truncate(size)
+        self.file.truncate(max(capacity, size, 1))
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mm)
+        # offset of the end of the last record
+        self.size = size
+        # bytes of values that were superseded or deleted since they were written
+        self.dead = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.mm)
+
+    def seal(self) -> None:
+        """Flush the segment to disk and close its file. The memory map stays
+        valid for the values already indexed, so the space reserved after the
+        last record is only released once the segment is closed."""
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+    def close(self) -> bool:
+        """Close the file and unmap the segment. Returns False if the map is
+        still referenced by values handed out to callers, in which case it is
+        released once they are garbage collected."""
+        if not self.file.closed:
+            self.file.close()
+        self.view.release()
+        try:
+            self.mm.close()
+        except BufferError:
+            return False
+        return True
+
+
+class LogSaver(InMemorySaver):
+    """A checkpoint saver that persists checkpoints to append-only segment files.
+
+    Every `put`, `put_writes` and `delete_thread` call appends a single
+    checksummed record to the active segment file. The segments are replayed on
+    startup to rebuild an in-memory index, which holds zero-copy views into the
+    memory-mapped segments rather than copies of the serialized values, so
+    reads never touch the filesystem. With a serializer that supports it, large
+    numpy arrays in channel values are stored next to the value as raw buffers,
+    and read back as arrays backed by the memory map.
+
+    When `fsync` is enabled, writes only return once they are durable on disk.
+    Concurrent writers share a single `fsync` call (group commit), so durable
+    throughput grows with the number of writers. Segments are rotated once they
+    reach `segment_size`, and sealed segments that are mostly made of deleted or
+    superseded values are rewritten in the background by copying their live
+    records to the active segment.
+
+    Note:
+        A log directory must only be opened by a single `LogSaver` at a time.
+
+    Args:
+        path: The directory holding the segment files. It is created if needed.
+        serde: The serializer to use for serializing and deserializing checkpoints.
+        segment_size: The size in bytes at which the active segment is rotated.
+        fsync: Whether writes wait until they are flushed to disk.
+        compaction_interval: Seconds between background compaction runs, or None
+            to only compact when `compact` is called.
+        compaction_threshold: The fraction of dead bytes above which a sealed
+            segment is compacted.
+
+    Examples:
+
+            from langgraph.checkpoint.log import LogSaver
+            from langgraph.graph import StateGraph
+
+            builder = StateGraph(int)
+            builder.add_node("add_one", lambda x: x + 1)
+            builder.set_entry_point("add_one")
+            builder.set_finish_point("add_one")
+
+            with LogSaver("checkpoints") as checkpointer:
+                graph = builder.compile(checkpointer=checkpointer)
+                graph.invoke(1, {"configurable": {"thread_id": "thread-1"}})
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        serde: SerializerProtocol | None = None,
+        segment_size: int = 64 * 1024 * 1024,
+        fsync: bool = True,
+        compaction_interval: float | None = 60.0,
+        compaction_threshold: float = 0.5,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.fsync = fsync
+        self.compaction_threshold = compaction_threshold
+        self.lock = threading.Lock()
+        # index key -> (segment ID, offset, length) of the value in the log
+        self.locations: dict[tuple, tuple[int, int, int]] = {}
+        self.segments: dict[int, _Segment] = {}
+        self.seq = 0
+        self.is_closed = False
+        # whether channel values can keep large arrays out of band
+        self.is_buffered = isinstance(self.serde, BufferedSerializerProtocol)
+        self._load()
+        # group commit
+        self.synced = self.seq
+        self.syncing = False
+        self.commit = threading.Condition()
+        # background compaction
+        self.stopped = threading.Event()
+        self.compactor: threading.Thread | None = None
+        if compaction_interval is not None:
+            self.compactor = threading.Thread(
+                target=self._compact_loop,
+                args=(compaction_interval,),
+                name="LogSaver-compactor",
+                daemon=True,
+            )
+            self.compactor.start()
+        self.stack.callback(self.close)
+
+    def __enter__(self) -> LogSaver:
+        self.stack.__enter__()
+        return self
+
+    async def __aenter__(self) -> LogSaver:
+        self.stack.__enter__()
+        return self
+
+    # --- replay ---
+
+    def _load(self) -> None:
+        ids = sorted(
+            int(p.stem)
+            for p in self.path.glob(f"*{SEGMENT_SUFFIX}")
+            if p.stem.isdigit()
+        )
+        seqs: dict[tuple, int] = {}
+        deleted: dict[str, int] = {}
+        for id in ids:
+            path = self._segment_path(id)
+            size = path.stat().st_size
+            # the last segment is mapped with room to append further records
+            capacity = max(self.segment_size, size) if id == ids[-1] else size
+            segment = _Segment(id, path, capacity, size)
+            self.segments[id] = segment
+            end = 0
+            for kind, seq, meta, data_offset, record_end in self._records(segment):
+                self.seq = max(self.seq, seq)
+                self._apply(segment, kind, seq, meta, data_offset, seqs, deleted)
+                end = record_end
+            if end + HEADER.size <= segment.size and any(
+                segment.view[end : end + HEADER.size]
+            ):
+                logger.warning(
+                    "Ignoring a torn or corrupted record at offset %d of %s",
+                    end,
+                    path,
+                )
+            if id == ids[-1]:
+                # zero any torn write, so it can't be mistaken for a record once
+                # new records are appended after it
+                segment.file.seek(end)
+                zeros = memoryview(bytes(segment.size - end))
+                while zeros:
+                    zeros = zeros[segment.file.write(zeros) :]
+            else:
+                segment.file.close()
+            segment.size = end
+        if not ids:
+            self.segments[1] = _Segment(1, self._segment_path(1), self.segment_size)
+        self.active = self.segments[max(self.segments)]
+
+    def _segment_path(self, id: int) -> Path:
+        return self.path / f"{id:012d}{SEGMENT_SUFFIX}"
+
+    def _records(self, segment: _Segment) -> Iterator[tuple[int, int, Any, int, int]]:
+        """Yield (kind, seq, meta, data offset, end offset) for each valid record
+        of a segment, stopping at the first incomplete or corrupted record."""
+        view = segment.view
+        offset = 0
+        while offset + HEADER.size <= segment.size:
+            crc, kind, seq, meta_len, data_len = HEADER.unpack_from(view, offset)
+            data_offset = offset + HEADER.size + meta_len
+            end = data_offset + data_len
+            if kind == 0 or end > segment.size:
+                return
+            if zlib.crc32(view[offset + 4 : end]) != crc:
+                return
+            yield (
+                kind,
+                seq,
+                ormsgpack.unpackb(view[offset + HEADER.size : data_offset]),
+                data_offset,
+                end,
+            )
+            offset = end
+
+    # --- index ---
+
+    def _value(
+        self, segment: _Segment, offset: int, length: int, type_: str
+    ) -> tuple[str, bytes]:
+        if type_ == "msgpack":
+            # zero-copy, msgpack can be decoded straight from the memory map
+            return type_, cast(bytes, segment.view[offset : offset + length])
+        return type_, bytes(segment.view[offset : offset + length])
+
+    def _relocate(
+        self,
+        key: tuple,
+        location: tuple[int, int, int],
+        seq: int,
+        seqs: dict[tuple, int] | None,
+        deleted: dict[str, int] | None,
+    ) -> bool:
+        """Point an index key to a new location, unless the log already holds a
+        newer value for it. Returns whether the index should be updated."""
+        if seqs is not None and deleted is not None:
+            # records can be replayed out of order once they have been compacted
+            if seq < deleted.get(key[1], -1) or seq < seqs.get(key, -1):
+                return False
+            seqs[key] = seq
+        if (previous := self.locations.get(key)) and (
+            segment := self.segments.get(previous[0])
+        ):
+            segment.dead += previous[2]
+        self.locations[key] = location
+        return True
+
+    def _apply(
+        self,
+        segment: _Segment,
+        kind: int,
+        seq: int,
+        meta: Any,
+        offset: int,
+        seqs: dict[tuple, int] | None = None,
+        deleted: dict[str, int] | None = None,
+    ) -> None:
+        if kind == RECORD_CHECKPOINT:
+            thread_id, checkpoint_ns, saved, blobs = meta
+            if saved is not None:
+                checkpoint_id, parent_id, c_type, c_len, m_type, m_len = saved
+                key = ("c", thread_id, checkpoint_ns, checkpoint_id)
+                location = (segment.id, offset, c_len + m_len)
+                if self._relocate(key, location, seq, seqs, deleted):
+                    checkpoints = self.storage[thread_id][checkpoint_ns]
+                    ids = self.checkpoint_ids.get((thread_id, checkpoint_ns))
+                    if ids is not None and checkpoint_id not in checkpoints:
+                        bisect.insort(ids, checkpoint_id)
+                    checkpoints[checkpoint_id] = (
+                        self._value(segment, offset, c_len, c_type),
+                        self._value(segment, offset + c_len, m_len, m_type),
+                        parent_id,
+                    )
+                offset += c_len + m_len
+            for channel, version, type_, length, *buffers in blobs:
+                key = ("b", thread_id, checkpoint_ns, channel, version)
+                # out-of-band buffers are stored right after the value
+                sizes = buffers[0] if buffers else ()
+                location = (segment.id, offset, length + sum(sizes))
+                if self._relocate(key, location, seq, seqs, deleted):
+                    value: tuple = self._value(segment, offset, length, type_)
+                    if sizes:
+                        views, start = [], offset + length
+                        for size in sizes:
+                            views.append(segment.view[start : start + size])
+                            start += size
+                        value = (*value, views)
+                    self.blobs[key[1:]] = value
+                offset += location[2]
+        elif kind == RECORD_WRITES:
+            thread_id, checkpoint_ns, checkpoint_id, writes = meta
+            outer_key = (thread_id, checkpoint_ns, checkpoint_id)
+            for task_id, idx, channel, type_, length, task_path in writes:
+                key = ("w", *outer_key, task_id, idx)
+                location = (segment.id, offset, length)
+                if self._relocate(key, location, seq, seqs, deleted):
+                    self.writes[outer_key][(task_id, idx)] = (
+                        task_id,
+                        channel,
+                        self._value(segment, offset, length, type_),
+                        task_path,
+                    )
+                offset += length
+        elif kind == RECORD_DELETE_THREAD:
+            (thread_id,) = meta
+            if deleted is not None:
+                deleted[thread_id] = max(deleted.get(thread_id, -1), seq)
+            self._drop_thread(thread_id, seq if seqs is not None else None, seqs)
+
+    def _drop_thread(
+        self, thread_id: str, seq: int | None, seqs: dict[tuple, int] | None
+    ) -> None:
+        """Remove the values of a thread from the index, only those written before
+        `seq` if given."""
+        for key in [k for k in self.locations if k[1] == thread_id]:
+            if seq is not None and seqs is not None and seqs.get(key, -1) > seq:
+                continue
+            location = self.locations.pop(key)
+            if segment := self.segments.get(location[0]):
+                segment.dead += location[2]
+            if key[0] == "c":
+                _, _, checkpoint_ns, checkpoint_id = key
+                checkpoints = self.storage[thread_id][checkpoint_ns]
+                checkpoints.pop(checkpoint_id, None)
+                if not checkpoints:
+                    del self.storage[thread_id][checkpoint_ns]
+            elif key[0] == "b":
+                self.blobs.pop(key[1:], None)
+            else:
+                outer_key = key[1:4]
+                if writes := self.writes.get(outer_key):
+                    writes.pop(key[4:], None)
+                    if not writes:
+                        del self.writes[outer_key]
+        if thread_id in self.storage and not self.storage[thread_id]:
+            del self.storage[thread_id]
+        for key in list(self.checkpoint_ids):
+            if key[0] == thread_id:
+                del self.checkpoint_ids[key]
+
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        channel_values: dict[str, Any] = {}
+        for k, v in versions.items():
+            vv = self.blobs.get((thread_id, checkpoint_ns, k, v))
+            if vv is None or vv[0] == "empty":
+                continue
+            elif len(vv) > 2:
+                serde = cast(BufferedSerializerProtocol, self.serde)
+                channel_values[k] = serde.loads_typed_buffers(vv[:2], vv[2])
+            else:
+                channel_values[k] = loads_typed_lazy(self.serde, vv)
+        return channel_values
+
+    # --- writing ---
+
+    def _append(
+        self,
+        kind: int,
+        meta: Any,
+        chunks: Sequence[bytes | memoryview],
+        seq: int | None = None,
+    ) -> tuple[int, _Segment, int]:
+        """Append a record to the active segment, rotating it if full. Must be
+        called with the lock held. Returns (seq, segment, data offset)."""
+        if self.is_closed:
+            raise RuntimeError("Cannot write to a closed LogSaver")
+        if seq is None:
+            self.seq += 1
+            seq = self.seq
+        meta_bytes = ormsgpack.packb(meta)
+        data_len = sum(len(c) for c in chunks)
+        header = bytearray(HEADER.pack(0, kind, seq, len(meta_bytes), data_len))
+        crc = zlib.crc32(memoryview(header)[4:])
+        crc = zlib.crc32(meta_bytes, crc)
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc)
+        struct.pack_into("<I", header, 0, crc)
+        record_len = len(header) + len(meta_bytes) + data_len
+        segment = self.active
+        if segment.size + record_len > segment.capacity:
+            segment = self._rotate(record_len)
+        offset = segment.size
+        segment.file.seek(offset)
+        record = memoryview(b"".join((header, meta_bytes, *chunks)))
+        while record:
+            record = record[segment.file.write(record) :]
+        segment.size += record_len
+        return seq, segment, offset + len(header) + len(meta_bytes)
+
+    def _rotate(self, record_len: int) -> _Segment:
+        self.active.seal()
+        id = self.active.id + 1
+        self.active = self.segments[id] = _Segment(
+            id, self._segment_path(id), max(self.segment_size, record_len)
+        )
+        return self.active
+
+    def _sync(self, seq: int) -> None:
+        """Wait until the record `seq` is on disk. Concurrent callers are served
+        by a single fsync, issued by whichever caller arrives first."""
+        if not self.fsync:
+            return
+        with self.commit:
+            while self.synced < seq:
+                if self.syncing:
+                    self.commit.wait()
+                    continue
+                self.syncing = True
+                self.commit.release()
+                try:
+                    with self.lock:
+                        # sealed segments are synced on rotation, so flushing
+                        # the active one covers every record up to `target`
+                        fd = os.dup(self.active.file.fileno())
+                        target = self.seq
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                finally:
+                    self.commit.acquire()
+                    self.syncing = False
+                    self.commit.notify_all()
+                self.synced = max(self.synced, target)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to the log.
+
+        The checkpoint, its metadata and the new channel values are appended as a
+        single record, so they are persisted atomically.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New versions as of this write
+
+        Returns:
+            RunnableConfig: The updated config containing the saved checkpoint's timestamp.
+        """
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        c_type, c_bytes = self.serde.dumps_typed(c)
+        m_type, m_bytes = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        blobs: list[tuple[str, Any, str, bytes, list[memoryview]]] = []
+        for k, v in new_versions.items():
+            if k not in values:
+                blobs.append((k, v, "empty", b"", []))
+            elif self.is_buffered:
+                (type_, data), buffers = self.serde.dumps_typed_buffers(values[k])  # type: ignore[attr-defined]
+                blobs.append((k, v, type_, data, buffers))
+            else:
+                blobs.append((k, v, *self.serde.dumps_typed(values[k]), []))
+        meta = [
+            thread_id,
+            checkpoint_ns,
+            [
+                checkpoint["id"],
+                config["configurable"].get("checkpoint_id"),  # parent
+                c_type,
+                len(c_bytes),
+                m_type,
+                len(m_bytes),
+            ],
+            [
+                [k, v, type_, len(data)]
+                + ([[b.nbytes for b in buffers]] if buffers else [])
+                for k, v, type_, data, buffers in blobs
+            ],
+        ]
+        chunks: list[bytes | memoryview] = [c_bytes, m_bytes]
+        for *_, data, buffers in blobs:
+            chunks.append(data)
+            chunks.extend(buffers)
+        with self.lock:
+            seq, segment, offset = self._append(RECORD_CHECKPOINT, meta, chunks)
+            self._apply(segment, RECORD_CHECKPOINT, seq, meta, offset)
+        self._sync(seq)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save a list of writes to the log.
+
+        Args:
+            config: The config to associate with the writes.
+            writes: The writes to save.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        outer_key = (thread_id, checkpoint_ns, checkpoint_id)
+        serialized = [
+            (WRITES_IDX_MAP.get(c, idx), c, *self.serde.dumps_typed(v))
+            for idx, (c, v) in enumerate(writes)
+        ]
+        with self.lock:
+            outer_writes_ = self.writes.get(outer_key)
+            serialized = [
+                (idx, c, type_, data)
+                for idx, c, type_, data in serialized
+                if idx < 0 or not outer_writes_ or (task_id, idx) not in outer_writes_
+            ]
+            if not serialized:
+                return
+            meta = [
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                [
+                    [task_id, idx, c, type_, len(data), task_path]
+                    for idx, c, type_, data in serialized
+                ],
+            ]
+            seq, segment, offset = self._append(
+                RECORD_WRITES, meta, [data for *_, data in serialized]
+            )
+            self._apply(segment, RECORD_WRITES, seq, meta, offset)
+        self._sync(seq)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes associated with a thread ID.
+
+        The space is reclaimed once the segments holding the thread are compacted.
+
+        Args:
+            thread_id: The thread ID to delete.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            seq, segment, offset = self._append(RECORD_DELETE_THREAD, [thread_id], [])
+            self._apply(segment, RECORD_DELETE_THREAD, seq, [thread_id], offset)
+        self._sync(seq)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Asynchronous version of `put`, run in a thread to not block on fsync.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New versions as of this write
+
+        Returns:
+            RunnableConfig: The updated config containing the saved checkpoint's timestamp.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Asynchronous version of `put_writes`, run in a thread to not block on fsync.
+
+        Args:
+            config: The config to associate with the writes.
+            writes: The writes to save, each as a (channel, value) pair.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.put_writes, config, writes, task_id, task_path
+        )
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronous version of `delete_thread`, run in a thread to not block on fsync.
+
+        Args:
+            thread_id: The thread ID to delete.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.delete_thread, thread_id
+        )
+
+    # --- compaction ---
+
+    def compact(self, threshold: float | None = None) -> int:
+        """Rewrite the live records of sealed segments with a large share of dead
+        bytes to the active segment, and remove the old segment files.
+
+        Args:
+            threshold: The fraction of dead bytes above which a segment is
+                compacted. Defaults to `compaction_threshold`.
+
+        Returns:
+            The number of segment files removed.
+        """
+        if threshold is None:
+            threshold = self.compaction_threshold
+        with self.lock:
+            candidates = [
+                segment
+                for segment in self.segments.values()
+                if segment is not self.active
+                and segment.dead >= segment.size * threshold
+            ]
+        for segment in sorted(candidates, key=lambda s: s.id):
+            self._compact_segment(segment)
+        if candidates:
+            with self.lock:
+                os.fsync(self.active.file.fileno())
+                for segment in candidates:
+                    del self.segments[segment.id]
+                    # values still referenced by readers stay mapped until released
+                    segment.close()
+                    segment.path.unlink()
+        return len(candidates)
+
+    def _compact_segment(self, segment: _Segment) -> None:
+        view = segment.view
+        for kind, seq, meta, offset, _ in self._records(segment):
+            with self.lock:
+                if kind == RECORD_CHECKPOINT:
+                    thread_id, checkpoint_ns, saved, blobs = meta
+                    live_saved, live_blobs, chunks = None, [], []
+                    if saved is not None:
+                        length = saved[3] + saved[5]
+                        key = ("c", thread_id, checkpoint_ns, saved[0])
+                        if self.locations.get(key) == (segment.id, offset, length):
+                            live_saved = saved
+                            chunks.append(view[offset : offset + length])
+                        offset += length
+                    for blob in blobs:
+                        length = blob[3] + sum(blob[4] if len(blob) > 4 else ())
+                        key = ("b", thread_id, checkpoint_ns, blob[0], blob[1])
+                        if self.locations.get(key) == (segment.id, offset, length):
+                            live_blobs.append(blob)
+                            chunks.append(view[offset : offset + length])
+                        offset += length
+                    if live_saved is None and not live_blobs:
+                        continue
+                    meta = [thread_id, checkpoint_ns, live_saved, live_blobs]
+                elif kind == RECORD_WRITES:
+                    thread_id, checkpoint_ns, checkpoint_id, writes = meta
+                    live_writes, chunks = [], []
+                    for write in writes:
+                        length = write[4]
+                        key = ("w", thread_id, checkpoint_ns, checkpoint_id, *write[:2])
+                        if self.locations.get(key) == (segment.id, offset, length):
+                            live_writes.append(write)
+                            chunks.append(view[offset : offset + length])
+                        offset += length
+                    if not live_writes:
+                        continue
+                    meta = [thread_id, checkpoint_ns, checkpoint_id, live_writes]
+                elif kind == RECORD_DELETE_THREAD:
+                    # deletions only matter while older segments may be replayed
+                    if segment.id != min(self.segments):
+                        self._append(kind, meta, [], seq)
+                    continue
+                else:
+                    continue
+                # keep the original sequence number, so replay order is preserved
+                _, new_segment, new_offset = self._append(kind, meta, chunks, seq)
+                self._apply(new_segment, kind, seq, meta, new_offset)
+
+    def _compact_loop(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Failed to compact %s", self.path)
+
+    def close(self) -> None:
+        """Stop background compaction, flush the active segment to disk, and
+        unmap the segments."""
+        if self.is_closed:
+            return
+        self.stopped.set()
+        if self.compactor is not None:
+            self.compactor.join()
+        with self.lock:
+            self.is_closed = True
+            self.active.seal()
+            # the index holds views into the segments, which keep them mapped
+            self.storage.clear()
+            self.writes.clear()
+            self.blobs.clear()
+            self.checkpoint_ids.clear()
+            self.locations.clear()
+            for segment in self.segments.values():
+                # space reserved for appends can only be released once unmapped
+                if segment.close():
+                    os.truncate(segment.path, segment.size)
+
+
+__all__ = ["LogSaver"]
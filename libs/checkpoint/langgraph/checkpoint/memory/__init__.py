@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import bisect
+import heapq
+import itertools
 import logging
 import os
 import pickle
@@ -19,11 +22,13 @@ from langgraph.checkpoint.base import (
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
+    CheckpointMetadataTuple,
     CheckpointTuple,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.serde.lazy import loads_typed_lazy
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +94,8 @@ class InMemorySaver(
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
         self.blobs = factory()
+        # (thread ID, checkpoint NS) -> sorted checkpoint IDs
+        self.checkpoint_ids: dict[tuple[str, str], list[str]] = {}
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
@@ -126,7 +133,7 @@ class InMemorySaver(
             if kk in self.blobs:
                 vv = self.blobs[kk]
                 if vv[0] != "empty":
-                    channel_values[k] = self.serde.loads_typed(vv)
+                    channel_values[k] = loads_typed_lazy(self.serde, vv)
         return channel_values
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
@@ -233,92 +240,194 @@ class InMemorySaver(
         Yields:
             An iterator of matching checkpoint tuples.
         """
+        for (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            (checkpoint, _, parent_checkpoint_id),
+            metadata,
+        ) in self._search(config, filter=filter, before=before, limit=limit):
+            writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+
+            checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
+
+            yield CheckpointTuple(
+                config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                checkpoint={
+                    **checkpoint_,
+                    "channel_values": self._load_blobs(
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_["channel_versions"],
+                    ),
+                },
+                metadata=metadata,
+                parent_config=(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": parent_checkpoint_id,
+                        }
+                    }
+                    if parent_checkpoint_id
+                    else None
+                ),
+                pending_writes=[
+                    (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
+                ],
+            )
+
+    def list_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointMetadataTuple]:
+        """List the metadata of checkpoints from the in-memory storage.
+
+        Channel values and pending writes are never loaded. Checkpoints are ordered
+        by checkpoint ID in descending order, so the `config` of the last item can
+        be passed as `before` to fetch the next page.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: List checkpoints created before this configuration.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            An iterator of matching checkpoint metadata tuples.
+        """
+        for (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            (checkpoint, _, parent_checkpoint_id),
+            metadata,
+        ) in self._search(
+            config, filter=filter, before=before, limit=limit, merge=True
+        ):
+            yield CheckpointMetadataTuple(
+                config={
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+                metadata=metadata,
+                parent_config=(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": parent_checkpoint_id,
+                        }
+                    }
+                    if parent_checkpoint_id
+                    else None
+                ),
+                # channel values are stored as separate blobs, so this is cheap
+                ts=self.serde.loads_typed(checkpoint).get("ts"),
+            )
+
+    def _search(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+        merge: bool = False,
+    ) -> Iterator[
+        tuple[
+            str,
+            str,
+            str,
+            tuple[tuple[str, bytes], tuple[str, bytes], str | None],
+            CheckpointMetadata,
+        ]
+    ]:
+        """Yield (thread ID, checkpoint NS, checkpoint ID, saved entry, metadata)
+        for each stored checkpoint matching the criteria, newest first within each
+        namespace. With `merge`, namespaces are merged in checkpoint ID order, so
+        that the config of the last result can be used as a `before` cursor."""
         thread_ids = (config["configurable"]["thread_id"],) if config else self.storage
         config_checkpoint_ns = (
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
-        for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
-                if (
-                    config_checkpoint_ns is not None
-                    and checkpoint_ns != config_checkpoint_ns
-                ):
-                    continue
-
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
-                    # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
-                        continue
-
-                    # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
-                        continue
-
-                    # filter by metadata
-                    metadata = self.serde.loads_typed(metadata_b)
-                    if filter and not all(
-                        query_value == metadata.get(query_key)
-                        for query_key, query_value in filter.items()
-                    ):
-                        continue
-
-                    # limit search results
-                    if limit is not None and limit <= 0:
-                        break
-                    elif limit is not None:
-                        limit -= 1
-
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
-                    checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
-
-                    yield CheckpointTuple(
-                        config={
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": checkpoint_id,
-                            }
-                        },
-                        checkpoint={
-                            **checkpoint_,
-                            "channel_values": self._load_blobs(
-                                thread_id,
-                                checkpoint_ns,
-                                checkpoint_["channel_versions"],
-                            ),
-                        },
-                        metadata=metadata,
-                        parent_config=(
-                            {
-                                "configurable": {
-                                    "thread_id": thread_id,
-                                    "checkpoint_ns": checkpoint_ns,
-                                    "checkpoint_id": parent_checkpoint_id,
-                                }
-                            }
-                            if parent_checkpoint_id
-                            else None
-                        ),
-                        pending_writes=[
-                            (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                        ],
-                    )
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        namespaces = [
+            self._search_namespace(
+                thread_id,
+                checkpoint_ns,
+                config_checkpoint_id,
+                before_checkpoint_id,
+            )
+            for thread_id in thread_ids
+            for checkpoint_ns in self.storage[thread_id]
+            if config_checkpoint_ns is None or checkpoint_ns == config_checkpoint_ns
+        ]
+        for checkpoint_id, thread_id, checkpoint_ns, saved in (
+            heapq.merge(*namespaces, key=lambda x: x[0], reverse=True)
+            if merge
+            else itertools.chain.from_iterable(namespaces)
+        ):
+            # filter by metadata
+            metadata = self.serde.loads_typed(saved[1])
+            if filter and not all(
+                query_value == metadata.get(query_key)
+                for query_key, query_value in filter.items()
+            ):
+                continue
+
+            # limit search results
+            if limit is not None and limit <= 0:
+                return
+            elif limit is not None:
+                limit -= 1
+
+            yield thread_id, checkpoint_ns, checkpoint_id, saved, metadata
+
+    def _search_namespace(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str | None,
+        before_checkpoint_id: str | None,
+    ) -> Iterator[
+        tuple[str, str, str, tuple[tuple[str, bytes], tuple[str, bytes], str | None]]
+    ]:
+        """Lazily yield the checkpoints of a namespace, newest first."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if checkpoint_id:
+            if (saved := checkpoints.get(checkpoint_id)) and (
+                not before_checkpoint_id or checkpoint_id < before_checkpoint_id
+            ):
+                yield checkpoint_id, thread_id, checkpoint_ns, saved
+            return
+        ids = self.checkpoint_ids.get((thread_id, checkpoint_ns))
+        # invalidated by put and delete_thread
+        if ids is None:
+            ids = self.checkpoint_ids[(thread_id, checkpoint_ns)] = sorted(checkpoints)
+        end = (
+            bisect.bisect_left(ids, before_checkpoint_id)
+            if before_checkpoint_id
+            else len(ids)
+        )
+        for idx in range(end - 1, -1, -1):
+            if saved := checkpoints.get(ids[idx]):
+                yield ids[idx], thread_id, checkpoint_ns, saved
 
     def put(
         self,
@@ -349,6 +458,7 @@ class InMemorySaver(
             self.blobs[(thread_id, checkpoint_ns, k, v)] = (
                 self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
             )
+        self.checkpoint_ids.pop((thread_id, checkpoint_ns), None)
         self.storage[thread_id][checkpoint_ns].update(
             {
                 checkpoint["id"]: (
@@ -415,6 +525,9 @@ class InMemorySaver(
         """
         if thread_id in self.storage:
             del self.storage[thread_id]
+        for key in list(self.checkpoint_ids):
+            if key[0] == thread_id:
+                del self.checkpoint_ids[key]
         for k in list(self.writes.keys()):
             if k[0] == thread_id:
                 del self.writes[k]
@@ -458,6 +571,27 @@ class InMemorySaver(
         for item in self.list(config, filter=filter, before=before, limit=limit):
             yield item
 
+    async def alist_metadata(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointMetadataTuple]:
+        """Asynchronous version of `list_metadata`.
+
+        Args:
+            config: The config to use for listing the checkpoints.
+
+        Yields:
+            An asynchronous iterator of checkpoint metadata tuples.
+        """
+        for item in self.list_metadata(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
     async def aput(
         self,
         config: RunnableConfig,
@@ -524,6 +658,68 @@ class InMemorySaver(
         return f"{next_v:032}.{next_h:016}"
 
 
+class ShallowInMemorySaver(InMemorySaver):
+    """An in-memory checkpoint saver that ONLY keeps the most recent checkpoint of
+    each thread.
+
+    Each put() replaces the previous checkpoint of the namespace, and drops the
+    blobs and writes it superseded, so memory grows with the number of threads
+    rather than the number of steps. It supports most of the LangGraph persistence
+    functionality with the exception of time travel.
+
+    Examples:
+
+            from langgraph.checkpoint.memory import ShallowInMemorySaver
+            from langgraph.graph import StateGraph
+
+            builder = StateGraph(int)
+            builder.add_node("add_one", lambda x: x + 1)
+            builder.set_entry_point("add_one")
+            builder.set_finish_point("add_one")
+
+            memory = ShallowInMemorySaver()
+            graph = builder.compile(checkpointer=memory)
+            graph.invoke(1, {"configurable": {"thread_id": "thread-1"}})
+    """
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to the in-memory storage, replacing the previous one.
+
+        Writes are kept only for the new checkpoint and its parent.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New versions as of this write
+
+        Returns:
+            RunnableConfig: The updated config containing the saved checkpoint's timestamp.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        keep = {checkpoint["id"], config["configurable"].get("checkpoint_id")}
+        previous = self.storage[thread_id][checkpoint_ns]
+        self.storage[thread_id][checkpoint_ns] = {}
+        self.checkpoint_ids.pop((thread_id, checkpoint_ns), None)
+        for checkpoint_id, (saved, _, parent_checkpoint_id) in previous.items():
+            # drop blobs of the channel versions this checkpoint replaces
+            versions = self.serde.loads_typed(saved)["channel_versions"]
+            for k, v in new_versions.items():
+                if (old := versions.get(k)) is not None and old != v:
+                    self.blobs.pop((thread_id, checkpoint_ns, k, old), None)
+            for superseded in {checkpoint_id, parent_checkpoint_id} - keep:
+                if superseded is not None:
+                    self.writes.pop((thread_id, checkpoint_ns, superseded), None)
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
 MemorySaver = InMemorySaver  # Kept for backwards compatibility
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -28,6 +29,29 @@ class SerializerProtocol(Protocol):
     def loads_typed(self, data: tuple[str, bytes]) -> Any: ...
 
 
+@runtime_checkable
+class BufferedSerializerProtocol(SerializerProtocol, Protocol):
+    """Protocol for serializers that can keep large buffers out of band.
+
+    Similar to pickle protocol 5, large contiguous buffers (eg. numpy arrays) are
+    returned separately from the serialized payload, which only references them,
+    so that they can be stored as is and read back without copies.
+
+    - `dumps_typed_buffers`: Serialize an object to a tuple `(type, bytes)` and
+        a list of out-of-band buffers.
+    - `loads_typed_buffers`: Deserialize an object from a tuple `(type, bytes)`
+        and the out-of-band buffers it references.
+    """
+
+    def dumps_typed_buffers(
+        self, obj: Any
+    ) -> tuple[tuple[str, bytes], list[memoryview]]: ...
+
+    def loads_typed_buffers(
+        self, data: tuple[str, bytes], buffers: Sequence[bytes | memoryview]
+    ) -> Any: ...
+
+
 class SerializerCompat(SerializerProtocol):
     def __init__(self, serde: UntypedSerializerProtocol) -> None:
         self.serde = serde
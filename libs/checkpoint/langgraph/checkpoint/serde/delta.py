@@ -0,0 +1,177 @@
+"""Delta encoding of append-only list channel values.
+
+Channels such as message lists or `Annotated[list, operator.add]` logs grow by a
+few items per step, but each new version is usually serialized in full. With
+delta encoding a new version is stored as the items appended to the previous
+version of the channel, along with the versions it is built upon:
+
+    type: "delta:" + serialized type
+    data: serialized (chain of base versions, appended items)
+
+The first version of the chain is a full snapshot, and a new snapshot is stored
+once the chain reaches its maximum length, so reading a value never needs more
+than `max_chain` other blobs of the same channel.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+DELTA_PREFIX = "delta:"
+
+
+class _Head(NamedTuple):
+    version: Any
+    """Version of the last value written for the channel."""
+    items: list[tuple[str, bytes]]
+    """Serialized items of that value, to check that the next one only appends
+    to it."""
+    chain: list
+    """Versions the last value is built upon, empty for a snapshot."""
+
+
+class DeltaEncoder:
+    """Serialize list channel values as the items appended since the previous
+    version written by this encoder.
+
+    The items of the new value are serialized and compared with those of the
+    previous one before writing a delta, so lists that were rewritten (eg.
+    messages replaced by ID), or whose items were mutated in place, are stored
+    in full.
+
+    Args:
+        serde: The serializer to use for values and deltas.
+        max_chain: The maximum number of blobs a delta can depend on.
+        max_channels: The maximum number of (thread, namespace, channel) for which
+            the last value is kept in memory.
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol,
+        *,
+        max_chain: int = 16,
+        max_channels: int = 1024,
+    ) -> None:
+        self.serde = serde
+        self.max_chain = max_chain
+        self.max_channels = max_channels
+        self.heads: OrderedDict[tuple[str, str, str], _Head] = OrderedDict()
+        # (thread ID, checkpoint NS) -> heads of blobs not yet known to be saved
+        self.pending: dict[tuple[str, str], dict[str, _Head | None]] = {}
+        self.lock = threading.Lock()
+
+    def dumps_typed(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        values: Mapping[str, Any],
+        versions: Mapping[str, Any],
+    ) -> dict[str, tuple[str, bytes]]:
+        """Serialize the new versions of channel values, as deltas when possible.
+
+        Deltas are only based on values that were saved, so `commit` must be called
+        once the returned blobs are written.
+
+        Returns:
+            A mapping of channel to serialized value, for the channels in `values`.
+        """
+        typed: dict[str, tuple[str, bytes]] = {}
+        pending: dict[str, _Head | None] = {}
+        for channel, version in versions.items():
+            if channel not in values:
+                continue
+            value = values[channel]
+            if type(value) is not list:
+                typed[channel] = self.serde.dumps_typed(value)
+                pending[channel] = None
+                continue
+            with self.lock:
+                head = self.heads.get((thread_id, checkpoint_ns, channel))
+            # items can be mutated in place, so they are compared serialized
+            items = [self.serde.dumps_typed(item) for item in value]
+            chain: list = []
+            if (
+                head is not None
+                and head.version != version
+                and len(head.chain) < self.max_chain
+                and len(items) >= len(head.items)
+                and items[: len(head.items)] == head.items
+            ):
+                chain = [*head.chain, head.version]
+                type_, data = self.serde.dumps_typed((chain, value[len(head.items) :]))
+                typed[channel] = (DELTA_PREFIX + type_, data)
+            else:
+                typed[channel] = self.serde.dumps_typed(value)
+            pending[channel] = _Head(version, items, chain)
+        with self.lock:
+            self.pending[(thread_id, checkpoint_ns)] = pending
+        return typed
+
+    def commit(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Record that the blobs last returned for a namespace were saved, so that
+        the next versions can be based on them."""
+        with self.lock:
+            for channel, head in self.pending.pop(
+                (thread_id, checkpoint_ns), {}
+            ).items():
+                key = (thread_id, checkpoint_ns, channel)
+                if head is None:
+                    self.heads.pop(key, None)
+                    continue
+                self.heads[key] = head
+                self.heads.move_to_end(key)
+            while len(self.heads) > self.max_channels:
+                self.heads.popitem(last=False)
+
+    def forget(self, thread_id: str) -> None:
+        """Drop the values kept for a thread, eg. after it was deleted."""
+        with self.lock:
+            for key in [k for k in self.heads if k[0] == thread_id]:
+                del self.heads[key]
+
+
+def is_delta(type_: str) -> bool:
+    """Whether a blob type is a delta, that needs its base blobs to be loaded."""
+    return type_.startswith(DELTA_PREFIX)
+
+
+def loads_delta(
+    serde: SerializerProtocol, data: tuple[str, bytes]
+) -> tuple[list, list]:
+    """Deserialize a delta blob into (chain of base versions, appended items)."""
+    type_, blob = data
+    chain, items = serde.loads_typed((type_[len(DELTA_PREFIX) :], blob))
+    return chain, items
+
+
+def join_delta(
+    serde: SerializerProtocol,
+    chain: list,
+    items: list,
+    bases: Mapping[Any, tuple[str, bytes]],
+) -> list:
+    """Rebuild the value of a delta blob from the blobs of its chain.
+
+    Args:
+        serde: The serializer the blobs were written with.
+        chain: The versions the delta is built upon, as returned by `loads_delta`.
+        items: The items the delta appends, as returned by `loads_delta`.
+        bases: The blobs of (at least) the versions in `chain`, by version.
+
+    Returns:
+        The full list value.
+    """
+    value = list(serde.loads_typed(bases[chain[0]]))
+    for version in chain[1:]:
+        value.extend(loads_delta(serde, bases[version])[1])
+    value.extend(items)
+    return value
+
+
+__all__ = ["DeltaEncoder", "is_delta", "loads_delta", "join_delta"]
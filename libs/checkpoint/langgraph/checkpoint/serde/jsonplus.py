@@ -11,6 +11,7 @@ import re
 import sys
 from collections import deque
 from collections.abc import Callable, Sequence
+from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
 from inspect import isclass
@@ -28,8 +29,10 @@ from zoneinfo import ZoneInfo
 
 import ormsgpack
 from langchain_core.load.load import Reviver
+from langchain_core.messages import BaseMessage
 
-from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.base import BufferedSerializerProtocol
+from langgraph.checkpoint.serde.lazy import LazyValue
 from langgraph.checkpoint.serde.types import SendProtocol
 from langgraph.store.base import Item
 
@@ -38,7 +41,7 @@ EMPTY_BYTES = b""
 logger = logging.getLogger(__name__)
 
 
-class JsonPlusSerializer(SerializerProtocol):
+class JsonPlusSerializer(BufferedSerializerProtocol):
     """Serializer that uses ormsgpack, with optional fallbacks.
 
     Security note: this serializer is intended for use within the BaseCheckpointSaver
@@ -52,9 +55,11 @@ class JsonPlusSerializer(SerializerProtocol):
         *,
         pickle_fallback: bool = False,
         allowed_json_modules: Sequence[tuple[str, ...]] | Literal[True] | None = None,
+        buffer_min_size: int = 64 * 1024,
         __unpack_ext_hook__: Callable[[int, bytes], Any] | None = None,
     ) -> None:
         self.pickle_fallback = pickle_fallback
+        self.buffer_min_size = buffer_min_size
         self._allowed_modules = (
             {mod_and_name for mod_and_name in allowed_json_modules}
             if allowed_json_modules and allowed_json_modules is not True
@@ -109,8 +114,7 @@ class JsonPlusSerializer(SerializerProtocol):
 
         [*module, name] = value["id"]
         try:
-            mod = importlib.import_module(".".join(module))
-            cls = getattr(mod, name)
+            cls = _get_constructor(".".join(module), name)
             method = value.get("method")
             if isinstance(method, str):
                 methods = [getattr(cls, method)]
@@ -188,6 +192,33 @@ class JsonPlusSerializer(SerializerProtocol):
                     return "pickle", pickle.dumps(obj)
                 raise exc
 
+    def dumps_typed_buffers(
+        self, obj: Any
+    ) -> tuple[tuple[str, bytes], list[memoryview]]:
+        """Serialize an object, returning numpy arrays of at least
+        `buffer_min_size` bytes as out-of-band buffers, without copying them."""
+        buffers: list[memoryview] = []
+        token = _OOB_BUFFERS.set((buffers, self.buffer_min_size))
+        try:
+            typed = self.dumps_typed(obj)
+        finally:
+            _OOB_BUFFERS.reset(token)
+        if typed[0] != "msgpack":
+            # eg. the pickle fallback, which doesn't reference the buffers
+            buffers.clear()
+        return typed, buffers
+
+    def loads_typed_buffers(
+        self, data: tuple[str, bytes], buffers: Sequence[bytes | memoryview]
+    ) -> Any:
+        """Deserialize an object, reading numpy arrays straight from the given
+        out-of-band buffers, without copying them."""
+        token = _OOB_SOURCES.set(buffers)
+        try:
+            return self.loads_typed(data)
+        finally:
+            _OOB_SOURCES.reset(token)
+
     def loads_typed(self, data: tuple[str, bytes]) -> Any:
         type_, data_ = data
         if type_ == "null":
@@ -217,10 +248,135 @@ EXT_METHOD_SINGLE_ARG = 3
 EXT_PYDANTIC_V1 = 4
 EXT_PYDANTIC_V2 = 5
 EXT_NUMPY_ARRAY = 6
+EXT_NUMPY_ARRAY_OOB = 7
+
+# while encoding out-of-band, the buffers collected so far and their minimum size
+_OOB_BUFFERS: ContextVar[tuple[list[memoryview], int] | None] = ContextVar(
+    "_OOB_BUFFERS", default=None
+)
+# while decoding out-of-band, the buffers referenced by the payload
+_OOB_SOURCES: ContextVar[Sequence[bytes | memoryview] | None] = ContextVar(
+    "_OOB_SOURCES", default=None
+)
+
+# (module, name) -> resolved class or function, to import each type only once
+_CONSTRUCTORS: dict[tuple[str, str], Any] = {}
+# dataclass -> field names, to not call dataclasses.fields() for every instance
+_DATACLASS_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _get_constructor(module: str, name: str) -> Any:
+    try:
+        return _CONSTRUCTORS[(module, name)]
+    except KeyError:
+        constructor = getattr(importlib.import_module(module), name)
+        _CONSTRUCTORS[(module, name)] = constructor
+        return constructor
+
+
+def _dataclass_fields(cls: type) -> tuple[str, ...]:
+    try:
+        return _DATACLASS_FIELDS[cls]
+    except KeyError:
+        names = tuple(field.name for field in dataclasses.fields(cls))
+        _DATACLASS_FIELDS[cls] = names
+        return names
+
+
+def _encode_message(obj: BaseMessage) -> ormsgpack.Ext:
+    # message fields are plain data, so they don't need a recursive model_dump
+    fields = obj.__dict__
+    if obj.__pydantic_extra__:
+        fields = {**fields, **obj.__pydantic_extra__}
+    return ormsgpack.Ext(
+        EXT_PYDANTIC_V2,
+        _msgpack_enc(
+            (
+                obj.__class__.__module__,
+                obj.__class__.__name__,
+                fields,
+                "model_validate_json",
+            ),
+        ),
+    )
+
+
+def _encode_send(obj: SendProtocol) -> ormsgpack.Ext:
+    return ormsgpack.Ext(
+        EXT_CONSTRUCTOR_POS_ARGS,
+        _msgpack_enc(
+            (obj.__class__.__module__, obj.__class__.__name__, (obj.node, obj.arg)),
+        ),
+    )
+
+
+def _encode_dataclass(obj: Any) -> ormsgpack.Ext:
+    # doesn't use dataclasses.asdict to avoid deepcopy and recursion
+    return ormsgpack.Ext(
+        EXT_CONSTRUCTOR_KW_ARGS,
+        _msgpack_enc(
+            (
+                obj.__class__.__module__,
+                obj.__class__.__name__,
+                {name: getattr(obj, name) for name in _dataclass_fields(obj.__class__)},
+            ),
+        ),
+    )
+
+
+# type -> encoder, for the types that are encoded the most (messages, Send,
+# dataclasses such as Interrupt and Command), to skip the checks below.
+# Lazy channel values that end up in a checkpoint are encoded as their value.
+_ENCODERS: dict[type, Callable[[Any], Any]] = {LazyValue: LazyValue.load}
+
+
+# message type -> field names, or None if it can't skip model_construct
+_MESSAGE_FIELDS: dict[type, frozenset[str] | None] = {}
+
+
+def _message_fields(cls: type[BaseMessage]) -> frozenset[str] | None:
+    try:
+        return _MESSAGE_FIELDS[cls]
+    except KeyError:
+        fields = cls.__pydantic_fields__
+        eligible = (
+            cls.model_config.get("extra") == "allow"
+            and not cls.__private_attributes__
+            and not cls.__pydantic_post_init__
+            and not any(f.alias or f.validation_alias for f in fields.values())
+        )
+        names = frozenset(fields) if eligible else None
+        _MESSAGE_FIELDS[cls] = names
+        return names
+
+
+def _construct_message(cls: type[BaseMessage], values: dict[str, Any]) -> Any:
+    """Same as `cls.model_construct(**values)`, for values that were dumped from
+    an instance, ie. with every field set. Other values, eg. written by older
+    versions of the message class, are validated."""
+    fields = _message_fields(cls)
+    if fields is None or not fields <= values.keys():
+        return cls(**values)
+    if len(values) == len(fields):
+        extra: dict[str, Any] = {}
+    else:
+        extra = {k: v for k, v in values.items() if k not in fields}
+        values = {k: v for k, v in values.items() if k in fields}
+    message = cls.__new__(cls)
+    object.__setattr__(message, "__dict__", values)
+    object.__setattr__(message, "__pydantic_fields_set__", set(values))
+    object.__setattr__(message, "__pydantic_extra__", extra)
+    object.__setattr__(message, "__pydantic_private__", None)
+    return message
 
 
 def _msgpack_default(obj: Any) -> str | ormsgpack.Ext:
-    if hasattr(obj, "model_dump") and callable(obj.model_dump):  # pydantic v2
+    if (encoder := _ENCODERS.get(obj.__class__)) is not None:
+        return encoder(obj)
+    elif isinstance(obj, BaseMessage):
+        _ENCODERS[obj.__class__] = _encode_message
+        return _encode_message(obj)
+    elif hasattr(obj, "model_dump") and callable(obj.model_dump):  # pydantic v2
         return ormsgpack.Ext(
             EXT_PYDANTIC_V2,
             _msgpack_enc(
@@ -392,27 +548,11 @@ def _msgpack_default(obj: Any) -> str | ormsgpack.Ext:
             ),
         )
     elif isinstance(obj, SendProtocol):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, (obj.node, obj.arg)),
-            ),
-        )
+        _ENCODERS[obj.__class__] = _encode_send
+        return _encode_send(obj)
     elif dataclasses.is_dataclass(obj):
-        # doesn't use dataclasses.asdict to avoid deepcopy and recursion
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_KW_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    {
-                        field.name: getattr(obj, field.name)
-                        for field in dataclasses.fields(obj)
-                    },
-                ),
-            ),
-        )
+        _ENCODERS[type(obj)] = _encode_dataclass
+        return _encode_dataclass(obj)
     elif isinstance(obj, Item):
         return ormsgpack.Ext(
             EXT_CONSTRUCTOR_KW_ARGS,
@@ -428,7 +568,17 @@ def _msgpack_default(obj: Any) -> str | ormsgpack.Ext:
         obj, np_mod.ndarray
     ):
         order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
-        if obj.flags.c_contiguous:
+        if (
+            (oob := _OOB_BUFFERS.get()) is not None
+            and obj.nbytes >= oob[1]
+            and not obj.dtype.hasobject
+        ):
+            buffers, _ = oob
+            # a view in memory order, unless the array isn't contiguous
+            buffers.append(memoryview(obj.ravel(order="A").view(np_mod.uint8)))
+            meta = (obj.dtype.str, obj.shape, order, len(buffers) - 1)
+            return ormsgpack.Ext(EXT_NUMPY_ARRAY_OOB, _msgpack_enc(meta))
+        elif obj.flags.c_contiguous:
             mv = memoryview(obj)
             try:
                 meta = (obj.dtype.str, obj.shape, order, mv)
@@ -453,7 +603,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, arg
-            return getattr(importlib.import_module(tup[0]), tup[1])(tup[2])
+            return _get_constructor(tup[0], tup[1])(tup[2])
         except Exception:
             return
     elif code == EXT_CONSTRUCTOR_POS_ARGS:
@@ -462,7 +612,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, args
-            return getattr(importlib.import_module(tup[0]), tup[1])(*tup[2])
+            return _get_constructor(tup[0], tup[1])(*tup[2])
         except Exception:
             return
     elif code == EXT_CONSTRUCTOR_KW_ARGS:
@@ -471,7 +621,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, args
-            return getattr(importlib.import_module(tup[0]), tup[1])(**tup[2])
+            return _get_constructor(tup[0], tup[1])(**tup[2])
         except Exception:
             return
     elif code == EXT_METHOD_SINGLE_ARG:
@@ -480,9 +630,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, arg, method
-            return getattr(getattr(importlib.import_module(tup[0]), tup[1]), tup[3])(
-                tup[2]
-            )
+            return getattr(_get_constructor(tup[0], tup[1]), tup[3])(tup[2])
         except Exception:
             return
     elif code == EXT_PYDANTIC_V1:
@@ -491,7 +639,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, kwargs
-            cls = getattr(importlib.import_module(tup[0]), tup[1])
+            cls = _get_constructor(tup[0], tup[1])
             try:
                 return cls(**tup[2])
             except Exception:
@@ -509,7 +657,13 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, kwargs, method
-            cls = getattr(importlib.import_module(tup[0]), tup[1])
+            cls = _get_constructor(tup[0], tup[1])
+            if isclass(cls) and issubclass(cls, BaseMessage):
+                # messages were dumped from validated instances, skip validation
+                try:
+                    return _construct_message(cls, tup[2])
+                except Exception:
+                    pass
             try:
                 return cls(**tup[2])
             except Exception:
@@ -532,6 +686,18 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
             return arr.reshape(shape, order=order)
         except Exception:
             return
+    elif code == EXT_NUMPY_ARRAY_OOB:
+        try:
+            import numpy as _np
+
+            dtype_str, shape, order, index = ormsgpack.unpackb(
+                data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
+            )
+            buf = _OOB_SOURCES.get()[index]  # type: ignore[index]
+            arr = _np.frombuffer(buf, dtype=_np.dtype(dtype_str))
+            return arr.reshape(shape, order=order)
+        except Exception:
+            return
 
 
 def _msgpack_ext_hook_to_json(code: int, data: bytes) -> Any:
@@ -625,6 +791,20 @@ def _msgpack_ext_hook_to_json(code: int, data: bytes) -> Any:
             return arr.reshape(shape, order=order).tolist()
         except Exception:
             return
+    elif code == EXT_NUMPY_ARRAY_OOB:
+        try:
+            import numpy as _np
+
+            dtype_str, shape, order, index = ormsgpack.unpackb(
+                data,
+                ext_hook=_msgpack_ext_hook_to_json,
+                option=ormsgpack.OPT_NON_STR_KEYS,
+            )
+            buf = _OOB_SOURCES.get()[index]  # type: ignore[index]
+            arr = _np.frombuffer(buf, dtype=_np.dtype(dtype_str))
+            return arr.reshape(shape, order=order).tolist()
+        except Exception:
+            return
 
 
 class InvalidModuleError(Exception):
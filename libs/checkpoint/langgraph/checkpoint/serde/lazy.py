@@ -0,0 +1,80 @@
+"""Channel values that are deserialized on first access.
+
+Resuming a thread only needs the channels read by the next tasks, so the
+checkpoint can carry the other values in their serialized form. Savers decode
+blobs with `loads_typed_lazy`, which returns `LazyValue`s while the caller is
+inside `lazy_loading()`, and regular values otherwise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+_LAZY_LOADING: ContextVar[bool] = ContextVar("lazy_loading", default=False)
+_UNSET = object()
+
+
+class LazyValue:
+    """A serialized value, deserialized the first time it is loaded."""
+
+    __slots__ = ("serde", "data", "value")
+
+    def __init__(self, serde: SerializerProtocol, data: tuple[str, bytes]) -> None:
+        self.serde = serde
+        self.data: tuple[str, bytes] | None = data
+        self.value: Any = _UNSET
+
+    @property
+    def loaded(self) -> bool:
+        return self.value is not _UNSET
+
+    def load(self) -> Any:
+        """Return the deserialized value, deserializing it on first call."""
+        if self.value is _UNSET:
+            assert self.data is not None
+            self.value = self.serde.loads_typed(self.data)
+            self.data = None
+        return self.value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyValue):
+            other = other.load()
+        return self.load() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if self.value is _UNSET:
+            assert self.data is not None
+            return f"LazyValue({self.data[0]}, {len(self.data[1])} bytes)"
+        return f"LazyValue({self.value!r})"
+
+
+@contextmanager
+def lazy_loading() -> Iterator[None]:
+    """Let savers return channel values as `LazyValue`s within this context."""
+    token = _LAZY_LOADING.set(True)
+    try:
+        yield
+    finally:
+        _LAZY_LOADING.reset(token)
+
+
+def loads_typed_lazy(serde: SerializerProtocol, data: tuple[str, bytes]) -> Any:
+    """Deserialize a channel value, or defer it if inside `lazy_loading()`."""
+    if _LAZY_LOADING.get():
+        return LazyValue(serde, data)
+    return serde.loads_typed(data)
+
+
+def load_value(value: Any) -> Any:
+    """Return the deserialized value of a channel value that may be lazy."""
+    return value.load() if isinstance(value, LazyValue) else value
+
+
+__all__ = ["LazyValue", "lazy_loading", "loads_typed_lazy", "load_value"]
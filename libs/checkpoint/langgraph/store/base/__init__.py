@@ -12,7 +12,7 @@ Core types:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import datetime
 from typing import (
     Any,
@@ -27,6 +27,7 @@ from typing_extensions import override
 
 from langgraph.store.base.embed import (
     AEmbeddingsFunc,
+    EmbeddingsCache,
     EmbeddingsFunc,
     ensure_embeddings,
     get_text_at_path,
@@ -306,6 +307,15 @@ class SearchOp(NamedTuple):
     this argument is ignored.
     """
 
+    after: tuple[tuple[str, ...], str] | None = None
+    """Cursor for keyset pagination: the (namespace, key) of the last item of the
+    previous page.
+
+    When set, items are returned in (namespace, key) order, starting after this
+    item, so that the items of the previous pages are not read again. Ignored for
+    searches with a `query`, and by stores that don't set `supports_cursor`.
+    """
+
 
 # Type representing a namespace path that can include wildcards
 NamespacePath = tuple[str | Literal["*"], ...]
@@ -427,6 +437,13 @@ class ListNamespacesOp(NamedTuple):
     offset: int = 0
     """Number of namespaces to skip for pagination."""
 
+    after: tuple[str, ...] | None = None
+    """Cursor for keyset pagination: the last namespace of the previous page.
+
+    When set, only the namespaces that come after it are returned. Ignored by
+    stores that don't set `supports_cursor`.
+    """
+
 
 class PutOp(NamedTuple):
     """Operation to store, update, or delete an item in the store.
@@ -565,6 +582,13 @@ class TTLConfig(TypedDict, total=False):
     If provided, the store will periodically delete expired items based on TTL.
     Defaults to None (no sweeping).
     """
+    sweep_batch_size: int
+    """Maximum number of expired items deleted at once during a TTL sweep.
+    
+    Sweeps delete expired items in batches, oldest first, so that a large backlog
+    of expired items does not hold locks on the store for the whole sweep.
+    Defaults to 1000.
+    """
 
 
 class IndexConfig(TypedDict, total=False):
@@ -696,6 +720,52 @@ class IndexConfig(TypedDict, total=False):
         - Complex nested paths are supported (e.g., `"a.b[*].c.d"`)
     """
 
+    cache: EmbeddingsCache | bool
+    """Cache of embeddings, to avoid embedding the same texts again.
+
+    When set, the embeddings of the documents and queries embedded by the store are
+    kept by model and text, so re-putting unchanged items or repeating a query does
+    not call the embedding model. Pass `True` for an in-memory cache of the store, or
+    an `EmbeddingsCache` to share it between stores or persist it in SQLite.
+    """
+
+    embed_batch_size: int | None
+    """Maximum number of texts per call to the embedding model.
+
+    Puts embedding more texts split them into batches of this size, so that large
+    batches of puts don't exceed the request limits of the provider. The embeddings
+    are stored in the order of the texts. Defaults to no limit.
+    """
+
+    embed_concurrency: int
+    """Maximum number of batches of texts embedded at once. Defaults to 1.
+
+    Batches are embedded concurrently in threads by the sync methods of the store,
+    and as concurrent tasks by the async ones.
+    """
+
+    filter_fields: list[str] | None
+    """Fields of item values to index for `filter` conditions in `search`.
+
+    Stores maintain a secondary index on each of these fields, so that equality and
+    range (`$gt`, `$gte`, `$lt`, `$lte`) conditions on them look up the matching
+    items instead of scanning the namespace. Conditions on other fields still work,
+    but are checked item by item.
+
+    ???+ example "Examples"
+
+        ```python
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": init_embeddings("openai:text-embedding-3-small"),
+                "filter_fields": ["kind", "created_by"],
+            }
+        )
+        store.search(("docs",), filter={"kind": "note", "created_by": "user-1"})
+        ```
+    """
+
 
 class BaseStore(ABC):
     """Abstract base class for persistent key-value stores.
@@ -714,9 +784,14 @@ class BaseStore(ABC):
 
         Similarly, TTL (time-to-live) support is disabled by default.
         Subclasses must explicitly set `supports_ttl = True` to enable this feature.
+
+        Stores that implement the `after` cursors of `SearchOp` and
+        `ListNamespacesOp` set `supports_cursor = True`, so that `search_iter` and
+        `list_namespaces_iter` page through results without offsets.
     """
 
     supports_ttl: bool = False
+    supports_cursor: bool = False
     ttl_config: TTLConfig | None = None
 
     __slots__ = ("__weakref__",)
@@ -990,6 +1065,77 @@ class BaseStore(ABC):
         )
         return self.batch([op])[0]
 
+    def search_iter(
+        self,
+        namespace_prefix: tuple[str, ...],
+        /,
+        *,
+        query: str | None = None,
+        filter: dict[str, Any] | None = None,
+        page_size: int = 100,
+        refresh_ttl: bool | None = None,
+    ) -> Iterator[SearchItem]:
+        """Iterate over all the items matching a search, one page at a time.
+
+        Only one page of items is held in memory. Unless a `query` is given, stores
+        that support cursors return the items in (namespace, key) order and read
+        each page after the last item of the previous one, so that iterating over a
+        namespace takes linear time. Other searches are paged with offsets.
+
+        Args:
+            namespace_prefix: Hierarchical path prefix to search within.
+            query: Optional query for natural language search.
+            filter: Key-value pairs to filter results.
+            page_size: Number of items fetched per call to the store.
+            refresh_ttl: Whether to refresh TTLs for the returned items.
+                If no TTL is specified, this argument is ignored.
+
+        Yields:
+            The items matching the search.
+
+        ???+ example "Examples"
+
+            Export all the memories of a user:
+            ```python
+            for item in store.search_iter(("users", "123")):
+                export(item)
+            ```
+        """
+        op: SearchOp | None = _search_op(
+            self, namespace_prefix, query, filter, page_size, refresh_ttl
+        )
+        while op is not None:
+            page = cast(list[SearchItem], self.batch([op])[0])
+            yield from page
+            op = _next_search_op(op, page, self.supports_cursor)
+
+    def list_namespaces_iter(
+        self,
+        *,
+        prefix: NamespacePath | None = None,
+        suffix: NamespacePath | None = None,
+        max_depth: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[tuple[str, ...]]:
+        """Iterate over all the namespaces matching the conditions, one page at a time.
+
+        Args:
+            prefix: Filter namespaces that start with this path.
+            suffix: Filter namespaces that end with this path.
+            max_depth: Return namespaces up to this depth in the hierarchy.
+            page_size: Number of namespaces fetched per call to the store.
+
+        Yields:
+            The namespaces matching the conditions, in the order of `list_namespaces`.
+        """
+        op: ListNamespacesOp | None = _list_namespaces_op(
+            prefix, suffix, max_depth, page_size
+        )
+        while op is not None:
+            page = cast(list[tuple[str, ...]], self.batch([op])[0])
+            yield from page
+            op = _next_list_namespaces_op(op, page, self.supports_cursor)
+
     async def aget(
         self,
         namespace: tuple[str, ...],
@@ -1251,6 +1397,139 @@ class BaseStore(ABC):
         )
         return (await self.abatch([op]))[0]
 
+    async def asearch_iter(
+        self,
+        namespace_prefix: tuple[str, ...],
+        /,
+        *,
+        query: str | None = None,
+        filter: dict[str, Any] | None = None,
+        page_size: int = 100,
+        refresh_ttl: bool | None = None,
+    ) -> AsyncIterator[SearchItem]:
+        """Asynchronously iterate over all the items matching a search, one page at
+        a time.
+
+        Only one page of items is held in memory. Unless a `query` is given, stores
+        that support cursors return the items in (namespace, key) order and read
+        each page after the last item of the previous one, so that iterating over a
+        namespace takes linear time. Other searches are paged with offsets.
+
+        Args:
+            namespace_prefix: Hierarchical path prefix to search within.
+            query: Optional query for natural language search.
+            filter: Key-value pairs to filter results.
+            page_size: Number of items fetched per call to the store.
+            refresh_ttl: Whether to refresh TTLs for the returned items.
+                If no TTL is specified, this argument is ignored.
+
+        Yields:
+            The items matching the search.
+
+        ???+ example "Examples"
+
+            Export all the memories of a user:
+            ```python
+            async for item in store.asearch_iter(("users", "123")):
+                await export(item)
+            ```
+        """
+        op: SearchOp | None = _search_op(
+            self, namespace_prefix, query, filter, page_size, refresh_ttl
+        )
+        while op is not None:
+            page = cast(list[SearchItem], (await self.abatch([op]))[0])
+            for item in page:
+                yield item
+            op = _next_search_op(op, page, self.supports_cursor)
+
+    async def alist_namespaces_iter(
+        self,
+        *,
+        prefix: NamespacePath | None = None,
+        suffix: NamespacePath | None = None,
+        max_depth: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[tuple[str, ...]]:
+        """Asynchronously iterate over all the namespaces matching the conditions,
+        one page at a time.
+
+        Args:
+            prefix: Filter namespaces that start with this path.
+            suffix: Filter namespaces that end with this path.
+            max_depth: Return namespaces up to this depth in the hierarchy.
+            page_size: Number of namespaces fetched per call to the store.
+
+        Yields:
+            The namespaces matching the conditions, in the order of `list_namespaces`.
+        """
+        op: ListNamespacesOp | None = _list_namespaces_op(
+            prefix, suffix, max_depth, page_size
+        )
+        while op is not None:
+            page = cast(list[tuple[str, ...]], (await self.abatch([op]))[0])
+            for namespace in page:
+                yield namespace
+            op = _next_list_namespaces_op(op, page, self.supports_cursor)
+
+
+def _search_op(
+    store: BaseStore,
+    namespace_prefix: tuple[str, ...],
+    query: str | None,
+    filter: dict[str, Any] | None,
+    limit: int,
+    refresh_ttl: bool | None,
+) -> SearchOp:
+    return SearchOp(
+        namespace_prefix,
+        filter,
+        limit,
+        0,
+        query,
+        _ensure_refresh(store.ttl_config, refresh_ttl),
+        # start before the first item, to get pages in (namespace, key) order
+        after=((), "") if store.supports_cursor and not query else None,
+    )
+
+
+def _list_namespaces_op(
+    prefix: NamespacePath | None,
+    suffix: NamespacePath | None,
+    max_depth: int | None,
+    limit: int,
+) -> ListNamespacesOp:
+    match_conditions = []
+    if prefix:
+        match_conditions.append(MatchCondition(match_type="prefix", path=prefix))
+    if suffix:
+        match_conditions.append(MatchCondition(match_type="suffix", path=suffix))
+    return ListNamespacesOp(
+        match_conditions=tuple(match_conditions), max_depth=max_depth, limit=limit
+    )
+
+
+def _next_search_op(
+    op: SearchOp, page: list[SearchItem], cursor: bool
+) -> SearchOp | None:
+    """Return the operation fetching the page after `page`, None if it was the last."""
+    if len(page) < op.limit:
+        return None
+    if cursor and not op.query:
+        return op._replace(after=(page[-1].namespace, page[-1].key))
+    return op._replace(offset=op.offset + len(page))
+
+
+def _next_list_namespaces_op(
+    op: ListNamespacesOp, page: list[tuple[str, ...]], cursor: bool
+) -> ListNamespacesOp | None:
+    """Return the operation fetching the page after `page`, None if it was the last."""
+    if len(page) < op.limit:
+        return None
+    if cursor:
+        return op._replace(after=page[-1])
+    return op._replace(offset=op.offset + len(page))
+
 
 def _validate_namespace(namespace: tuple[str, ...]) -> None:
     if not namespace:
@@ -1308,6 +1587,7 @@ __all__ = [
     "NamespacePath",
     "NamespaceMatchType",
     "Embeddings",
+    "EmbeddingsCache",
     "ensure_embeddings",
     "tokenize_path",
     "get_text_at_path",
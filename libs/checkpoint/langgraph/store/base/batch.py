@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures as cf
 import functools
+import queue
+import threading
+import time
 import weakref
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
 from typing import Any, Literal, TypeVar
 
 from langgraph.store.base import (
@@ -56,12 +60,31 @@ def _check_loop(func: F) -> F:
 
 
 class AsyncBatchedBaseStore(BaseStore):
-    """Efficiently batch operations in a background task."""
+    """Efficiently batch operations in a background task.
 
-    __slots__ = ("_loop", "_aqueue", "_task")
+    Operations queued while a batch is being built are run together in a single
+    call to `abatch`, after identical reads and writes to the same item are merged.
 
-    def __init__(self) -> None:
+    Args:
+        batch_linger: Seconds to wait for more operations once the first one of a
+            batch is queued. Defaults to 0, which only batches operations queued in
+            the same event loop iteration.
+        max_batch_size: The maximum number of operations passed to a single
+            `abatch` call. Operations beyond it are run in the next batch.
+
+    Both settings can also be changed on the store after it is created.
+    """
+
+    __slots__ = ("_loop", "_aqueue", "_task", "batch_linger", "max_batch_size")
+
+    def __init__(
+        self, *, batch_linger: float = 0.0, max_batch_size: int = 1000
+    ) -> None:
         super().__init__()
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_linger = batch_linger
+        self.max_batch_size = max_batch_size
         self._loop = asyncio.get_running_loop()
         self._aqueue: asyncio.Queue[tuple[asyncio.Future, Op]] = asyncio.Queue()
         self._task: asyncio.Task | None = None
@@ -280,8 +303,132 @@ class AsyncBatchedBaseStore(BaseStore):
         ).result()
 
 
+class BatchedStore(BaseStore):
+    """Batch operations of synchronous callers in a background thread.
+
+    Wraps any store so that concurrent calls from many threads, eg. nodes running
+    in the thread pool, are run together in a single call to the store's `batch`,
+    with the same deduplication as `AsyncBatchedBaseStore`. The operations of each
+    `batch` call are always run in the same batch.
+
+    Args:
+        store: The store to run the batched operations with.
+        batch_linger: Seconds to wait for more operations once the first one of a
+            batch is queued. Defaults to 0, which batches the operations queued
+            while the previous batch was running.
+        max_batch_size: The maximum number of operations passed to a single
+            `batch` call, unless a single call has more.
+
+    Example:
+        ```python
+        from langgraph.store.base.batch import BatchedStore
+        from langgraph.store.sqlite import SqliteStore
+
+        with SqliteStore.from_conn_string(":memory:") as sqlite_store:
+            store = BatchedStore(sqlite_store, batch_linger=0.002)
+            store.put(("docs",), "doc1", {"text": "Python tutorial"})
+        ```
+
+    Note:
+        Async methods are not batched, and are run directly with the wrapped store.
+    """
+
+    __slots__ = (
+        "store",
+        "batch_linger",
+        "max_batch_size",
+        "supports_ttl",
+        "supports_cursor",
+        "ttl_config",
+        "_queue",
+        "_thread",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        store: BaseStore,
+        *,
+        batch_linger: float = 0.0,
+        max_batch_size: int = 1000,
+    ) -> None:
+        super().__init__()
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.store = store
+        self.batch_linger = batch_linger
+        self.max_batch_size = max_batch_size
+        self.supports_ttl = store.supports_ttl
+        self.supports_cursor = store.supports_cursor
+        self.ttl_config = store.ttl_config
+        self._queue: queue.SimpleQueue[tuple[cf.Future, list[Op]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __del__(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+
+    def _ensure_thread(self) -> None:
+        """Ensure the background flusher thread is running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=_run_sync,
+                    args=(self._queue, weakref.ref(self)),
+                    name=f"{self.store.__class__.__name__}-batch",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        ops = list(ops)
+        if not ops:
+            return []
+        self._ensure_thread()
+        fut: cf.Future[list[Result]] = cf.Future()
+        self._queue.put((fut, ops))
+        return fut.result()
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        return await self.store.abatch(ops)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable value that compares equal iff the given values do."""
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    hash(value)
+    return value
+
+
+def _op_key(op: GetOp | SearchOp | ListNamespacesOp) -> Hashable:
+    """Key of a read operation, equal for operations that return the same result."""
+    try:
+        hash(op)
+        return op
+    except TypeError:
+        pass
+    try:
+        # search filters are dicts
+        return tuple(_freeze(v) for v in op)
+    except TypeError:
+        # unhashable values, don't dedupe
+        return object()
+
+
 def _dedupe_ops(values: list[Op]) -> tuple[list[int] | None, list[Op]]:
-    """Dedupe operations while preserving order for results.
+    """Dedupe operations and group them by type, while preserving order for results.
+
+    Identical reads are run once, and only the last of several writes to the same
+    item is kept. The stores run reads before writes within a batch, so grouping
+    operations of the same type does not change their results.
 
     Args:
         values: List of operations to dedupe
@@ -293,49 +440,50 @@ def _dedupe_ops(values: list[Op]) -> tuple[list[int] | None, list[Op]]:
     if len(values) <= 1:
         return None, list(values)
 
-    dedupped: list[Op] = []
-    listen: list[int] = []
-    puts: dict[tuple[tuple[str, ...], str], int] = {}
+    # operations of each type, by key, in the order the type was first seen
+    groups: dict[type, dict[Hashable, Op]] = {}
+    keys: list[tuple[type, Hashable]] = []
 
-    for op in values:
+    for i, op in enumerate(values):
+        group = groups.setdefault(type(op), {})
         if isinstance(op, (GetOp, SearchOp, ListNamespacesOp)):
-            try:
-                listen.append(dedupped.index(op))
-            except ValueError:
-                listen.append(len(dedupped))
-                dedupped.append(op)
+            key = _op_key(op)
+            group.setdefault(key, op)
         elif isinstance(op, PutOp):
-            putkey = (op.namespace, op.key)
-            if putkey in puts:
-                # Overwrite previous put
-                ix = puts[putkey]
-                dedupped[ix] = op
-                listen.append(ix)
-            else:
-                puts[putkey] = len(dedupped)
-                listen.append(len(dedupped))
-                dedupped.append(op)
-
+            key = (op.namespace, op.key)
+            # Overwrite previous put
+            group[key] = op
         else:  # Any new ops will be treated regularly
-            listen.append(len(dedupped))
+            key = i
+            group[key] = op
+        keys.append((type(op), key))
+
+    dedupped: list[Op] = []
+    positions: dict[tuple[type, Hashable], int] = {}
+    for type_, group in groups.items():
+        for key, op in group.items():
+            positions[(type_, key)] = len(dedupped)
             dedupped.append(op)
 
-    return listen, dedupped
+    return [positions[key] for key in keys], dedupped
 
 
 async def _run(
     aqueue: asyncio.Queue[tuple[asyncio.Future, Op]],
-    store: weakref.ReferenceType[BaseStore],
+    store: weakref.ReferenceType[AsyncBatchedBaseStore],
 ) -> None:
     while item := await aqueue.get():
         # check if store is still alive
         if s := store():
             try:
-                # accumulate operations scheduled in same tick
                 items = [item]
+                if s.batch_linger > 0 and aqueue.qsize() < s.max_batch_size - 1:
+                    # give concurrent callers a chance to join the batch
+                    await asyncio.sleep(s.batch_linger)
+                # accumulate operations scheduled in the meantime
                 try:
-                    while item := aqueue.get_nowait():
-                        items.append(item)
+                    while len(items) < s.max_batch_size:
+                        items.append(aqueue.get_nowait())
                 except asyncio.QueueEmpty:
                     pass
                 # get the operations to run
@@ -363,3 +511,58 @@ async def _run(
                 del s
         else:
             break
+
+
+def _run_sync(
+    queue_: queue.SimpleQueue[tuple[cf.Future, list[Op]] | None],
+    store: weakref.ReferenceType[BatchedStore],
+) -> None:
+    pending: tuple[cf.Future, list[Op]] | None = None
+    stop = False
+    while not stop:
+        item = pending or queue_.get()
+        pending = None
+        # check if store is still alive
+        if item is None or (s := store()) is None:
+            break
+        try:
+            items = [item]
+            size = len(item[1])
+            deadline = time.monotonic() + s.batch_linger
+            # accumulate calls made before the deadline, up to the max batch size
+            while size < s.max_batch_size:
+                try:
+                    timeout = deadline - time.monotonic()
+                    if timeout > 0:
+                        item = queue_.get(timeout=timeout)
+                    else:
+                        item = queue_.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if size + len(item[1]) > s.max_batch_size:
+                    pending = item
+                    break
+                items.append(item)
+                size += len(item[1])
+            values = [op for _, ops in items for op in ops]
+            try:
+                listen, dedupped = _dedupe_ops(values)
+                results = s.store.batch(dedupped)
+                if listen is not None:
+                    results = [results[ix] for ix in listen]
+                # set the results of each call
+                offset = 0
+                for fut, ops in items:
+                    if not fut.cancelled():
+                        fut.set_result(results[offset : offset + len(ops)])
+                    offset += len(ops)
+            except Exception as e:
+                for fut, _ in items:
+                    if not fut.cancelled():
+                        fut.set_exception(e)
+        finally:
+            # remove strong ref to store
+            del s
@@ -0,0 +1,234 @@
+"""Read-through cache of the items of a store."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import NamedTuple
+
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    Op,
+    PutOp,
+    Result,
+    SearchOp,
+)
+from langgraph.store.base.batch import _op_key
+
+
+class CachedStoreStats(NamedTuple):
+    """Statistics of a `CachedStore`."""
+
+    hits: int
+    """Number of reads served from the cache."""
+    misses: int
+    """Number of reads run on the wrapped store."""
+    size: int
+    """Number of results kept in the cache."""
+
+
+class _Entry(NamedTuple):
+    expires_at: float | None
+    result: Result
+    prefix: tuple[str, ...] | None
+    """Namespace prefix of a cached search, None for an item."""
+
+
+class CachedStore(BaseStore):
+    """Wrap a store to serve repeated reads of the same items from memory.
+
+    Gets are served from an LRU of the last items read, and writes through the
+    cache invalidate the item written. Searches can also be cached, in which case
+    a write invalidates the searches of all the namespace prefixes of the item.
+
+    Args:
+        store: The store to read from and write to.
+        max_items: The maximum number of results kept in the cache.
+        ttl: Seconds after which a cached result is read again from the store.
+            Defaults to None, which keeps results until they are invalidated or
+            evicted.
+        cache_search: Whether to also cache the results of searches.
+
+    ??? example "Examples"
+
+        ```python
+        from langgraph.store.base.cache import CachedStore
+        from langgraph.store.postgres import PostgresStore
+
+        with PostgresStore.from_conn_string(conn_string) as postgres_store:
+            store = CachedStore(postgres_store, max_items=10_000, ttl=60)
+            store.get(("users", "123"), "profile")  # read from Postgres
+            store.get(("users", "123"), "profile")  # read from the cache
+            print(store.stats())
+        ```
+
+    Note:
+        Only writes made through this wrapper invalidate the cache, so use a `ttl`
+        when other processes write to the same store. Reads served from the cache
+        do not refresh the TTL of the items in the wrapped store.
+    """
+
+    __slots__ = (
+        "store",
+        "max_items",
+        "ttl",
+        "cache_search",
+        "supports_ttl",
+        "supports_cursor",
+        "ttl_config",
+        "_entries",
+        "_searches",
+        "_writes",
+        "_hits",
+        "_misses",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        store: BaseStore,
+        *,
+        max_items: int = 1024,
+        ttl: float | None = None,
+        cache_search: bool = False,
+    ) -> None:
+        super().__init__()
+        self.store = store
+        self.max_items = max_items
+        self.ttl = ttl
+        self.cache_search = cache_search
+        self.supports_ttl = store.supports_ttl
+        self.supports_cursor = store.supports_cursor
+        self.ttl_config = store.ttl_config
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        # namespace prefix -> keys of the cached searches of that prefix
+        self._searches: dict[tuple[str, ...], set[Hashable]] = {}
+        # number of writes, to not cache results read while an item was written
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        ops = list(ops)
+        results, pending, writes = self._lookup(ops)
+        try:
+            if pending:
+                for (i, _), result in zip(
+                    pending,
+                    self.store.batch([op for _, op in pending]),
+                    strict=True,
+                ):
+                    results[i] = result
+        except BaseException:
+            # puts may have been applied before the failure
+            self._update(pending, None, writes)
+            raise
+        self._update(pending, results, writes)
+        return results
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        ops = list(ops)
+        results, pending, writes = self._lookup(ops)
+        try:
+            if pending:
+                for (i, _), result in zip(
+                    pending,
+                    await self.store.abatch([op for _, op in pending]),
+                    strict=True,
+                ):
+                    results[i] = result
+        except BaseException:
+            # puts may have been applied before the failure
+            self._update(pending, None, writes)
+            raise
+        self._update(pending, results, writes)
+        return results
+
+    def stats(self) -> CachedStoreStats:
+        """Return the hit/miss statistics of the cache."""
+        with self._lock:
+            return CachedStoreStats(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all results from the cache, and reset its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._searches.clear()
+            self._writes += 1
+            self._hits = self._misses = 0
+
+    def _key(self, op: Op) -> Hashable | None:
+        if isinstance(op, GetOp):
+            return (GetOp, op.namespace, op.key)
+        if isinstance(op, SearchOp) and self.cache_search:
+            return (SearchOp, _op_key(op))
+        return None
+
+    def _lookup(self, ops: list[Op]) -> tuple[list[Result], list[tuple[int, Op]], int]:
+        """Return the cached results, the operations to run, and the write count."""
+        results: list[Result] = [None] * len(ops)
+        pending: list[tuple[int, Op]] = []
+        now = time.monotonic()
+        with self._lock:
+            for i, op in enumerate(ops):
+                if (key := self._key(op)) is not None:
+                    entry = self._entries.get(key)
+                    if entry is not None and (
+                        entry.expires_at is None or entry.expires_at > now
+                    ):
+                        self._entries.move_to_end(key)
+                        results[i] = entry.result
+                        self._hits += 1
+                        continue
+                    self._misses += 1
+                pending.append((i, op))
+            return results, pending, self._writes
+
+    def _update(
+        self,
+        pending: list[tuple[int, Op]],
+        results: list[Result] | None,
+        writes: int,
+    ) -> None:
+        """Invalidate the items written, and cache the results read, if any."""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            for _, op in pending:
+                if isinstance(op, PutOp):
+                    self._invalidate(op.namespace, op.key)
+            if results is None or self._writes != writes:
+                # an item was written since the results were read
+                return
+            for i, op in pending:
+                if (key := self._key(op)) is None:
+                    continue
+                prefix = op.namespace_prefix if isinstance(op, SearchOp) else None
+                self._remove(key)
+                self._entries[key] = _Entry(expires_at, results[i], prefix)
+                if prefix is not None:
+                    self._searches.setdefault(prefix, set()).add(key)
+            while len(self._entries) > self.max_items:
+                self._remove(next(iter(self._entries)))
+
+    def _invalidate(self, namespace: tuple[str, ...], key: str) -> None:
+        self._writes += 1
+        self._entries.pop((GetOp, namespace, key), None)
+        for depth in range(len(namespace) + 1):
+            for search_key in self._searches.pop(namespace[:depth], ()):
+                self._entries.pop(search_key, None)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.prefix is not None:
+            searches = self._searches.get(entry.prefix)
+            if searches is not None:
+                searches.discard(key)
+                if not searches:
+                    del self._searches[entry.prefix]
+
+
+__all__ = ["CachedStore", "CachedStoreStats"]
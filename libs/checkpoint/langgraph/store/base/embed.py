@@ -9,10 +9,24 @@ asynchronous operations.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures as cf
 import functools
+import hashlib
+import itertools
 import json
-from collections.abc import Awaitable, Callable, Sequence
-from typing import Any
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Sequence,
+)
+from typing import Any, Literal, NamedTuple, TypeVar, cast
 
 from langchain_core.embeddings import Embeddings
 
@@ -30,9 +44,18 @@ AEmbeddingsFunc = Callable[[Sequence[str]], Awaitable[list[list[float]]]]
 Similar to EmbeddingsFunc, but returns an awaitable that resolves to the embeddings.
 """
 
+T = TypeVar("T")
+
+# distinguishes the cache entries of the lambdas and partials of each instance
+_anonymous_ids = itertools.count()
+
 
 def ensure_embeddings(
     embed: Embeddings | EmbeddingsFunc | AEmbeddingsFunc | str | None,
+    *,
+    cache: EmbeddingsCache | bool | None = None,
+    batch_size: int | None = None,
+    max_concurrency: int | None = None,
 ) -> Embeddings:
     """Ensure that an embedding function conforms to LangChain's Embeddings interface.
 
@@ -44,6 +67,11 @@ def ensure_embeddings(
         embed: Either an existing Embeddings instance, or a function that converts
             text to embeddings. If the function is async, it will be used for both
             sync and async operations.
+        cache: An `EmbeddingsCache` to reuse the embeddings of texts embedded before,
+            or `True` to use a new in-memory one.
+        batch_size: Maximum number of texts per call to the embedding function.
+            Larger lists of documents are split into batches. Defaults to no limit.
+        max_concurrency: Maximum number of batches embedded at once. Defaults to 1.
 
     Returns:
         An Embeddings instance that wraps the provided function(s).
@@ -80,6 +108,22 @@ def ensure_embeddings(
     """
     if embed is None:
         raise ValueError("embed must be provided")
+    if cache:
+        if cache is True:
+            cache = EmbeddingsCache()
+        return CachedEmbeddings(
+            ensure_embeddings(
+                embed, batch_size=batch_size, max_concurrency=max_concurrency
+            ),
+            cache,
+            model_id=embed if isinstance(embed, str) else None,
+        )
+    if batch_size or (max_concurrency or 1) > 1:
+        return BatchedEmbeddings(
+            ensure_embeddings(embed),
+            batch_size=batch_size,
+            max_concurrency=max_concurrency or 1,
+        )
     if isinstance(embed, str):
         init_embeddings = _get_init_embeddings()
         if init_embeddings is None:
@@ -230,6 +274,324 @@ class EmbeddingsLambda(Embeddings):
         return (await afunc([text]))[0]
 
 
+class EmbeddingsCacheStats(NamedTuple):
+    """Statistics of an `EmbeddingsCache`."""
+
+    hits: int
+    """Number of texts whose embedding was found in the cache."""
+    misses: int
+    """Number of texts that had to be embedded."""
+    size: int
+    """Number of embeddings kept in memory."""
+
+
+class EmbeddingsCache:
+    """Cache of embeddings by model and text, to avoid embedding the same text twice.
+
+    Embeddings are kept in an in-memory LRU, and optionally persisted in a SQLite
+    database so that they survive restarts. A cache can be shared by several stores,
+    as entries are keyed by the ID of the embedding model.
+
+    Args:
+        maxsize: The maximum number of embeddings kept in memory.
+        path: The path of a SQLite database to persist embeddings in, if any.
+
+    ??? example "Examples"
+
+        ```python
+        cache = EmbeddingsCache(maxsize=50_000, path="embeddings.sqlite")
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": "openai:text-embedding-3-small",
+                "cache": cache,
+            }
+        )
+        ...
+        print(cache.stats())
+        ```
+    """
+
+    def __init__(self, maxsize: int = 10_000, *, path: str | None = None) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.conn: sqlite3.Connection | None = None
+        if path is not None:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, key BLOB NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, key)) WITHOUT ROWID"
+            )
+            self.conn.commit()
+
+    def get(self, model_id: str, keys: Sequence[bytes]) -> list[list[float] | None]:
+        """Return the cached embeddings for the keys, None for those missing."""
+        found: list[list[float] | None] = []
+        missing: dict[bytes, list[int]] = {}
+        with self.lock:
+            for key in keys:
+                vector = self.entries.get((model_id, key))
+                if vector is not None:
+                    self.entries.move_to_end((model_id, key))
+                else:
+                    missing.setdefault(key, []).append(len(found))
+                found.append(vector)
+            if missing and self.conn is not None:
+                for key, blob in self._select(model_id, list(missing)):
+                    vector = array("d", blob).tolist()
+                    self._remember((model_id, key), vector)
+                    for i in missing.pop(key):
+                        found[i] = vector
+            self.misses += sum(map(len, missing.values()))
+            self.hits += len(found) - sum(map(len, missing.values()))
+        return found
+
+    def set(self, model_id: str, items: Sequence[tuple[bytes, list[float]]]) -> None:
+        """Add embeddings to the cache."""
+        with self.lock:
+            for key, vector in items:
+                self._remember((model_id, key), vector)
+            if self.conn is not None and items:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, key, vector) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (model_id, key, array("d", vector).tobytes())
+                        for key, vector in items
+                    ],
+                )
+                self.conn.commit()
+
+    def stats(self) -> EmbeddingsCacheStats:
+        """Return the hit/miss statistics of the cache."""
+        with self.lock:
+            return EmbeddingsCacheStats(self.hits, self.misses, len(self.entries))
+
+    def clear(self) -> None:
+        """Remove all embeddings from the cache, and reset its statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM embeddings")
+                self.conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite database, if any."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _remember(self, key: tuple[str, bytes], vector: list[float]) -> None:
+        self.entries[key] = vector
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def _select(self, model_id: str, keys: list[bytes]) -> list[tuple[bytes, bytes]]:
+        assert self.conn is not None
+        rows: list[tuple[bytes, bytes]] = []
+        # stay below SQLite's maximum number of variables
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            rows.extend(
+                self.conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE model = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    (model_id, *chunk),
+                )
+            )
+        return rows
+
+
+class CachedEmbeddings(Embeddings):
+    """Wrapper of an Embeddings instance that reuses cached embeddings.
+
+    Only the texts missing from the cache are passed to the wrapped embeddings, once
+    each. Queries and documents are cached separately, as some models embed them
+    differently.
+
+    Args:
+        embeddings: The embeddings to wrap.
+        cache: The cache to use, which can be shared with other models.
+        model_id: The ID of the model in the cache. Defaults to the class and model
+            name of the embeddings, or the name of the function they wrap. Lambdas
+            and partials can't be told apart by name, so without an ID their
+            embeddings are only shared with this instance, and can't be persisted.
+
+    Raises:
+        ValueError: If embeddings wrapping a lambda or partial are cached in a
+            persistent cache without a `model_id`.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        cache: EmbeddingsCache,
+        *,
+        model_id: str | None = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.cache = cache
+        if model_id is None and (model_id := _get_model_id(embeddings)) is None:
+            if cache.conn is not None:
+                raise ValueError(
+                    "A model_id is required to persist the embeddings of a lambda "
+                    "or partial function, as they can't be told apart by name."
+                )
+            model_id = f"{_get_func_name(embeddings)}:{next(_anonymous_ids)}"
+        self.model_id = model_id
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        found, missing = self._lookup("document", texts)
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing))
+            self._fill("document", found, missing, vectors)
+        return cast(list[list[float]], found)
+
+    def embed_query(self, text: str) -> list[float]:
+        found, missing = self._lookup("query", [text])
+        if missing:
+            self._fill("query", found, missing, [self.embeddings.embed_query(text)])
+        return cast(list[float], found[0])
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        found, missing = self._lookup("document", texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(list(missing))
+            self._fill("document", found, missing, vectors)
+        return cast(list[list[float]], found)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        found, missing = self._lookup("query", [text])
+        if missing:
+            vector = await self.embeddings.aembed_query(text)
+            self._fill("query", found, missing, [vector])
+        return cast(list[float], found[0])
+
+    def _lookup(
+        self, kind: Literal["document", "query"], texts: list[str]
+    ) -> tuple[list[list[float] | None], dict[str, list[int]]]:
+        """Return the cached embeddings of the texts, and the positions of the
+        texts missing from the cache."""
+        found = self.cache.get(self.model_id, [_hash_text(kind, t) for t in texts])
+        missing: dict[str, list[int]] = {}
+        for i, (text, vector) in enumerate(zip(texts, found, strict=True)):
+            if vector is None:
+                missing.setdefault(text, []).append(i)
+        return found, missing
+
+    def _fill(
+        self,
+        kind: Literal["document", "query"],
+        found: list[list[float] | None],
+        missing: dict[str, list[int]],
+        vectors: list[list[float]],
+    ) -> None:
+        if len(vectors) != len(missing):
+            raise ValueError(f"Expected {len(missing)} embeddings, got {len(vectors)}")
+        for positions, vector in zip(missing.values(), vectors, strict=True):
+            for i in positions:
+                found[i] = vector
+        self.cache.set(
+            self.model_id,
+            [
+                (_hash_text(kind, text), vector)
+                for text, vector in zip(missing, vectors, strict=True)
+            ],
+        )
+
+
+class BatchedEmbeddings(Embeddings):
+    """Wrapper of an Embeddings instance that embeds documents in bounded batches.
+
+    Lists of documents longer than `batch_size` are split into batches that are
+    embedded with up to `max_concurrency` calls at once, in threads for the sync
+    methods. The embeddings are returned in the order of the texts.
+
+    Args:
+        embeddings: The embeddings to wrap.
+        batch_size: Maximum number of texts per call to the wrapped embeddings.
+            Defaults to no limit.
+        max_concurrency: Maximum number of calls to the wrapped embeddings at once.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = 1,
+    ) -> None:
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1. Got {batch_size}")
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1. Got {max_concurrency}"
+            )
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = self._split(texts)
+        if len(batches) == 1:
+            return self._check(batches, [self.embeddings.embed_documents(texts)])
+        if self.max_concurrency == 1:
+            results = [self.embeddings.embed_documents(b) for b in batches]
+        else:
+            with cf.ThreadPoolExecutor(
+                min(self.max_concurrency, len(batches))
+            ) as executor:
+                results = list(executor.map(self.embeddings.embed_documents, batches))
+        return self._check(batches, results)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = self._split(texts)
+        if len(batches) == 1:
+            return self._check(batches, [await self.embeddings.aembed_documents(texts)])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch)
+
+        results = await asyncio.gather(*(embed(b) for b in batches))
+        return self._check(batches, results)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.embeddings.aembed_query(text)
+
+    def _split(self, texts: list[str]) -> list[list[str]]:
+        if not self.batch_size or len(texts) <= self.batch_size:
+            return [texts]
+        return [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+
+    def _check(
+        self, batches: list[list[str]], results: Sequence[list[list[float]]]
+    ) -> list[list[float]]:
+        """Concatenate the embeddings of the batches, checking there is one per
+        text."""
+        for batch, vectors in zip(batches, results, strict=True):
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} embeddings, got {len(vectors)}"
+                )
+        if len(results) == 1:
+            return results[0]
+        return list(itertools.chain.from_iterable(results))
+
+
 def get_text_at_path(obj: Any, path: str | list[str]) -> list[str]:
     """Extract text from an object using a path expression or pre-tokenized path.
 
@@ -416,6 +778,124 @@ def _is_async_callable(
     )
 
 
+def _hash_text(kind: str, text: str) -> bytes:
+    return hashlib.blake2b(
+        f"{kind}:{text}".encode(errors="surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _get_model_id(embeddings: Embeddings) -> str | None:
+    """ID of the model of the embeddings, or None for lambdas and partials, whose
+    names are shared by unrelated functions."""
+    if isinstance(embeddings, (CachedEmbeddings, BatchedEmbeddings)):
+        # wrappers embed texts the same way as the embeddings they wrap
+        return _get_model_id(embeddings.embeddings)
+    cls = type(embeddings)
+    for attr in ("model", "model_name", "model_id"):
+        if isinstance(name := getattr(embeddings, attr, None), str):
+            return f"{cls.__module__}.{cls.__qualname__}:{name}"
+    if isinstance(embeddings, EmbeddingsLambda):
+        func = getattr(embeddings, "func", None) or getattr(embeddings, "afunc", None)
+        qualname = getattr(func, "__qualname__", None)
+        if qualname is None or qualname.endswith("<lambda>"):
+            return None
+        return f"{func.__module__}.{qualname}"
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _get_func_name(embeddings: Embeddings) -> str:
+    """Name of the function the embeddings wrap, or of their class."""
+    if isinstance(embeddings, (CachedEmbeddings, BatchedEmbeddings)):
+        return _get_func_name(embeddings.embeddings)
+    func = getattr(embeddings, "func", None) or getattr(embeddings, "afunc", None)
+    if func is None:
+        func = type(embeddings)
+    return f"{func.__module__}.{getattr(func, '__qualname__', type(func).__name__)}"
+
+
+def _get_index_id(embeddings: Embeddings, dims: int | None) -> str:
+    """ID of the vectors of an index, which changes with the model or dimensions."""
+    model_id = _get_model_id(embeddings) or _get_func_name(embeddings)
+    return f"{model_id}:{dims}"
+
+
+def _get_indexed_texts(
+    value: dict[str, Any], fields: Sequence[tuple[str, str | list[str]]]
+) -> list[tuple[str, str]]:
+    """Return the (field name, text) pairs to embed for a value, as stored by puts."""
+    indexed = []
+    for path, tokenized_path in fields:
+        texts = get_text_at_path(value, tokenized_path)
+        for i, text in enumerate(texts):
+            indexed.append((f"{path}.{i}" if len(texts) > 1 else path, text))
+    return indexed
+
+
+def _reindex_batches(
+    reindex: Callable[[list[T]], int],
+    items: Iterable[T],
+    batch_size: int,
+    max_concurrency: int,
+) -> int:
+    """Reindex batches of items, with up to max_concurrency batches at once.
+
+    Returns the total returned by `reindex` for all batches.
+    """
+    it = iter(items)
+    batches = iter(lambda: list(itertools.islice(it, batch_size)), [])
+    if max_concurrency <= 1:
+        return sum(map(reindex, batches))
+    total = 0
+    with cf.ThreadPoolExecutor(max_concurrency) as executor:
+        pending: set[cf.Future[int]] = set()
+        for batch in batches:
+            if len(pending) >= max_concurrency:
+                done, pending = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+                total += sum(fut.result() for fut in done)
+            pending.add(executor.submit(reindex, batch))
+        total += sum(fut.result() for fut in cf.as_completed(pending))
+    return total
+
+
+async def _areindex_batches(
+    reindex: Callable[[list[T]], Coroutine[Any, Any, int]],
+    items: AsyncIterator[T],
+    batch_size: int,
+    max_concurrency: int,
+) -> int:
+    """Reindex batches of items, with up to max_concurrency batches at once.
+
+    Returns the total returned by `reindex` for all batches.
+    """
+    total = 0
+    pending: set[asyncio.Task[int]] = set()
+
+    async def submit(batch: list[T]) -> None:
+        nonlocal total, pending
+        if len(pending) >= max(max_concurrency, 1):
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            total += sum(task.result() for task in done)
+        pending.add(asyncio.create_task(reindex(batch)))
+
+    try:
+        batch: list[T] = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                await submit(batch)
+                batch = []
+        if batch:
+            await submit(batch)
+        total += sum(await asyncio.gather(*pending))
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+    return total
+
+
 @functools.lru_cache
 def _get_init_embeddings() -> Callable[[str], Embeddings] | None:
     try:
@@ -430,4 +910,8 @@ __all__ = [
     "ensure_embeddings",
     "EmbeddingsFunc",
     "AEmbeddingsFunc",
+    "EmbeddingsCache",
+    "EmbeddingsCacheStats",
+    "CachedEmbeddings",
+    "BatchedEmbeddings",
 ]
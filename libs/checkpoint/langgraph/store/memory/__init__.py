@@ -102,11 +102,16 @@ Tip:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import concurrent.futures as cf
 import functools
+import heapq
+import itertools
 import logging
+import threading
+import time
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
 from datetime import datetime, timezone
 from importlib import util
 from typing import Any
@@ -125,10 +130,18 @@ from langgraph.store.base import (
     Result,
     SearchItem,
     SearchOp,
+    TTLConfig,
     ensure_embeddings,
     get_text_at_path,
     tokenize_path,
 )
+from langgraph.store.base.embed import (
+    _areindex_batches,
+    _get_index_id,
+    _get_indexed_texts,
+    _hash_text,
+    _reindex_batches,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +175,10 @@ class InMemoryStore(BaseStore):
         when creating the store. Without this configuration, all `index` arguments passed to
         `put` or `aput`will have no effect.
 
+    Note:
+        Items put with a TTL are deleted by `sweep_ttl`, which can be run periodically
+        in a background thread with `start_ttl_sweeper`.
+
     Warning:
         This store keeps all data in memory. Data is lost when the process exits.
         For persistence, use a database-backed store like PostgresStore.
@@ -176,11 +193,26 @@ class InMemoryStore(BaseStore):
     __slots__ = (
         "_data",
         "_vectors",
+        "_hashes",
+        "_namespaces",
+        "_index",
+        "_filters",
+        "_expiry",
+        "_expiry_heap",
+        "_lock",
+        "_ttl_sweeper_thread",
+        "_ttl_stop_event",
         "index_config",
         "embeddings",
+        "ttl_config",
     )
 
-    def __init__(self, *, index: IndexConfig | None = None) -> None:
+    supports_ttl = True
+    supports_cursor = True
+
+    def __init__(
+        self, *, index: IndexConfig | None = None, ttl: TTLConfig | None = None
+    ) -> None:
         # Both _data and _vectors are wrapped in the In-memory API
         # Do not change their names
         self._data: dict[tuple[str, ...], dict[str, Item]] = defaultdict(dict)
@@ -188,11 +220,30 @@ class InMemoryStore(BaseStore):
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        # (ns, key) -> path -> hash of the embedded text and of the index ID
+        self._hashes: dict[tuple[tuple[str, ...], str], dict[str, bytes]] = {}
+        self._namespaces = _NamespaceIndex()
+        # built from _vectors on the first search
+        self._index: _VectorIndex | None = None
+        # indexes of the filter_fields, built on the first filtered search
+        self._filters: dict[str, _FieldIndex] | None = None
+        # (ns, key) -> (expiry timestamp, TTL in minutes), for items with a TTL
+        self._expiry: dict[tuple[tuple[str, ...], str], tuple[float, float]] = {}
+        # heap of (expiry timestamp, ns, key), entries replaced in _expiry are stale
+        self._expiry_heap: list[tuple[float, tuple[str, ...], str]] = []
+        # held while reading or modifying the data, which the TTL sweeper deletes
+        self._lock = threading.Lock()
+        self._ttl_sweeper_thread: threading.Thread | None = None
+        self._ttl_stop_event = threading.Event()
+        self.ttl_config = ttl
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
             self.embeddings: Embeddings | None = ensure_embeddings(
                 self.index_config.get("embed"),
+                cache=self.index_config.get("cache"),
+                batch_size=self.index_config.get("embed_batch_size"),
+                max_concurrency=self.index_config.get("embed_concurrency"),
             )
             self.index_config["__tokenized_fields"] = [
                 (p, tokenize_path(p)) if p != "$" else (p, p)
@@ -206,38 +257,325 @@ class InMemoryStore(BaseStore):
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         # The batch/abatch methods are treated as internal.
         # Users should access via put/search/get/list_namespaces/etc.
-        results, put_ops, search_ops = self._prepare_ops(ops)
+        with self._lock:
+            results, put_ops, search_ops = self._prepare_ops(ops)
         if search_ops:
             queryinmem_store = self._embed_search_queries(search_ops)
-            self._batch_search(search_ops, queryinmem_store, results)
+            with self._lock:
+                self._batch_search(search_ops, queryinmem_store, results)
 
         to_embed = self._extract_texts(put_ops)
+        embeddings = None
         if to_embed and self.index_config and self.embeddings:
             embeddings = self.embeddings.embed_documents(list(to_embed))
-            self._insertinmem_store(to_embed, embeddings)
-        self._apply_put_ops(put_ops)
+        with self._lock:
+            if embeddings is not None:
+                self._insertinmem_store(to_embed, embeddings)
+            self._apply_put_ops(put_ops)
         return results
 
     async def abatch(self, ops: Iterable[Op]) -> list[Result]:
         # The batch/abatch methods are treated as internal.
         # Users should access via put/search/get/list_namespaces/etc.
-        results, put_ops, search_ops = self._prepare_ops(ops)
+        with self._lock:
+            results, put_ops, search_ops = self._prepare_ops(ops)
         if search_ops:
             queryinmem_store = await self._aembed_search_queries(search_ops)
-            self._batch_search(search_ops, queryinmem_store, results)
+            with self._lock:
+                self._batch_search(search_ops, queryinmem_store, results)
 
         to_embed = self._extract_texts(put_ops)
+        embeddings = None
         if to_embed and self.index_config and self.embeddings:
             embeddings = await self.embeddings.aembed_documents(list(to_embed))
-            self._insertinmem_store(to_embed, embeddings)
-        self._apply_put_ops(put_ops)
+        with self._lock:
+            if embeddings is not None:
+                self._insertinmem_store(to_embed, embeddings)
+            self._apply_put_ops(put_ops)
         return results
 
+    def reindex(
+        self,
+        namespace_prefix: tuple[str, ...] = (),
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+        force: bool = False,
+    ) -> int:
+        """Re-embed the fields of items whose text or embedding model changed.
+
+        Run after changing the `fields` or the embedding model of the index config.
+        Items are read in batches, and only the fields whose text, or the model that
+        embedded it, changed since they were embedded are embedded again. Vectors of
+        fields that are no longer indexed are removed. An interrupted reindex can be
+        resumed by running it again, as the fields already reindexed are skipped.
+
+        Note:
+            The `fields` of the index config apply to all the items reindexed,
+            including items put with a custom `index`.
+
+            Embedding functions are identified by name, so a function that starts
+            calling another model is not seen as a model change. Reindex with
+            `force=True` to embed every field again in that case.
+
+        Args:
+            namespace_prefix: Prefix of the namespaces of the items to reindex.
+                Defaults to all items.
+            batch_size: Number of items read and embedded at once.
+            max_concurrency: Maximum number of batches embedded at once.
+            force: Whether to embed every field again, even those whose text and
+                embedding model did not change.
+
+        Returns:
+            int: The number of texts embedded.
+        """
+        if not self.index_config or not self.embeddings:
+            raise ValueError("Reindexing requires an index configuration.")
+        items = self.search_iter(
+            namespace_prefix, page_size=batch_size, refresh_ttl=False
+        )
+        return _reindex_batches(
+            functools.partial(self._reindex, force=force),
+            items,
+            batch_size,
+            max_concurrency,
+        )
+
+    async def areindex(
+        self,
+        namespace_prefix: tuple[str, ...] = (),
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+        force: bool = False,
+    ) -> int:
+        """Asynchronously re-embed the fields of items whose text or embedding model
+        changed.
+
+        See `reindex` for details.
+
+        Args:
+            namespace_prefix: Prefix of the namespaces of the items to reindex.
+                Defaults to all items.
+            batch_size: Number of items read and embedded at once.
+            max_concurrency: Maximum number of batches embedded at once.
+            force: Whether to embed every field again, even those whose text and
+                embedding model did not change.
+
+        Returns:
+            int: The number of texts embedded.
+        """
+        if not self.index_config or not self.embeddings:
+            raise ValueError("Reindexing requires an index configuration.")
+        items = self.asearch_iter(
+            namespace_prefix, page_size=batch_size, refresh_ttl=False
+        )
+        return await _areindex_batches(
+            functools.partial(self._areindex, force=force),
+            items,
+            batch_size,
+            max_concurrency,
+        )
+
+    def _reindex(self, items: list[SearchItem], force: bool = False) -> int:
+        to_embed, stored = self._get_reindex_texts(items, force)
+        if to_embed and self.embeddings:
+            embeddings = self.embeddings.embed_documents(list(to_embed))
+            with self._lock:
+                self._insertinmem_store(to_embed, embeddings, stored)
+        return len(to_embed)
+
+    async def _areindex(self, items: list[SearchItem], force: bool = False) -> int:
+        to_embed, stored = self._get_reindex_texts(items, force)
+        if to_embed and self.embeddings:
+            embeddings = await self.embeddings.aembed_documents(list(to_embed))
+            with self._lock:
+                self._insertinmem_store(to_embed, embeddings, stored)
+        return len(to_embed)
+
+    def _get_reindex_texts(
+        self, items: list[SearchItem], force: bool = False
+    ) -> tuple[
+        dict[str, list[tuple[tuple[str, ...], str, str]]],
+        dict[tuple[tuple[str, ...], str], Item],
+    ]:
+        """Return the texts to embed again, and the items they were read from.
+
+        Vectors of the fields that are no longer indexed are removed.
+        """
+        assert self.index_config is not None and self.embeddings is not None
+        index_id = _get_index_id(self.embeddings, self.index_config.get("dims"))
+        to_embed: dict[str, list[tuple[tuple[str, ...], str, str]]] = defaultdict(list)
+        stored: dict[tuple[tuple[str, ...], str], Item] = {}
+        with self._lock:
+            for item in items:
+                ns, key = item.namespace, item.key
+                if (current := self._data.get(ns, {}).get(key)) is None:
+                    continue
+                stored[(ns, key)] = current
+                texts = dict(
+                    _get_indexed_texts(
+                        current.value, self.index_config["__tokenized_fields"]
+                    )
+                )
+                for path in list(self._vectors.get(ns, {}).get(key, ())):
+                    if path not in texts:
+                        self._remove_vector(ns, key, path)
+                hashes = self._hashes.get((ns, key), {})
+                for path, text in texts.items():
+                    if force or hashes.get(path) != _hash_text(index_id, text):
+                        to_embed[text].append((ns, key, path))
+        return to_embed, stored
+
+    def sweep_ttl(self, *, batch_size: int | None = None) -> int:
+        """Delete expired store items based on TTL.
+
+        Args:
+            batch_size: Maximum number of items deleted while holding the store's
+                lock. Defaults to the `sweep_batch_size` of the TTL config, or 1000.
+
+        Returns:
+            int: The number of deleted items.
+        """
+        return sum(self.sweep_ttl_batches(batch_size=batch_size))
+
+    def sweep_ttl_batches(self, *, batch_size: int | None = None) -> Iterator[int]:
+        """Delete expired store items in batches, oldest first.
+
+        The store's lock is released between batches, so other operations are not
+        blocked while a large number of expired items is deleted.
+
+        Args:
+            batch_size: Maximum number of items deleted per batch. Defaults to the
+                `sweep_batch_size` of the TTL config, or 1000.
+
+        Yields:
+            int: The number of items deleted by each batch.
+        """
+        batch_size = (
+            batch_size or (self.ttl_config or {}).get("sweep_batch_size") or 1000
+        )
+        now = time.time()
+        while True:
+            deleted = 0
+            with self._lock:
+                while (
+                    deleted < batch_size
+                    and self._expiry_heap
+                    and self._expiry_heap[0][0] <= now
+                ):
+                    expires_at, namespace, key = heapq.heappop(self._expiry_heap)
+                    expiry = self._expiry.get((namespace, key))
+                    if expiry is None or expiry[0] != expires_at:
+                        # the TTL was refreshed or removed since
+                        continue
+                    self._delete(namespace, key)
+                    deleted += 1
+            if deleted:
+                yield deleted
+            if deleted < batch_size:
+                return
+
+    def start_ttl_sweeper(
+        self, sweep_interval_minutes: int | None = None
+    ) -> cf.Future[None]:
+        """Periodically delete expired store items based on TTL.
+
+        Returns:
+            Future that can be waited on or cancelled.
+        """
+        if not self.ttl_config:
+            future: cf.Future[None] = cf.Future()
+            future.set_result(None)
+            return future
+
+        if self._ttl_sweeper_thread and self._ttl_sweeper_thread.is_alive():
+            logger.info("TTL sweeper thread is already running")
+            # Return a future that can be used to cancel the existing thread
+            future = cf.Future()
+            future.add_done_callback(
+                lambda f: self._ttl_stop_event.set() if f.cancelled() else None
+            )
+            return future
+
+        self._ttl_stop_event.clear()
+
+        interval = float(
+            sweep_interval_minutes or self.ttl_config.get("sweep_interval_minutes") or 5
+        )
+        logger.info(f"Starting store TTL sweeper with interval {interval} minutes")
+
+        future = cf.Future()
+
+        def _sweep_loop() -> None:
+            try:
+                while not self._ttl_stop_event.is_set():
+                    if self._ttl_stop_event.wait(interval * 60):
+                        break
+
+                    try:
+                        expired_items = 0
+                        for deleted in self.sweep_ttl_batches():
+                            expired_items += deleted
+                            logger.debug(f"Store swept {deleted} expired items")
+                            if self._ttl_stop_event.is_set():
+                                break
+                        if expired_items > 0:
+                            logger.info(f"Store swept {expired_items} expired items")
+                    except Exception as exc:
+                        logger.exception(
+                            "Store TTL sweep iteration failed", exc_info=exc
+                        )
+                future.set_result(None)
+            except Exception as exc:
+                future.set_exception(exc)
+
+        thread = threading.Thread(target=_sweep_loop, daemon=True, name="ttl-sweeper")
+        self._ttl_sweeper_thread = thread
+        thread.start()
+
+        future.add_done_callback(
+            lambda f: self._ttl_stop_event.set() if f.cancelled() else None
+        )
+        return future
+
+    def stop_ttl_sweeper(self, timeout: float | None = None) -> bool:
+        """Stop the TTL sweeper thread if it's running.
+
+        Args:
+            timeout: Maximum time to wait for the thread to stop, in seconds.
+                If `None`, wait indefinitely.
+
+        Returns:
+            bool: True if the thread was successfully stopped or wasn't running,
+                False if the timeout was reached before the thread stopped.
+        """
+        if not self._ttl_sweeper_thread or not self._ttl_sweeper_thread.is_alive():
+            return True
+
+        logger.info("Stopping TTL sweeper thread")
+        self._ttl_stop_event.set()
+
+        self._ttl_sweeper_thread.join(timeout)
+        success = not self._ttl_sweeper_thread.is_alive()
+
+        if success:
+            self._ttl_sweeper_thread = None
+            logger.info("TTL sweeper thread stopped")
+        else:
+            logger.warning("Timed out waiting for TTL sweeper thread to stop")
+
+        return success
+
+    def __del__(self) -> None:
+        """Ensure the TTL sweeper thread is stopped when the object is garbage collected."""
+        if hasattr(self, "_ttl_stop_event") and hasattr(self, "_ttl_sweeper_thread"):
+            self.stop_ttl_sweeper(timeout=0.1)
+
     # Helpers
 
-    def _filter_items(self, op: SearchOp) -> list[tuple[Item, list[list[float]]]]:
-        """Filter items by namespace and filter function, return items with their embeddings."""
-        namespace_prefix = op.namespace_prefix
+    def _filter_items(self, op: SearchOp) -> list[Item]:
+        """Filter items by namespace and filter function."""
 
         def filter_func(item: Item) -> bool:
             if not op.filter:
@@ -248,26 +586,91 @@ class InMemoryStore(BaseStore):
                 for key, filter_value in op.filter.items()
             )
 
-        filtered = []
-        for namespace in self._data:
-            if not (
-                namespace[: len(namespace_prefix)] == namespace_prefix
-                if len(namespace) >= len(namespace_prefix)
-                else False
+        filtered: list[Item] = []
+        namespaces = self._namespace_index()
+        if op.after is not None and not op.query:
+            # keyset pagination, in (namespace, key) order
+            after_namespace, after_key = op.after
+            depth = len(op.namespace_prefix)
+            first = (
+                [after_namespace]
+                if after_namespace[:depth] == op.namespace_prefix
+                and after_namespace in self._data
+                else []
+            )
+            for namespace in itertools.chain(
+                first,
+                namespaces.list([op.namespace_prefix], [], None, after=after_namespace),
             ):
-                continue
-
-            for key, item in self._data[namespace].items():
-                if filter_func(item):
-                    if op.query and (embeddings := self._vectors[namespace].get(key)):
-                        filtered.append((item, list(embeddings.values())))
-                    else:
-                        filtered.append((item, []))
+                items = self._data[namespace]
+                for key in sorted(items):
+                    if namespace == after_namespace and key <= after_key:
+                        continue
+                    if filter_func(items[key]):
+                        filtered.append(items[key])
+                        if len(filtered) == op.offset + op.limit:
+                            return filtered
+            return filtered
+        if op.filter and (refs := self._lookup_filter(op.filter)) is not None:
+            depth = len(op.namespace_prefix)
+            for namespace, key in refs:
+                if namespace[:depth] != op.namespace_prefix:
+                    continue
+                item = self._data[namespace].get(key)
+                if item is not None and filter_func(item):
+                    filtered.append(item)
+            return filtered
+        for namespace in namespaces.under(op.namespace_prefix):
+            items = self._data[namespace].values()
+            if op.filter:
+                filtered.extend(item for item in items if filter_func(item))
+            else:
+                filtered.extend(items)
         return filtered
 
+    def _namespace_index(self) -> _NamespaceIndex:
+        if len(self._namespaces) != len(self._data):
+            # _data was modified directly, eg. restored from a file
+            self._namespaces = _NamespaceIndex(self._data)
+            self._index = None
+            self._filters = None
+        return self._namespaces
+
+    def _filter_indexes(self) -> dict[str, _FieldIndex]:
+        if self._filters is None:
+            fields = (self.index_config or {}).get("filter_fields") or []
+            self._filters = {field: _FieldIndex(field) for field in fields}
+            for namespace, items in self._data.items():
+                for key, item in items.items():
+                    for index in self._filters.values():
+                        index.add(namespace, key, item.value)
+        return self._filters
+
+    def _lookup_filter(
+        self, conditions: dict[str, Any]
+    ) -> Iterable[tuple[tuple[str, ...], str]] | None:
+        """Return the (namespace, key) of the items that may match the filter,
+        from the smallest lookup in the indexes of its fields, if any applies."""
+        best: Collection[tuple[tuple[str, ...], str]] | None = None
+        indexes = self._filter_indexes()
+        for field, condition in conditions.items():
+            if (index := indexes.get(field)) is None:
+                continue
+            refs = index.lookup(condition)
+            if refs is not None and (best is None or len(refs) < len(best)):
+                best = refs
+        return best
+
+    def _vector_index(self) -> _VectorIndex | None:
+        if not _check_numpy():
+            return None
+        if self._index is None:
+            self._index = _VectorIndex(self._vectors)
+        return self._index
+
     def _embed_search_queries(
         self,
-        search_ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        search_ops: dict[int, tuple[SearchOp, list[Item]]],
     ) -> dict[str, list[float]]:
         queryinmem_store = {}
         if self.index_config and self.embeddings and search_ops:
@@ -286,7 +689,7 @@ class InMemoryStore(BaseStore):
 
     async def _aembed_search_queries(
         self,
-        search_ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        search_ops: dict[int, tuple[SearchOp, list[Item]]],
     ) -> dict[str, list[float]]:
         queryinmem_store = {}
         if self.index_config and self.embeddings and search_ops:
@@ -301,92 +704,146 @@ class InMemoryStore(BaseStore):
 
     def _batch_search(
         self,
-        ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        ops: dict[int, tuple[SearchOp, list[Item]]],
         queryinmem_store: dict[str, list[float]],
         results: list[Result],
     ) -> None:
         """Perform batch similarity search for multiple queries."""
+        to_score = {
+            i: (op, candidates)
+            for i, (op, candidates) in ops.items()
+            if op.query and queryinmem_store and candidates
+        }
+        scored: dict[int, list[tuple[float | None, Item]]] = {}
+        if to_score:
+            if (index := self._vector_index()) is not None:
+                scored = self._score_with_index(index, to_score, queryinmem_store)
+            else:
+                scored = {
+                    i: self._score_candidates(op, candidates, queryinmem_store)
+                    for i, (op, candidates) in to_score.items()
+                }
         for i, (op, candidates) in ops.items():
-            if not candidates:
-                results[i] = []
-                continue
-            if op.query and queryinmem_store:
-                query_embedding = queryinmem_store[op.query]
-                flat_items, flat_vectors = [], []
-                scoreless = []
-                for item, vectors in candidates:
-                    for vector in vectors:
-                        flat_items.append(item)
-                        flat_vectors.append(vector)
-                    if not vectors:
-                        scoreless.append(item)
-
-                scores = _cosine_similarity(query_embedding, flat_vectors)
-                sorted_results = sorted(
-                    zip(scores, flat_items, strict=False),
-                    key=lambda x: x[0],
-                    reverse=True,
+            if i in scored:
+                kept = scored[i]
+            else:
+                kept = [
+                    (None, item)
+                    for item in candidates[op.offset : op.offset + op.limit]
+                ]
+            if op.refresh_ttl and self._refresh_on_read():
+                for _, item in kept:
+                    self._refresh_ttl(item.namespace, item.key)
+            results[i] = [
+                SearchItem(
+                    namespace=item.namespace,
+                    key=item.key,
+                    value=item.value,
+                    created_at=item.created_at,
+                    updated_at=item.updated_at,
+                    score=float(score) if score is not None else None,
                 )
-                # max pooling
-                seen: set[tuple[tuple[str, ...], str]] = set()
-                kept: list[tuple[float | None, Item]] = []
-                for score, item in sorted_results:
-                    key = (item.namespace, item.key)
-                    if key in seen:
-                        continue
-                    ix = len(seen)
-                    seen.add(key)
-                    if ix >= op.offset + op.limit:
-                        break
-                    if ix < op.offset:
-                        continue
+                for score, item in kept
+            ]
 
-                    kept.append((score, item))
-                if scoreless and len(kept) < op.limit:
-                    # Corner case: if we request more items than what we have embedded,
-                    # fill the rest with non-scored items
-                    kept.extend(
-                        (None, item) for item in scoreless[: op.limit - len(kept)]
-                    )
+    def _score_with_index(
+        self,
+        index: _VectorIndex,
+        ops: dict[int, tuple[SearchOp, list[Item]]],
+        queryinmem_store: dict[str, list[float]],
+    ) -> dict[int, list[tuple[float | None, Item]]]:
+        """Score all queries against the candidate vectors with one matrix product."""
+        import numpy as np
 
-                results[i] = [
-                    SearchItem(
-                        namespace=item.namespace,
-                        key=item.key,
-                        value=item.value,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at,
-                        score=float(score) if score is not None else None,
-                    )
-                    for score, item in kept
-                ]
+        queries = list({op.query: None for op, _ in ops.values() if op.query})
+        columns = {query: j for j, query in enumerate(queries)}
+        # rows of the candidate vectors of each search, None for all of them
+        rows: dict[int, Any] = {}
+        scoreless: dict[int, Callable[[], list[Item]]] = {}
+        for i, (op, candidates) in ops.items():
+            if op.filter or op.namespace_prefix:
+                rows[i], no_vectors = index.rows_of(candidates)
+                scoreless[i] = functools.partial(list, no_vectors)
             else:
-                results[i] = [
-                    SearchItem(
-                        namespace=item.namespace,
-                        key=item.key,
-                        value=item.value,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at,
+                rows[i] = None
+                scoreless[i] = functools.partial(index.without_vectors, candidates)
+        if any(r is None for r in rows.values()):
+            subset = None
+        else:
+            subset = np.unique(np.concatenate(list(rows.values())))
+        scores = index.score([queryinmem_store[q] for q in queries], subset)
+
+        scored: dict[int, list[tuple[float | None, Item]]] = {}
+        for i, (op, _) in ops.items():
+            assert op.query is not None
+            column = columns[op.query]
+            op_rows = rows[i]
+            if op_rows is None:
+                op_scores = scores[column]
+            elif subset is None:
+                op_scores = scores[column, op_rows]
+            else:
+                op_scores = scores[column, np.searchsorted(subset, op_rows)]
+            ranked = (
+                (float(op_scores[pos]), item)
+                for pos in _ranked(op_scores, op.offset + op.limit)
+                if (
+                    item := self._get_item(
+                        index.keys[pos if op_rows is None else op_rows[pos]]
                     )
-                    for (item, _) in candidates[op.offset : op.offset + op.limit]
-                ]
+                )
+                is not None
+            )
+            scored[i] = _max_pool(op, ranked, scoreless[i])
+        return scored
+
+    def _score_candidates(
+        self,
+        op: SearchOp,
+        candidates: list[Item],
+        queryinmem_store: dict[str, list[float]],
+    ) -> list[tuple[float | None, Item]]:
+        """Score a query against the candidate vectors in pure Python."""
+        assert op.query is not None
+        flat_items, flat_vectors = [], []
+        scoreless = []
+        for item in candidates:
+            vectors = self._vectors.get(item.namespace, {}).get(item.key)
+            if vectors:
+                for vector in vectors.values():
+                    flat_items.append(item)
+                    flat_vectors.append(vector)
+            else:
+                scoreless.append(item)
+
+        scores = _cosine_similarity(queryinmem_store[op.query], flat_vectors)
+        sorted_results = sorted(
+            zip(scores, flat_items, strict=False),
+            key=lambda x: x[0],
+            reverse=True,
+        )
+        return _max_pool(op, sorted_results, lambda: scoreless)
+
+    def _get_item(self, key: tuple[tuple[str, ...], str, str]) -> Item | None:
+        items = self._data.get(key[0])
+        return items.get(key[1]) if items else None
 
     def _prepare_ops(
         self, ops: Iterable[Op]
     ) -> tuple[
         list[Result],
         dict[tuple[tuple[str, ...], str], PutOp],
-        dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        dict[int, tuple[SearchOp, list[Item]]],
     ]:
         results: list[Result] = []
         put_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
-        search_ops: dict[
-            int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]
-        ] = {}
+        search_ops: dict[int, tuple[SearchOp, list[Item]]] = {}
         for i, op in enumerate(ops):
             if isinstance(op, GetOp):
-                item = self._data[op.namespace].get(op.key)
+                items = self._data.get(op.namespace)
+                item = items.get(op.key) if items else None
+                if item is not None and op.refresh_ttl and self._refresh_on_read():
+                    self._refresh_ttl(op.namespace, op.key)
                 results.append(item)
             elif isinstance(op, SearchOp):
                 search_ops[i] = (op, self._filter_items(op))
@@ -402,11 +859,13 @@ class InMemoryStore(BaseStore):
         return results, put_ops, search_ops
 
     def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
+        namespaces = self._namespace_index()
         for (namespace, key), op in put_ops.items():
             if op.value is None:
-                self._data[namespace].pop(key, None)
-                self._vectors[namespace].pop(key, None)
+                self._delete(namespace, key)
             else:
+                if namespace not in self._data:
+                    namespaces.add(namespace)
                 self._data[namespace][key] = Item(
                     value=op.value,
                     key=key,
@@ -414,6 +873,48 @@ class InMemoryStore(BaseStore):
                     created_at=datetime.now(timezone.utc),
                     updated_at=datetime.now(timezone.utc),
                 )
+                if self._filters:
+                    for index in self._filters.values():
+                        index.add(namespace, key, op.value)
+                if op.ttl is None:
+                    self._expiry.pop((namespace, key), None)
+                else:
+                    self._set_ttl(namespace, key, op.ttl)
+
+    def _delete(self, namespace: tuple[str, ...], key: str) -> None:
+        self._expiry.pop((namespace, key), None)
+        if (items := self._data.get(namespace)) is None:
+            return
+        items.pop(key, None)
+        self._vectors[namespace].pop(key, None)
+        self._hashes.pop((namespace, key), None)
+        if self._index is not None:
+            self._index.remove(namespace, key)
+        if self._filters:
+            for index in self._filters.values():
+                index.remove(namespace, key)
+        if not items:
+            del self._data[namespace]
+            self._vectors.pop(namespace, None)
+            self._namespace_index().remove(namespace)
+
+    def _refresh_on_read(self) -> bool:
+        return bool(self.ttl_config and self.ttl_config.get("refresh_on_read", False))
+
+    def _refresh_ttl(self, namespace: tuple[str, ...], key: str) -> None:
+        if (expiry := self._expiry.get((namespace, key))) is not None:
+            self._set_ttl(namespace, key, expiry[1])
+
+    def _set_ttl(self, namespace: tuple[str, ...], key: str, ttl: float) -> None:
+        expires_at = time.time() + ttl * 60
+        self._expiry[(namespace, key)] = (expires_at, ttl)
+        heapq.heappush(self._expiry_heap, (expires_at, namespace, key))
+        if len(self._expiry_heap) > 2 * len(self._expiry) + 64:
+            # drop the stale entries left by refreshes
+            self._expiry_heap = [
+                (at, ns, k) for (ns, k), (at, _) in self._expiry.items()
+            ]
+            heapq.heapify(self._expiry_heap)
 
     def _extract_texts(
         self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]
@@ -447,33 +948,437 @@ class InMemoryStore(BaseStore):
         self,
         to_embed: dict[str, list[tuple[tuple[str, ...], str, str]]],
         embeddings: list[list[float]],
+        stored: Mapping[tuple[tuple[str, ...], str], Item] | None = None,
     ) -> None:
-        indices = [index for indices in to_embed.values() for index in indices]
-        if len(indices) != len(embeddings):
+        """Insert the embeddings of the texts at their (namespace, key, path).
+
+        If `stored` is given, the vectors of items put or deleted since they were
+        read are not inserted.
+        """
+        if len(to_embed) != len(embeddings):
             raise ValueError(
                 f"Number of embeddings ({len(embeddings)}) does not"
-                f" match number of indices ({len(indices)})"
+                f" match number of texts ({len(to_embed)})"
             )
-        for embedding, (ns, key, path) in zip(embeddings, indices, strict=False):
-            self._vectors[ns][key][path] = embedding
+        assert self.index_config is not None and self.embeddings is not None
+        index_id = _get_index_id(self.embeddings, self.index_config.get("dims"))
+        for (text, indices), embedding in zip(
+            to_embed.items(), embeddings, strict=True
+        ):
+            text_hash = _hash_text(index_id, text)
+            for ns, key, path in indices:
+                if (
+                    stored is not None
+                    and self._data.get(ns, {}).get(key) is not stored[(ns, key)]
+                ):
+                    continue
+                self._vectors[ns][key][path] = embedding
+                self._hashes.setdefault((ns, key), {})[path] = text_hash
+                if self._index is not None:
+                    self._index.set(ns, key, path, embedding)
+
+    def _remove_vector(self, namespace: tuple[str, ...], key: str, path: str) -> None:
+        vectors = self._vectors[namespace][key]
+        vectors.pop(path, None)
+        if not vectors:
+            del self._vectors[namespace][key]
+        if (hashes := self._hashes.get((namespace, key))) is not None:
+            hashes.pop(path, None)
+        if self._index is not None:
+            self._index.remove(namespace, key, path)
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
-        all_namespaces = list(
-            self._data.keys()
-        )  # Avoid collection size changing while iterating
-        namespaces = all_namespaces
-        if op.match_conditions:
-            namespaces = [
-                ns
-                for ns in namespaces
-                if all(_does_match(condition, ns) for condition in op.match_conditions)
+        prefixes: list[tuple[str, ...]] = []
+        suffixes: list[MatchCondition] = []
+        for condition in op.match_conditions or ():
+            if condition.match_type == "prefix":
+                prefixes.append(tuple(condition.path))
+            elif condition.match_type == "suffix":
+                suffixes.append(condition)
+            else:
+                raise ValueError(f"Unsupported match type: {condition.match_type}")
+        namespaces = self._namespace_index().list(
+            prefixes, suffixes, op.max_depth, after=op.after
+        )
+        return list(itertools.islice(namespaces, op.offset, op.offset + op.limit))
+
+
+class _NamespaceNode:
+    __slots__ = ("children", "labels", "is_namespace")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _NamespaceNode] = {}
+        # sorted labels of the children, reset when they change
+        self.labels: list[str] | None = None
+        self.is_namespace = False
+
+    def sorted_labels(self) -> list[str]:
+        if self.labels is None:
+            self.labels = sorted(self.children)
+        return self.labels
+
+
+class _NamespaceIndex:
+    """Trie of the namespaces of a store, so that looking up the namespaces under a
+    prefix costs proportionally to the matching subtree, not to all namespaces."""
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, namespaces: Iterable[tuple[str, ...]] = ()) -> None:
+        self.root = _NamespaceNode()
+        self.size = 0
+        for namespace in namespaces:
+            self.add(namespace)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, namespace: tuple[str, ...]) -> None:
+        node = self.root
+        for label in namespace:
+            if (child := node.children.get(label)) is None:
+                child = node.children[label] = _NamespaceNode()
+                node.labels = None
+            node = child
+        if not node.is_namespace:
+            node.is_namespace = True
+            self.size += 1
+
+    def remove(self, namespace: tuple[str, ...]) -> None:
+        path = [self.root]
+        for label in namespace:
+            if (node := path[-1].children.get(label)) is None:
+                return
+            path.append(node)
+        if not path[-1].is_namespace:
+            return
+        path[-1].is_namespace = False
+        self.size -= 1
+        # prune the nodes left without namespaces
+        for depth in range(len(namespace), 0, -1):
+            node = path[depth]
+            if node.is_namespace or node.children:
+                break
+            parent = path[depth - 1]
+            del parent.children[namespace[depth - 1]]
+            parent.labels = None
+
+    def under(self, prefix: tuple[str, ...]) -> Iterator[tuple[str, ...]]:
+        """Yield the namespaces starting with `prefix`, in insertion order."""
+        node = self.root
+        for label in prefix:
+            if (child := node.children.get(label)) is None:
+                return
+            node = child
+        stack = [(prefix, node)]
+        while stack:
+            namespace, node = stack.pop()
+            if node.is_namespace:
+                yield namespace
+            stack.extend(
+                (namespace + (label,), child)
+                for label, child in reversed(node.children.items())
+            )
+
+    def list(
+        self,
+        prefixes: list[tuple[str, ...]],
+        suffixes: list[MatchCondition],
+        max_depth: int | None,
+        *,
+        after: tuple[str, ...] | None = None,
+    ) -> Iterator[tuple[str, ...]]:
+        """Yield the namespaces matching all conditions in sorted order, truncated
+        to `max_depth` and deduplicated, starting after the `after` namespace.
+
+        Prefix conditions (with wildcards) and `after` prune the branches visited,
+        suffix conditions are checked on the namespaces found.
+        """
+        min_depth = max(map(len, prefixes), default=0)
+
+        def visit(
+            namespace: tuple[str, ...], node: _NamespaceNode, max_depth: int | None
+        ) -> Iterator[tuple[str, ...]]:
+            depth = len(namespace)
+            if depth == max_depth:
+                # yield the truncated namespace if any namespace below matches
+                if (after is None or namespace > after) and next(
+                    visit(namespace, node, None), None
+                ) is not None:
+                    yield namespace
+                return
+            if (
+                node.is_namespace
+                and depth >= min_depth
+                and (after is None or namespace > after)
+                and all(_does_match(c, namespace) for c in suffixes)
+            ):
+                yield namespace
+            for label in node.sorted_labels():
+                child = namespace + (label,)
+                if after is not None and child < after[: depth + 1]:
+                    # the whole branch comes before the cursor
+                    continue
+                if all(len(p) <= depth or p[depth] in ("*", label) for p in prefixes):
+                    yield from visit(child, node.children[label], max_depth)
+
+        return visit((), self.root, max_depth)
+
+
+class _VectorIndex:
+    """Copy of the vectors of a store in a contiguous float32 matrix, with their
+    norms, so that queries are scored against many vectors with one product.
+
+    Removed rows are replaced by the last row to keep the matrix dense.
+    """
+
+    __slots__ = ("matrix", "norms", "size", "keys", "rows")
+
+    def __init__(
+        self,
+        vectors: Mapping[tuple[str, ...], Mapping[str, Mapping[str, list[float]]]],
+    ) -> None:
+        self.matrix: Any = None
+        self.norms: Any = None
+        self.size = 0
+        # row -> (namespace, key, path)
+        self.keys: list[tuple[tuple[str, ...], str, str]] = []
+        # (namespace, key) -> path -> row
+        self.rows: dict[tuple[tuple[str, ...], str], dict[str, int]] = {}
+        flat: list[list[float]] = []
+        for namespace, items in vectors.items():
+            for key, paths in items.items():
+                for path, vector in paths.items():
+                    self.rows.setdefault((namespace, key), {})[path] = len(flat)
+                    self.keys.append((namespace, key, path))
+                    flat.append(vector)
+        if flat:
+            import numpy as np
+
+            self.matrix = np.asarray(flat, dtype=np.float32)
+            self.norms = np.linalg.norm(self.matrix, axis=1)
+            self.size = len(flat)
+
+    def set(
+        self, namespace: tuple[str, ...], key: str, path: str, vector: list[float]
+    ) -> None:
+        import numpy as np
+
+        paths = self.rows.setdefault((namespace, key), {})
+        if (row := paths.get(path)) is None:
+            if self.matrix is None:
+                self.matrix = np.empty((16, len(vector)), dtype=np.float32)
+                self.norms = np.empty(16, dtype=np.float32)
+            elif self.size == len(self.matrix):
+                matrix = np.empty((2 * self.size, self.matrix.shape[1]), np.float32)
+                matrix[: self.size] = self.matrix
+                norms = np.empty(2 * self.size, dtype=np.float32)
+                norms[: self.size] = self.norms
+                self.matrix, self.norms = matrix, norms
+            row = paths[path] = self.size
+            self.keys.append((namespace, key, path))
+            self.size += 1
+        self.matrix[row] = vector
+        self.norms[row] = np.linalg.norm(self.matrix[row])
+
+    def remove(
+        self, namespace: tuple[str, ...], key: str, path: str | None = None
+    ) -> None:
+        """Remove the vector of a path of an item, or all its vectors by default."""
+        if path is None:
+            removed = list(self.rows.pop((namespace, key), {}).values())
+        else:
+            paths = self.rows.get((namespace, key), {})
+            removed = [paths.pop(path)] if path in paths else []
+            if not paths:
+                self.rows.pop((namespace, key), None)
+        # from the last row, so that rows moved are not removed afterwards
+        for row in sorted(removed, reverse=True):
+            last = self.size - 1
+            if row != last:
+                self.matrix[row] = self.matrix[last]
+                self.norms[row] = self.norms[last]
+                moved = self.keys[row] = self.keys[last]
+                self.rows[(moved[0], moved[1])][moved[2]] = row
+            self.keys.pop()
+            self.size -= 1
+
+    def rows_of(self, items: list[Item]) -> tuple[Any, list[Item]]:
+        """Return the rows of the vectors of the items, and the items without any."""
+        import numpy as np
+
+        rows: list[int] = []
+        scoreless: list[Item] = []
+        for item in items:
+            if paths := self.rows.get((item.namespace, item.key)):
+                rows.extend(paths.values())
+            else:
+                scoreless.append(item)
+        return np.array(rows, dtype=np.intp), scoreless
+
+    def without_vectors(self, items: list[Item]) -> list[Item]:
+        return [item for item in items if (item.namespace, item.key) not in self.rows]
+
+    def score(self, queries: list[list[float]], rows: Any = None) -> Any:
+        """Cosine similarity of each query with the vectors in `rows` (all by
+        default), as an array of shape (queries, rows)."""
+        import numpy as np
+
+        if self.matrix is None:
+            return np.zeros((len(queries), 0), dtype=np.float32)
+        if rows is None:
+            matrix, norms = self.matrix[: self.size], self.norms[: self.size]
+        else:
+            matrix, norms = self.matrix[rows], self.norms[rows]
+        Q = np.asarray(queries, dtype=np.float32)
+        Q_norms = np.linalg.norm(Q, axis=1)
+        scores = Q @ matrix.T
+        # similarity with a null vector is 0
+        scores *= np.divide(1, norms, out=np.zeros_like(norms), where=norms != 0)
+        scores *= np.divide(1, Q_norms, out=np.zeros_like(Q_norms), where=Q_norms != 0)[
+            :, None
+        ]
+        return scores
+
+
+class _FieldIndex:
+    """Index of the items of a store by the value of a top-level field: a hash
+    index for equality, and a sorted index of the numeric values for ranges."""
+
+    __slots__ = ("field", "values", "by_value", "numbers")
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        # (ns, key) -> value of the field
+        self.values: dict[tuple[tuple[str, ...], str], Any] = {}
+        # value -> (ns, key) of the items, for scalar values
+        self.by_value: dict[Any, dict[tuple[tuple[str, ...], str], None]] = {}
+        # sorted (value as a number, ns, key), for values that convert to one
+        self.numbers: list[tuple[float, tuple[str, ...], str]] = []
+
+    def add(self, namespace: tuple[str, ...], key: str, value: dict[str, Any]) -> None:
+        self.remove(namespace, key)
+        # missing fields are indexed as None, which they compare equal to
+        field_value = value.get(self.field)
+        self.values[(namespace, key)] = field_value
+        if _is_scalar(field_value):
+            self.by_value.setdefault(field_value, {})[(namespace, key)] = None
+        if (number := _as_number(field_value)) is not None:
+            bisect.insort(self.numbers, (number, namespace, key))
+
+    def remove(self, namespace: tuple[str, ...], key: str) -> None:
+        if (namespace, key) not in self.values:
+            return
+        field_value = self.values.pop((namespace, key))
+        if _is_scalar(field_value):
+            refs = self.by_value[field_value]
+            del refs[(namespace, key)]
+            if not refs:
+                del self.by_value[field_value]
+        if (number := _as_number(field_value)) is not None:
+            del self.numbers[bisect.bisect_left(self.numbers, (number, namespace, key))]
+
+    def lookup(self, condition: Any) -> Collection[tuple[tuple[str, ...], str]] | None:
+        """Return the (namespace, key) of the items that may match a filter
+        condition on the field, or None if the index can't narrow them down."""
+        if isinstance(condition, dict):
+            if not any(k.startswith("$") for k in condition):
+                return None
+            best = None
+            for operator, value in condition.items():
+                refs = self._lookup_operator(operator, value)
+                if refs is not None and (best is None or len(refs) < len(best)):
+                    best = refs
+            return best
+        if isinstance(condition, (list, tuple)):
+            return None
+        return self._lookup_operator("$eq", condition)
+
+    def _lookup_operator(
+        self, operator: str, value: Any
+    ) -> Collection[tuple[tuple[str, ...], str]] | None:
+        if operator == "$eq":
+            return self.by_value.get(value, {}) if _is_scalar(value) else None
+        if operator not in ("$gt", "$gte", "$lt", "$lte"):
+            return None
+        if (number := _as_number(value)) is None:
+            return None
+        if operator == "$gt":
+            selected = self.numbers[
+                bisect.bisect_right(self.numbers, number, key=lambda n: n[0]) :
+            ]
+        elif operator == "$gte":
+            selected = self.numbers[
+                bisect.bisect_left(self.numbers, number, key=lambda n: n[0]) :
+            ]
+        elif operator == "$lt":
+            selected = self.numbers[
+                : bisect.bisect_left(self.numbers, number, key=lambda n: n[0])
+            ]
+        else:
+            selected = self.numbers[
+                : bisect.bisect_right(self.numbers, number, key=lambda n: n[0])
             ]
+        return [(namespace, key) for _, namespace, key in selected]
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float))
+
+
+def _as_number(value: Any) -> float | None:
+    """Convert a value like range filters do, None if it can't be compared."""
+    if value is None or isinstance(value, (dict, list, tuple)):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    # NaN never matches a range
+    return None if number != number else number
+
+
+def _ranked(scores: Any, k: int) -> Iterator[int]:
+    """Yield the positions of `scores` from the highest score, selecting the top `k`
+    first and twice as many each time more are needed."""
+    import numpy as np
 
-        if op.max_depth is not None:
-            namespaces = sorted({ns[: op.max_depth] for ns in namespaces})
+    n = len(scores)
+    start = 0
+    while start < n:
+        stop = min(n, max(2 * start, k, 1))
+        if stop < n:
+            top = np.argpartition(-scores, stop - 1)[:stop]
         else:
-            namespaces = sorted(namespaces)
-        return namespaces[op.offset : op.offset + op.limit]
+            top = np.arange(n)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        yield from top[start:stop].tolist()
+        start = stop
+
+
+def _max_pool(
+    op: SearchOp,
+    ranked: Iterable[tuple[float, Item]],
+    scoreless: Callable[[], list[Item]],
+) -> list[tuple[float | None, Item]]:
+    """Keep the best score of each item, and the items in the requested page."""
+    seen: set[tuple[tuple[str, ...], str]] = set()
+    kept: list[tuple[float | None, Item]] = []
+    for score, item in ranked:
+        key = (item.namespace, item.key)
+        if key in seen:
+            continue
+        ix = len(seen)
+        seen.add(key)
+        if ix >= op.offset:
+            kept.append((score, item))
+        if len(seen) >= op.offset + op.limit:
+            break
+    if len(kept) < op.limit and (no_scores := scoreless()):
+        # Corner case: if we request more items than what we have embedded,
+        # fill the rest with non-scored items
+        kept.extend((None, item) for item in no_scores[: op.limit - len(kept)])
+    return kept
 
 
 @functools.lru_cache(maxsize=1)
@@ -1,4 +1,5 @@
 import dataclasses
+import importlib
 import json
 import pathlib
 import re
@@ -15,13 +16,17 @@ import dataclasses_json
 import numpy as np
 import pandas as pd
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from pydantic import BaseModel, SecretStr
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import SecretStr as SecretStrV1
 
 from langgraph.checkpoint.serde.jsonplus import (
+    EXT_PYDANTIC_V2,
     InvalidModuleError,
     JsonPlusSerializer,
+    _msgpack_enc,
+    _msgpack_ext_hook,
     _msgpack_ext_hook_to_json,
 )
 from langgraph.store.base import Item
@@ -309,6 +314,99 @@ def test_deserde_invalid_module() -> None:
     serde.loads_typed(("json", json.dumps(load).encode("utf-8")))
 
 
+def test_serde_jsonplus_messages(mocker) -> None:
+    serde = JsonPlusSerializer()
+    messages = [
+        HumanMessage("hi", id="1", name="me", custom="extra"),
+        AIMessage(
+            "",
+            tool_calls=[{"name": "search", "args": {"q": "x"}, "id": "call-1"}],
+            usage_metadata={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+        ),
+        ToolMessage("result", tool_call_id="call-1", artifact={"a": [1, 2]}),
+    ]
+    dumped = serde.dumps_typed(messages)
+    assert serde.loads_typed(dumped) == messages
+
+    import_module = mocker.spy(importlib, "import_module")
+    assert serde.loads_typed(dumped) == messages
+    # constructors are resolved once per type
+    assert import_module.call_count == 0
+
+    # messages written from model_dump() are still read back
+    legacy = _msgpack_ext_hook(
+        EXT_PYDANTIC_V2,
+        _msgpack_enc(
+            (
+                "langchain_core.messages.ai",
+                "AIMessage",
+                messages[1].model_dump(),
+                "model_validate_json",
+            )
+        ),
+    )
+    assert legacy == messages[1]
+
+    # messages missing fields are validated, eg. to parse legacy tool calls
+    legacy = _msgpack_ext_hook(
+        EXT_PYDANTIC_V2,
+        _msgpack_enc(
+            (
+                "langchain_core.messages.ai",
+                "AIMessage",
+                {
+                    "content": "",
+                    "additional_kwargs": {
+                        "tool_calls": [
+                            {
+                                "id": "call-1",
+                                "type": "function",
+                                "function": {
+                                    "name": "search",
+                                    "arguments": '{"q": "x"}',
+                                },
+                            }
+                        ]
+                    },
+                    "type": "ai",
+                },
+                "model_validate_json",
+            )
+        ),
+    )
+    assert legacy.tool_calls == messages[1].tool_calls
+
+
+def test_serde_jsonplus_numpy_array_buffers() -> None:
+    serde = JsonPlusSerializer(buffer_min_size=1024)
+    large = np.arange(1024, dtype=np.float32).reshape(32, 32)
+    small = np.arange(4, dtype=np.int64)
+    value = {
+        "large": large,
+        "fortran": np.asfortranarray(large),
+        "strided": large[::2],
+        "small": small,
+    }
+
+    dumped, buffers = serde.dumps_typed_buffers(value)
+    assert len(buffers) == 3
+    # contiguous arrays are not copied when dumped
+    assert np.shares_memory(np.asarray(buffers[0]), large)
+    assert len(dumped[1]) < large.nbytes
+
+    # nor when loaded
+    sources = [bytearray(b) for b in buffers]
+    result = serde.loads_typed_buffers(dumped, sources)
+    assert result.keys() == value.keys()
+    for k, v in value.items():
+        assert np.array_equal(result[k], v)
+        assert result[k].dtype == v.dtype
+    assert np.shares_memory(result["large"], np.frombuffer(sources[0], np.uint8))
+
+    # values without large arrays are the same as with dumps_typed
+    assert serde.dumps_typed_buffers(small) == (serde.dumps_typed(small), [])
+
+
 def test_serde_jsonplus_bytearray() -> None:
     serde = JsonPlusSerializer()
 
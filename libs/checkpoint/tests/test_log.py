@@ -0,0 +1,201 @@
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    Checkpoint,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from langgraph.checkpoint.log import LogSaver
+
+
+def _put(
+    saver: LogSaver, config: RunnableConfig, checkpoint: Checkpoint, step: int
+) -> RunnableConfig:
+    return saver.put(
+        config,
+        checkpoint,
+        {"source": "loop", "step": step, "parents": {}},
+        checkpoint["channel_versions"],
+    )
+
+
+class TestLogSaver:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path) -> None:
+        self.path = tmp_path / "log"
+        self.config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        self.chkpnt_1: Checkpoint = empty_checkpoint()
+        self.chkpnt_1["channel_values"] = {"foo": "bar", "baz": [1, 2]}
+        self.chkpnt_1["channel_versions"] = {"foo": 1, "baz": 1}
+        self.chkpnt_2: Checkpoint = create_checkpoint(self.chkpnt_1, None, 2)
+        self.chkpnt_2["channel_values"] = {"foo": "qux", "baz": [1, 2]}
+        self.chkpnt_2["channel_versions"] = {"foo": 2, "baz": 1}
+
+    def _saver(self, **kwargs) -> LogSaver:
+        return LogSaver(self.path, compaction_interval=None, **kwargs)
+
+    def test_put_and_reopen(self) -> None:
+        with self._saver() as saver:
+            config_1 = _put(saver, self.config, self.chkpnt_1, 1)
+            saver.put_writes(config_1, [("foo", "a"), ("baz", b"b")], "task-1", "~")
+            config_2 = _put(saver, config_1, self.chkpnt_2, 2)
+            expected = saver.get_tuple(self.config)
+            expected_list = list(saver.list(self.config))
+            expected_metadata = list(saver.list_metadata(None))
+
+        with self._saver() as saver:
+            assert saver.get_tuple(self.config) == expected
+            assert list(saver.list(self.config)) == expected_list
+            assert list(saver.list_metadata(None)) == expected_metadata
+            assert expected is not None
+            assert expected.config == config_2
+            assert expected.checkpoint["channel_values"] == {
+                "foo": "qux",
+                "baz": [1, 2],
+            }
+            first = saver.get_tuple(config_1)
+            assert first is not None
+            assert first.pending_writes == [
+                ("task-1", "foo", "a"),
+                ("task-1", "baz", b"b"),
+            ]
+            # regular writes are only stored once per task and index
+            saver.put_writes(config_1, [("foo", "b")], "task-1")
+            first = saver.get_tuple(config_1)
+            assert first is not None
+            assert first.pending_writes[0] == ("task-1", "foo", "a")
+
+    def test_numpy_buffers(self) -> None:
+        embeddings = np.random.rand(64, 256)
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"embeddings": embeddings, "foo": "bar"}
+        checkpoint["channel_versions"] = {"embeddings": 1, "foo": 1}
+        with self._saver() as saver:
+            _put(saver, self.config, checkpoint, 1)
+            _put(saver, self.config, self.chkpnt_2, 2)
+
+        with self._saver() as saver:
+            saved = saver.get_tuple(
+                {
+                    "configurable": {
+                        **self.config["configurable"],
+                        "checkpoint_id": checkpoint["id"],
+                    }
+                }
+            )
+            assert saved is not None
+            loaded = saved.checkpoint["channel_values"]["embeddings"]
+            assert np.array_equal(loaded, embeddings)
+            # read straight from the memory-mapped segment
+            assert not loaded.flags.owndata
+            assert not loaded.flags.writeable
+
+    def test_delete_thread(self) -> None:
+        other: RunnableConfig = {
+            "configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}
+        }
+        with self._saver() as saver:
+            config_1 = _put(saver, self.config, self.chkpnt_1, 1)
+            saver.put_writes(config_1, [("foo", "a")], "task-1")
+            _put(saver, other, self.chkpnt_1, 1)
+            saver.delete_thread("thread-1")
+            assert saver.get_tuple(self.config) is None
+            # a thread can be written again after being deleted
+            _put(saver, self.config, self.chkpnt_2, 2)
+
+        with self._saver() as saver:
+            assert [c.checkpoint["id"] for c in saver.list(self.config)] == [
+                self.chkpnt_2["id"]
+            ]
+            assert saver.get_tuple(config_1) is None
+            assert saver.get_tuple(other) is not None
+
+    def test_compaction(self) -> None:
+        with self._saver(segment_size=1024, fsync=False) as saver:
+            for i in range(20):
+                _put(
+                    saver,
+                    {"configurable": {"thread_id": str(i), "checkpoint_ns": ""}},
+                    self.chkpnt_1,
+                    i,
+                )
+            config_2 = _put(saver, self.config, self.chkpnt_2, 2)
+            segments = len(list(self.path.iterdir()))
+            assert segments > 2
+            for i in range(20):
+                saver.delete_thread(str(i))
+            assert saver.compact() > 0
+            assert len(list(self.path.iterdir())) < segments
+            expected = saver.get_tuple(self.config)
+            assert expected is not None
+            assert expected.config == config_2
+
+        with self._saver() as saver:
+            assert saver.get_tuple(self.config) == expected
+            assert len(list(saver.list(None))) == 1
+
+    def test_torn_write(self) -> None:
+        with self._saver() as saver:
+            config_1 = _put(saver, self.config, self.chkpnt_1, 1)
+            _put(saver, config_1, self.chkpnt_2, 2)
+        # simulate a crash in the middle of the last record
+        segment = next(self.path.iterdir())
+        segment.write_bytes(segment.read_bytes()[:-10])
+
+        with self._saver() as saver:
+            saved = saver.get_tuple(self.config)
+            assert saved is not None
+            assert saved.config == config_1
+            config_2 = _put(saver, config_1, self.chkpnt_2, 2)
+
+        with self._saver() as saver:
+            saved = saver.get_tuple(self.config)
+            assert saved is not None
+            assert saved.config == config_2
+
+    def test_group_commit(self) -> None:
+        with self._saver() as saver:
+
+            def write(i: int) -> None:
+                config: RunnableConfig = {
+                    "configurable": {"thread_id": str(i), "checkpoint_ns": ""}
+                }
+                for step in range(10):
+                    config = _put(
+                        saver,
+                        config,
+                        create_checkpoint(self.chkpnt_1, None, step),
+                        step,
+                    )
+
+            threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert saver.synced == saver.seq == 80
+
+        with self._saver() as saver:
+            assert len(list(saver.list(None))) == 80
+
+    async def test_async(self) -> None:
+        async with self._saver() as saver:
+            config_1 = await saver.aput(
+                self.config,
+                self.chkpnt_1,
+                {"source": "input", "step": -1, "parents": {}},
+                self.chkpnt_1["channel_versions"],
+            )
+            await saver.aput_writes(config_1, [("foo", "a")], "task-1")
+            saved = await saver.aget_tuple(self.config)
+            assert saved is not None
+            assert saved.pending_writes == [("task-1", "foo", "a")]
+            await saver.adelete_thread("thread-1")
+            assert await saver.aget_tuple(self.config) is None
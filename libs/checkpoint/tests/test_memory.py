@@ -9,7 +9,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.memory import InMemorySaver, ShallowInMemorySaver
 
 
 class TestMemorySaver:
@@ -187,8 +187,121 @@ class TestMemorySaver:
         ]
         assert len(search_results_4) == 0
 
+    def test_list_metadata(self) -> None:
+        self.memory_saver.put(
+            self.config_1,
+            self.chkpnt_1,
+            self.metadata_1,
+            self.chkpnt_1["channel_versions"],
+        )
+        self.memory_saver.put(
+            self.config_2,
+            self.chkpnt_2,
+            self.metadata_2,
+            self.chkpnt_2["channel_versions"],
+        )
+        self.memory_saver.put(
+            self.config_3,
+            self.chkpnt_3,
+            self.metadata_3,
+            self.chkpnt_3["channel_versions"],
+        )
+
+        results = list(self.memory_saver.list_metadata(None))
+        # ordered by checkpoint ID across threads and namespaces
+        assert [r.config["configurable"]["checkpoint_id"] for r in results] == sorted(
+            (
+                c.config["configurable"]["checkpoint_id"]
+                for c in self.memory_saver.list(None)
+            ),
+            reverse=True,
+        )
+        assert results[0].ts is not None
+
+        filtered = list(self.memory_saver.list_metadata(None, filter={"step": 1}))
+        assert len(filtered) == 1
+        assert filtered[0].metadata == self.metadata_2
+        assert filtered[0].ts == self.chkpnt_2["ts"]
+        assert filtered[0].parent_config == self.config_2
+
+        # keyset pagination
+        first_page = list(
+            self.memory_saver.list_metadata(
+                {"configurable": {"thread_id": "thread-2"}}, limit=1
+            )
+        )
+        assert len(first_page) == 1
+        second_page = list(
+            self.memory_saver.list_metadata(
+                {"configurable": {"thread_id": "thread-2"}},
+                before=first_page[0].config,
+                limit=1,
+            )
+        )
+        assert len(second_page) == 1
+        assert second_page[0].config != first_page[0].config
+
+        # a delete and a put between listings keep the number of checkpoints
+        self.memory_saver.delete_thread("thread-1")
+        chkpnt_4 = create_checkpoint(self.chkpnt_2, {}, 2)
+        self.memory_saver.put(
+            {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}},
+            chkpnt_4,
+            self.metadata_1,
+            chkpnt_4["channel_versions"],
+        )
+        results = list(
+            self.memory_saver.list_metadata({"configurable": {"thread_id": "thread-1"}})
+        )
+        assert [r.config["configurable"]["checkpoint_id"] for r in results] == [
+            chkpnt_4["id"]
+        ]
+
+    async def test_alist_metadata(self) -> None:
+        await self.memory_saver.aput(
+            self.config_1,
+            self.chkpnt_1,
+            self.metadata_1,
+            self.chkpnt_1["channel_versions"],
+        )
+        results = [c async for c in self.memory_saver.alist_metadata(None)]
+        assert len(results) == 1
+        assert results[0].metadata == self.metadata_1
+
 
 def test_memory_saver() -> None:
     from langgraph.checkpoint.memory import InMemorySaver
 
     assert isinstance(InMemorySaver(), InMemorySaver)
+
+
+def test_shallow_memory_saver() -> None:
+    saver = ShallowInMemorySaver()
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    chkpnt = empty_checkpoint()
+    configs = []
+    for step in range(3):
+        chkpnt = create_checkpoint(chkpnt, None, step)
+        chkpnt["channel_values"] = {"count": step, "static": "x"}
+        chkpnt["channel_versions"] = {"count": step + 1, "static": 1}
+        new_versions = (
+            {"count": step + 1, "static": 1} if step == 0 else {"count": step + 1}
+        )
+        config = saver.put(config, chkpnt, {"step": step}, new_versions)
+        saver.put_writes(config, [("foo", step)], "task-1")
+        configs.append(config)
+
+    # only the latest checkpoint and the blobs it references are kept
+    assert len(saver.storage["1"][""]) == 1
+    assert sorted(saver.blobs) == [("1", "", "count", 3), ("1", "", "static", 1)]
+    # writes are kept for the latest checkpoint and its parent
+    assert sorted(k[2] for k in saver.writes) == sorted(
+        c["configurable"]["checkpoint_id"] for c in configs[1:]
+    )
+
+    latest = saver.get_tuple({"configurable": {"thread_id": "1"}})
+    assert latest is not None
+    assert latest.config == configs[-1]
+    assert latest.checkpoint["channel_values"] == {"count": 2, "static": "x"}
+    assert latest.pending_writes == [("task-1", "foo", 2)]
+    assert [c.config for c in saver.list(None)] == [configs[-1]]
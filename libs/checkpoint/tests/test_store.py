@@ -1,8 +1,12 @@
 # mypy: disable-error-code="operator"
 import asyncio
 import json
+import threading
+import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -12,12 +16,26 @@ from langgraph.store.base import (
     GetOp,
     InvalidNamespaceError,
     Item,
+    ListNamespacesOp,
     Op,
     PutOp,
     Result,
+    SearchOp,
+    ensure_embeddings,
     get_text_at_path,
 )
-from langgraph.store.base.batch import AsyncBatchedBaseStore
+from langgraph.store.base.batch import (
+    AsyncBatchedBaseStore,
+    BatchedStore,
+    _dedupe_ops,
+)
+from langgraph.store.base.cache import CachedStore, CachedStoreStats
+from langgraph.store.base.embed import (
+    BatchedEmbeddings,
+    CachedEmbeddings,
+    EmbeddingsCache,
+    EmbeddingsCacheStats,
+)
 from langgraph.store.memory import InMemoryStore
 from tests.embed_test_utils import CharacterEmbeddings
 
@@ -427,6 +445,136 @@ def test_list_namespaces_empty_store() -> None:
     assert result == []
 
 
+def test_list_namespaces_matches_scan() -> None:
+    store = InMemoryStore()
+
+    namespaces = [
+        ("users", str(i), kind) for i in range(20) for kind in ("docs", "prefs")
+    ] + [("users", "3"), ("teams", "a", "docs"), ("teams", "b", "v1", "docs")]
+    for ns in namespaces:
+        store.put(ns, "key", {"data": "value"})
+    for i in range(0, 20, 2):
+        store.delete(("users", str(i), "prefs"), "key")
+    remaining = sorted(
+        ns
+        for ns in namespaces
+        if not (len(ns) == 3 and ns[2] == "prefs" and int(ns[1]) % 2 == 0)
+    )
+
+    assert store.list_namespaces(limit=1000) == remaining
+    # deleted namespaces are dropped, and gets don't create namespaces
+    assert store.get(("users", "0", "prefs"), "key") is None
+    assert store.get(("missing",), "key") is None
+    assert ("users", "0", "prefs") not in store.list_namespaces(limit=1000)
+    assert ("missing",) not in store.list_namespaces(limit=1000)
+
+    cases: list[dict[str, Any]] = [
+        {"prefix": ("users",)},
+        {"prefix": ("users", "*", "prefs")},
+        {"suffix": ("docs",)},
+        {"prefix": ("*", "*"), "suffix": ("*", "docs")},
+        {"max_depth": 2},
+        {"prefix": ("teams",), "suffix": ("docs",), "max_depth": 2},
+        {"prefix": ("users",), "max_depth": 2, "offset": 5, "limit": 3},
+    ]
+    for kwargs in cases:
+        limit, offset = kwargs.pop("limit", 1000), kwargs.pop("offset", 0)
+        max_depth = kwargs.get("max_depth")
+
+        def matches(ns: tuple[str, ...], path: Any, reverse: bool) -> bool:
+            if path is None:
+                return True
+            if len(ns) < len(path):
+                return False
+            part = ns[len(ns) - len(path) :] if reverse else ns[: len(path)]
+            return all(p in ("*", n) for n, p in zip(part, path, strict=True))
+
+        expected = sorted(
+            {
+                ns[:max_depth] if max_depth else ns
+                for ns in remaining
+                if matches(ns, kwargs.get("prefix"), False)
+                and matches(ns, kwargs.get("suffix"), True)
+            }
+        )[offset : offset + limit]
+        assert store.list_namespaces(**kwargs, limit=limit, offset=offset) == expected
+
+    assert [item.namespace for item in store.search(("users", "1"))] == [
+        ("users", "1", "docs"),
+        ("users", "1", "prefs"),
+    ]
+
+
+def test_ttl(
+    fake_embeddings: CharacterEmbeddings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langgraph.store.memory.time.time", lambda: now)
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": fake_embeddings},
+        ttl={"default_ttl": 1, "refresh_on_read": True},
+    )
+    store.put(("docs",), "a", {"text": "apples"})
+    store.put(("docs",), "b", {"text": "bananas"}, ttl=5)
+    store.put(("docs",), "c", {"text": "cherries"}, ttl=None)
+    store.put(("other",), "d", {"text": "dates"})
+    assert len(store.search(("docs",), query="fruit")) == 3
+
+    now += 50
+    assert store.get(("docs",), "a") is not None  # refreshed
+    assert store.get(("other",), "d", refresh_ttl=False) is not None
+    now += 30
+    assert store.sweep_ttl() == 1
+    assert store.list_namespaces() == [("docs",)]
+
+    now += 40
+    assert len(store.search(("docs",), query="fruit")) == 3  # refreshed
+    now += 50
+    assert store.sweep_ttl() == 0
+    now += 300
+    assert store.sweep_ttl() == 2
+    assert [item.key for item in store.search(("docs",), query="fruit")] == ["c"]
+    assert set(store._vectors[("docs",)]) == {"c"}
+
+    # putting an item without TTL keeps it
+    store.put(("docs",), "c", {"text": "cherries"}, ttl=1)
+    store.put(("docs",), "c", {"text": "cherries"}, ttl=None)
+    now += 120
+    assert store.sweep_ttl() == 0
+    assert store.get(("docs",), "c") is not None
+
+
+def test_ttl_sweep_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langgraph.store.memory.time.time", lambda: now)
+    store = InMemoryStore(ttl={"default_ttl": 1, "sweep_batch_size": 2})
+    for i in range(5):
+        store.put(("docs",), str(i), {"i": i}, ttl=i + 1)
+    store.put(("docs",), "kept", {"i": -1}, ttl=None)
+
+    now += 4.5 * 60
+    assert list(store.sweep_ttl_batches()) == [2, 2]
+    now += 60
+    assert list(store.sweep_ttl_batches(batch_size=10)) == [1]
+    assert list(store.sweep_ttl_batches()) == []
+    assert [item.key for item in store.search(("docs",))] == ["kept"]
+
+
+def test_ttl_sweeper() -> None:
+    store = InMemoryStore(ttl={"default_ttl": 0.001, "sweep_interval_minutes": 0.001})
+    store.put(("docs",), "a", {"text": "apples"})
+    future = store.start_ttl_sweeper()
+    try:
+        for _ in range(100):
+            if store.get(("docs",), "a", refresh_ttl=False) is None:
+                break
+            threading.Event().wait(0.05)
+        assert store.get(("docs",), "a") is None
+    finally:
+        assert store.stop_ttl_sweeper(timeout=5)
+    assert future.result(timeout=5) is None
+
+
 async def test_cannot_put_empty_namespace() -> None:
     store = InMemoryStore()
     doc = {"foo": "bar"}
@@ -580,11 +728,384 @@ async def test_async_batch_store_deduplication(mocker: MockerFixture) -> None:
     abatch.reset_mock()
 
 
+def test_batched_store(mocker: MockerFixture) -> None:
+    inner = InMemoryStore()
+    spy = mocker.spy(InMemoryStore, "batch")
+    store = BatchedStore(inner, batch_linger=0.05)
+    barrier = threading.Barrier(8)
+
+    def worker(i: int) -> Item | None:
+        barrier.wait()
+        store.put(("test",), f"key{i}", {"i": i})
+        barrier.wait()
+        return store.get(("test",), f"key{i % 2}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(worker, range(8)))
+
+    assert [r.value if r else None for r in results] == [{"i": i % 2} for i in range(8)]
+    # concurrent calls share batches, and identical reads are deduplicated
+    assert spy.call_count < 16
+    get_ops = [
+        op
+        for call in spy.call_args_list
+        for op in call.args[1]
+        if isinstance(op, GetOp)
+    ]
+    assert len(get_ops) < 8
+
+    # the operations of a single call are run in the same batch
+    spy.reset_mock()
+    store.max_batch_size = 2
+    ops = [GetOp(("test",), f"key{i}") for i in range(5)]
+    assert [r.key for r in store.batch(ops)] == [f"key{i}" for i in range(5)]  # type: ignore[union-attr]
+    assert spy.call_count == 1
+
+    # errors are raised to the callers of the batch
+    mocker.patch.object(InMemoryStore, "batch", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        store.get(("test",), "key0")
+
+
+def test_cached_store(mocker: MockerFixture) -> None:
+    spy = mocker.spy(InMemoryStore, "batch")
+    store = CachedStore(InMemoryStore(), ttl=60, cache_search=True)
+    store.put(("users", "1"), "profile", {"name": "a"})
+    spy.reset_mock()
+
+    assert store.get(("users", "1"), "profile").value == {"name": "a"}  # type: ignore[union-attr]
+    assert store.get(("users", "1"), "profile").value == {"name": "a"}  # type: ignore[union-attr]
+    assert store.get(("users", "1"), "missing") is None
+    assert store.get(("users", "1"), "missing") is None
+    assert spy.call_count == 2
+    assert store.stats() == CachedStoreStats(hits=2, misses=2, size=2)
+
+    # searches are invalidated by writes in their namespace
+    assert len(store.search(("users",))) == 1
+    assert len(store.search(("users",))) == 1
+    assert len(store.search(("other",))) == 0
+    assert spy.call_count == 4
+    store.put(("users", "2"), "profile", {"name": "b"})
+    assert len(store.search(("other",))) == 0
+    assert len(store.search(("users",))) == 2
+    assert spy.call_count == 6
+
+    # gets are invalidated by writes of the same item
+    store.put(("users", "1"), "profile", {"name": "c"})
+    assert store.get(("users", "1"), "profile").value == {"name": "c"}  # type: ignore[union-attr]
+    store.delete(("users", "1"), "profile")
+    assert store.get(("users", "1"), "profile") is None
+
+    # results expire after the TTL
+    store.get(("users", "2"), "profile")
+    spy.reset_mock()
+    assert store.get(("users", "2"), "profile") is not None
+    assert spy.call_count == 0
+    monotonic = time.monotonic()
+    mocker.patch(
+        "langgraph.store.base.cache.time.monotonic", return_value=monotonic + 61
+    )
+    assert store.get(("users", "2"), "profile") is not None
+    assert spy.call_count == 1
+
+    # results are not cached when the store fails
+    mocker.patch.object(InMemoryStore, "batch", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        store.get(("users", "3"), "profile")
+    assert ("users", "3") not in [key[1] for key in store._entries]
+
+
+def test_cached_store_max_items() -> None:
+    store = CachedStore(InMemoryStore(), max_items=3)
+    for i in range(5):
+        store.put(("test",), str(i), {"i": i})
+        store.get(("test",), str(i))
+    assert store.stats().size == 3
+    assert store.get(("test",), "4") is not None
+    assert store.get(("test",), "0") is not None
+    assert store.stats() == CachedStoreStats(hits=1, misses=6, size=3)
+
+
+async def test_cached_store_async() -> None:
+    store = CachedStore(MockAsyncBatchedStore())
+    await store.aput(("test",), "a", {"v": 1})
+    assert (await store.aget(("test",), "a")).value == {"v": 1}  # type: ignore[union-attr]
+    assert (await store.aget(("test",), "a")).value == {"v": 1}  # type: ignore[union-attr]
+    await store.aput(("test",), "a", {"v": 2})
+    assert (await store.aget(("test",), "a")).value == {"v": 2}  # type: ignore[union-attr]
+    assert store.stats() == CachedStoreStats(hits=1, misses=2, size=1)
+
+
+def test_search_iter(mocker: MockerFixture) -> None:
+    store = InMemoryStore()
+    for i in range(25):
+        store.put(("docs", str(i % 3)), f"key{i:02d}", {"i": i})
+    store.put(("other",), "key", {"i": -1})
+    expected = sorted(
+        ((("docs", str(i % 3)), f"key{i:02d}") for i in range(25)),
+    )
+
+    spy = mocker.spy(InMemoryStore, "batch")
+    items = list(store.search_iter(("docs",), page_size=4))
+    assert [(item.namespace, item.key) for item in items] == expected
+    assert spy.call_count == 7
+    # pages after the first start from the last item of the previous one
+    assert spy.call_args_list[1].args[1][0].after == expected[3]
+    assert all(op.offset == 0 for call in spy.call_args_list for op in call.args[1])
+
+    items = list(store.search_iter(("docs",), filter={"i": {"$gte": 20}}))
+    assert sorted(item.value["i"] for item in items) == [20, 21, 22, 23, 24]
+    assert list(store.search_iter(("missing",))) == []
+
+    assert list(store.list_namespaces_iter(page_size=2)) == [
+        ("docs", "0"),
+        ("docs", "1"),
+        ("docs", "2"),
+        ("other",),
+    ]
+    assert list(store.list_namespaces_iter(max_depth=1, page_size=1)) == [
+        ("docs",),
+        ("other",),
+    ]
+    assert store.batch([ListNamespacesOp(after=("docs", "1"))]) == [
+        [("docs", "2"), ("other",)]
+    ]
+
+
+async def test_asearch_iter() -> None:
+    # stores without cursors are paged with offsets
+    store = MockAsyncBatchedStore()
+    assert not store.supports_cursor
+    for i in range(10):
+        await store.aput(("docs", str(i % 2)), f"key{i}", {"i": i})
+    items = [item async for item in store.asearch_iter(("docs",), page_size=3)]
+    assert sorted(item.value["i"] for item in items) == list(range(10))
+    namespaces = [ns async for ns in store.alist_namespaces_iter(page_size=1)]
+    assert namespaces == [("docs", "0"), ("docs", "1")]
+
+
+def test_dedupe_ops_groups_by_type() -> None:
+    ops: list[Op] = [
+        GetOp(("a",), "1"),
+        PutOp(("a",), "1", {"v": 1}),
+        SearchOp(("a",), {"v": {"$gt": 0}, "tags": ["x"]}),
+        GetOp(("a",), "2"),
+        PutOp(("a",), "1", {"v": 2}),
+        GetOp(("a",), "1"),
+        SearchOp(("a",), {"tags": ["x"], "v": {"$gt": 0}}),
+        SearchOp(("a",), {"v": {"$gt": 1}, "tags": ["x"]}),
+    ]
+    listen, dedupped = _dedupe_ops(ops)
+    assert dedupped == [
+        GetOp(("a",), "1"),
+        GetOp(("a",), "2"),
+        PutOp(("a",), "1", {"v": 2}),
+        SearchOp(("a",), {"v": {"$gt": 0}, "tags": ["x"]}),
+        SearchOp(("a",), {"v": {"$gt": 1}, "tags": ["x"]}),
+    ]
+    assert listen == [0, 2, 3, 1, 2, 0, 3, 4]
+
+
+async def test_async_batch_store_linger_and_max_batch_size(
+    mocker: MockerFixture,
+) -> None:
+    abatch = mocker.spy(InMemoryStore, "batch")
+    store = MockAsyncBatchedStore()
+    store.batch_linger = 0.01
+
+    async def put_later(key: str) -> None:
+        await asyncio.sleep(0.001)
+        await store.aput(("test",), key, {"key": key})
+
+    # operations queued within the linger window share a batch
+    await asyncio.gather(store.aput(("test",), "a", {"key": "a"}), put_later("b"))
+    assert len(abatch.call_args_list) == 1
+    assert len(list(abatch.call_args_list[0].args[1])) == 2
+
+    abatch.reset_mock()
+    store.batch_linger = 0
+    store.max_batch_size = 3
+    results = await asyncio.gather(*(store.aget(("test",), key) for key in "abababa"))
+    assert [r.key for r in results] == list("abababa")  # type: ignore[union-attr]
+    assert [len(list(call.args[1])) for call in abatch.call_args_list] == [2, 2, 1]
+
+
 @pytest.fixture
 def fake_embeddings() -> CharacterEmbeddings:
     return CharacterEmbeddings(dims=500)
 
 
+def test_embeddings_cache(fake_embeddings: CharacterEmbeddings, tmp_path: Path) -> None:
+    embedded: list[str] = []
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        embedded.extend(texts)
+        return fake_embeddings.embed_documents(texts)
+
+    cache = EmbeddingsCache(path=str(tmp_path / "embeddings.sqlite"))
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": embed, "cache": cache}
+    )
+    store.put(("docs",), "a", {"text": "apples"})
+    store.put(("docs",), "b", {"text": "bananas"})
+    store.put(("docs",), "a", {"text": "apples"})
+    results = store.search(("docs",), query="apples")
+    assert results[0].key == "a"
+    assert store.search(("docs",), query="apples") == results
+    # documents and queries are cached separately
+    assert embedded == ['{"text": "apples"}', '{"text": "bananas"}', "apples"]
+    assert cache.stats() == EmbeddingsCacheStats(hits=2, misses=3, size=3)
+    cache.close()
+
+    # the embeddings are persisted, and the cache can be shared between stores
+    embedded.clear()
+    cache = EmbeddingsCache(maxsize=1, path=str(tmp_path / "embeddings.sqlite"))
+    other = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": embed, "cache": cache}
+    )
+    other.put(("docs",), "a", {"text": "apples"})
+    other.put(("docs",), "c", {"text": "cherries"})
+    assert other.search(("docs",), query="apples")[0].score == results[0].score
+    assert embedded == ['{"text": "cherries"}']
+    assert cache.stats() == EmbeddingsCacheStats(hits=2, misses=1, size=1)
+
+
+def test_embeddings_cache_lambdas(tmp_path: Path) -> None:
+    cache = EmbeddingsCache()
+    # lambdas share their name, so their embeddings are cached separately
+    first = CachedEmbeddings(
+        ensure_embeddings(lambda texts: [[1.0]] * len(texts)), cache
+    )
+    second = CachedEmbeddings(
+        ensure_embeddings(lambda texts: [[2.0]] * len(texts)), cache
+    )
+    assert first.embed_query("hi") == [1.0]
+    assert second.embed_query("hi") == [2.0]
+
+    persisted = EmbeddingsCache(path=str(tmp_path / "embeddings.sqlite"))
+    with pytest.raises(ValueError, match="model_id"):
+        CachedEmbeddings(
+            ensure_embeddings(lambda texts: [[1.0]] * len(texts)), persisted
+        )
+    embeddings = CachedEmbeddings(
+        ensure_embeddings(lambda texts: [[1.0]] * len(texts)),
+        persisted,
+        model_id="ones",
+    )
+    assert embeddings.embed_query("hi") == [1.0]
+    persisted.close()
+
+
+def test_embed_batches(fake_embeddings: CharacterEmbeddings) -> None:
+    calls: list[list[str]] = []
+    lock = threading.Lock()
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        with lock:
+            calls.append(texts)
+        time.sleep(0.01)
+        return [[float(len(t)), 1.0] for t in texts]
+
+    embeddings = BatchedEmbeddings(
+        ensure_embeddings(embed), batch_size=3, max_concurrency=2
+    )
+    texts = ["x" * i for i in range(1, 9)]
+    assert embeddings.embed_documents(texts) == [[float(i), 1.0] for i in range(1, 9)]
+    assert sorted(map(len, calls)) == [2, 3, 3]
+    assert embeddings.embed_documents([]) == []
+
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        BatchedEmbeddings(fake_embeddings, batch_size=0)
+
+    # the embeddings of the puts of a batch are split in batches of the config
+    def embed_docs(texts: list[str]) -> list[list[float]]:
+        embed(texts)
+        return fake_embeddings.embed_documents(texts)
+
+    calls.clear()
+    fake_embeddings.embed_documents(['{"text": "doc 0123456789"}'])
+    store = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": embed_docs,
+            "embed_batch_size": 2,
+            "embed_concurrency": 2,
+        }
+    )
+    store.batch(
+        [PutOp(("docs",), str(i), {"text": f"doc {i}"}) for i in range(5)],
+    )
+    assert sorted(map(len, calls)) == [1, 2, 2]
+    assert store.search(("docs",), query="doc 3")[0].key == "3"
+
+
+async def test_aembed_batches() -> None:
+    running = max_running = 0
+
+    async def aembed(texts: list[str]) -> list[list[float]]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return [[float(len(t)), 1.0] for t in texts]
+
+    embeddings = ensure_embeddings(aembed, batch_size=2, max_concurrency=3)
+    texts = ["x" * i for i in range(1, 12)]
+    assert await embeddings.aembed_documents(texts) == [
+        [float(i), 1.0] for i in range(1, 12)
+    ]
+    assert max_running == 3
+
+
+def test_reindex(fake_embeddings: CharacterEmbeddings) -> None:
+    embedded: list[str] = []
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        embedded.extend(texts)
+        return fake_embeddings.embed_documents(texts)
+
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": embed, "fields": ["text"]}
+    )
+    store.put(("docs",), "a", {"text": "apples", "title": "A"})
+    store.put(("docs",), "b", {"text": "bananas"}, index=False)
+    store.put(("docs",), "c", {"text": "cherries", "title": "C"}, index=["title"])
+    store.put(("other",), "d", {"text": "dates"}, index=False)
+    assert store.search(("docs",), query="cherries")[0].key != "c"
+    embedded.clear()
+
+    # only the fields whose text changed are embedded again
+    assert store.reindex(("docs",), batch_size=2, max_concurrency=2) == 2
+    assert sorted(embedded) == ["bananas", "cherries"]
+    assert {key: set(paths) for key, paths in store._vectors[("docs",)].items()} == {
+        "a": {"text"},
+        "b": {"text"},
+        "c": {"text"},
+    }
+    assert store.search(("docs",), query="cherries")[0].key == "c"
+
+    embedded.clear()
+    assert store.reindex() == 1
+    assert embedded == ["dates"]
+    assert store.reindex() == 0
+    # every field is embedded again, eg. after the model behind `embed` changed
+    assert store.reindex(force=True) == 4
+
+
+async def test_areindex(fake_embeddings: CharacterEmbeddings) -> None:
+    store = InMemoryStore(
+        index={"dims": fake_embeddings.dims, "embed": fake_embeddings}
+    )
+    for i in range(10):
+        await store.aput(("docs",), str(i), {"text": f"doc {i}"}, index=False)
+    assert await store.areindex(batch_size=3, max_concurrency=2) == 10
+    assert await store.areindex() == 0
+    assert await store.areindex(force=True) == 10
+    assert len(store._vectors[("docs",)]) == 10
+    assert (await store.asearch(("docs",), query="doc 7"))[0].key == "7"
+
+
 def test_vector_store_initialization(fake_embeddings: CharacterEmbeddings) -> None:
     """Test store initialization with embedding config."""
     store = InMemoryStore(
@@ -896,6 +1417,101 @@ def test_vector_search_pagination(fake_embeddings: CharacterEmbeddings) -> None:
     assert len(all_results) == 5
 
 
+def test_vector_index_matches_pure_python(
+    fake_embeddings: CharacterEmbeddings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Searches scored with the numpy index match the pure Python fallback."""
+    store = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "fields": ["text", "tags[*]"],
+        }
+    )
+    for i in range(60):
+        store.put(
+            ("docs", f"user{i % 3}"),
+            f"doc{i}",
+            {"text": f"document {i} about {'cats' * (i % 4)}", "tags": [str(i % 5)]},
+        )
+    store.put(("docs", "user0"), "unindexed", {"text": "no vector"}, index=False)
+    for i in range(0, 60, 7):
+        store.delete(("docs", f"user{i % 3}"), f"doc{i}")
+
+    ops = [
+        SearchOp(("docs",), query="cats", limit=10),
+        SearchOp(("docs", "user1"), query="document 4", limit=5, offset=2),
+        SearchOp(("docs",), filter={"tags": ["3"]}, query="cats 3", limit=4),
+        SearchOp(("docs", "user0"), query="cats", limit=100),
+        SearchOp(("docs",), limit=3),
+    ]
+    results = store.batch(ops)
+    assert store._index is not None
+
+    monkeypatch.setattr("langgraph.store.memory._check_numpy", lambda: False)
+    expected = store.batch(ops)
+    for result, expected_result in zip(results, expected, strict=True):
+        # ties between equal scores may be ordered differently
+        scores = {r.key: r.score for r in result}
+        assert scores == {
+            e.key: pytest.approx(e.score, abs=1e-5) if e.score is not None else None
+            for e in expected_result
+        }
+    assert results[3][-1].key == "unindexed"
+    assert results[3][-1].score is None
+
+
+def test_filter_fields_index(fake_embeddings: CharacterEmbeddings) -> None:
+    """Filters on indexed fields return the same items as a scan."""
+    indexed = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "filter_fields": ["kind", "score"],
+        }
+    )
+    scanned = InMemoryStore()
+    for store in (indexed, scanned):
+        for i in range(50):
+            value: dict[str, Any] = {
+                "kind": ["note", "task", 1, None][i % 4],
+                "n": i % 3,
+                "score": i if i % 7 else str(i),
+            }
+            store.put(("docs", str(i % 2)), f"doc{i}", value, index=False)
+        store.put(("docs", "0"), "doc0", {"kind": "task", "score": 2.5}, index=False)
+        store.delete(("docs", "1"), "doc1")
+        store.put(
+            ("docs", "1"),
+            "doc3",
+            {"kind": True, "score": 0, "tags": ["a"]},
+            index=False,
+        )
+
+    filters: list[dict[str, Any]] = [
+        {"kind": "note"},
+        {"kind": 1},
+        {"kind": None},
+        {"tags": None},
+        {"score": {"$gt": 20}},
+        {"score": {"$gte": 14, "$lt": 30}},
+        {"score": {"$lte": 2.5}, "kind": "task"},
+        {"kind": {"$ne": "note"}, "n": 2},
+        {"tags": ["a"]},
+    ]
+    for filter in filters:
+        for prefix in [("docs",), ("docs", "1")]:
+            expected = {
+                item.key for item in scanned.search(prefix, filter=filter, limit=100)
+            }
+            assert {
+                item.key for item in indexed.search(prefix, filter=filter, limit=100)
+            } == expected, filter
+    assert indexed._filters is not None
+    assert indexed._lookup_filter({"kind": "task"}) is not None
+    assert len(indexed._lookup_filter({"score": {"$gt": 40}}) or ()) == 9
+
+
 async def test_async_vector_search_pagination(
     fake_embeddings: CharacterEmbeddings,
 ) -> None:
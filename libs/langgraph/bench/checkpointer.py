@@ -0,0 +1,80 @@
+"""Compare the log-structured checkpointer with the SQLite one.
+
+Run with `python -m bench.checkpointer`, with the usual pyperf options.
+"""
+
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from uuid import uuid4
+
+from langgraph.checkpoint.base import BaseCheckpointSaver, empty_checkpoint
+from langgraph.checkpoint.log import LogSaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+from pyperf._runner import Runner
+
+STEPS = 100
+
+
+def sqlite_saver(path: Path) -> AbstractContextManager[BaseCheckpointSaver]:
+    return SqliteSaver.from_conn_string(str(path / "checkpoints.db"))
+
+
+def log_saver(path: Path) -> AbstractContextManager[BaseCheckpointSaver]:
+    return LogSaver(path / "log", compaction_interval=None)
+
+
+def write_thread(saver: BaseCheckpointSaver, thread_id: str) -> None:
+    """Write a thread of STEPS checkpoints, each with a few pending writes."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    for step in range(STEPS):
+        checkpoint = {
+            **checkpoint,
+            "id": str(uuid4()),
+            "channel_values": {"messages": ["hi?" * 10] * step, "step": step},
+            "channel_versions": {
+                "messages": saver.get_next_version(None, None),
+                "step": saver.get_next_version(None, None),
+            },
+        }
+        config = saver.put(
+            config,
+            checkpoint,
+            {"source": "loop", "step": step, "parents": {}},
+            checkpoint["channel_versions"],
+        )
+        saver.put_writes(config, [("messages", "hi?"), ("step", step)], str(step))
+
+
+def bench_write(
+    loops: int, factory: Callable[[Path], AbstractContextManager[BaseCheckpointSaver]]
+) -> float:
+    with tempfile.TemporaryDirectory() as tmp, factory(Path(tmp)) as saver:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            write_thread(saver, str(uuid4()))
+        return time.perf_counter() - t0
+
+
+def bench_read(
+    loops: int, factory: Callable[[Path], AbstractContextManager[BaseCheckpointSaver]]
+) -> float:
+    with tempfile.TemporaryDirectory() as tmp, factory(Path(tmp)) as saver:
+        config = {"configurable": {"thread_id": "thread", "checkpoint_ns": ""}}
+        write_thread(saver, "thread")
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            saver.get_tuple(config)
+            for _ in saver.list(config):
+                pass
+        return time.perf_counter() - t0
+
+
+r = Runner()
+
+for name, factory in (("sqlite", sqlite_saver), ("log", log_saver)):
+    r.bench_time_func(f"checkpointer_write_{STEPS}x_{name}", bench_write, factory)
+    r.bench_time_func(f"checkpointer_read_{STEPS}x_{name}", bench_read, factory)
@@ -0,0 +1,59 @@
+"""Measure checkpoint (de)serialization of the most common state values.
+
+Run with `python -m bench.serde`, with the usual pyperf options.
+"""
+
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pyperf._runner import Runner
+
+from langgraph.types import Command, Interrupt, Send
+
+
+def message_history(turns: int) -> list:
+    messages: list = []
+    for i in range(turns):
+        messages += [
+            HumanMessage(f"question {i}?", id=f"human-{i}"),
+            AIMessage(
+                "",
+                id=f"ai-{i}",
+                tool_calls=[{"name": "search", "args": {"q": str(i)}, "id": str(i)}],
+                usage_metadata={
+                    "input_tokens": 10,
+                    "output_tokens": 20,
+                    "total_tokens": 30,
+                },
+            ),
+            ToolMessage("result " * 10, tool_call_id=str(i), id=f"tool-{i}"),
+            AIMessage(f"answer {i}", id=f"answer-{i}"),
+        ]
+    return messages
+
+
+serde = JsonPlusSerializer()
+
+values: tuple[tuple[str, Any], ...] = (
+    ("messages_2000", message_history(500)),
+    (
+        "sends_1000",
+        [Send("node", {"idx": i, "subject": "x" * 10}) for i in range(1000)],
+    ),
+    (
+        "interrupts_1000",
+        [Interrupt(value={"question": str(i)}, id=str(i)) for i in range(1000)],
+    ),
+    (
+        "commands_1000",
+        [Command(goto="node", update={"idx": i}, resume=i) for i in range(1000)],
+    ),
+)
+
+r = Runner()
+
+for name, value in values:
+    dumped = serde.dumps_typed(value)
+    r.bench_func(f"serde_dumps_{name}", serde.dumps_typed, value)
+    r.bench_func(f"serde_loads_{name}", serde.loads_typed, dumped)
@@ -2,6 +2,7 @@ import collections.abc
 from collections.abc import Callable, Sequence
 from typing import Any, Generic
 
+from langgraph.checkpoint.serde.lazy import LazyValue
 from typing_extensions import NotRequired, Required, Self
 
 from langgraph._internal._constants import OVERWRITE
@@ -102,6 +103,8 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     def update(self, values: Sequence[Value]) -> bool:
         if not values:
             return False
+        if type(self.value) is LazyValue:
+            self.value = self.value.load()
         if self.value is MISSING:
             self.value = values[0]
             values = values[1:]
@@ -125,6 +128,8 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     def get(self) -> Value:
         if self.value is MISSING:
             raise EmptyChannelError()
+        if type(self.value) is LazyValue:
+            self.value = self.value.load()
         return self.value
 
     def is_available(self) -> bool:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, Generic
 
+from langgraph.checkpoint.serde.lazy import LazyValue
 from typing_extensions import Self
 
 from langgraph._internal._typing import MISSING
@@ -69,6 +70,8 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
     def get(self) -> Value:
         if self.value is MISSING:
             raise EmptyChannelError()
+        if type(self.value) is LazyValue:
+            self.value = self.value.load()
         return self.value
 
     def is_available(self) -> bool:
@@ -28,6 +28,7 @@ from langgraph.checkpoint.base import (
     PendingWrite,
     V,
 )
+from langgraph.checkpoint.serde.lazy import load_value
 from langgraph.store.base import BaseStore
 from xxhash import xxh3_128_hexdigest
 
@@ -713,7 +714,8 @@ def prepare_single_task(
                 Runtime, configurable.get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
             )
             runtime = runtime.override(
-                store=store, previous=checkpoint["channel_values"].get(PREVIOUS, None)
+                store=store,
+                previous=load_value(checkpoint["channel_values"].get(PREVIOUS, None)),
             )
             additional_config: RunnableConfig = {
                 "metadata": metadata,
@@ -857,7 +859,9 @@ def prepare_single_task(
                         Runtime, configurable.get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
                     )
                     runtime = runtime.override(
-                        previous=checkpoint["channel_values"].get(PREVIOUS, None),
+                        previous=load_value(
+                            checkpoint["channel_values"].get(PREVIOUS, None)
+                        ),
                         store=store,
                     )
                     additional_config = {
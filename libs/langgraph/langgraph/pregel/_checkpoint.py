@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from datetime import datetime, timezone
+from typing import Any
 
 from langgraph.checkpoint.base import Checkpoint
 from langgraph.checkpoint.base.id import uuid6
+from langgraph.checkpoint.serde.lazy import LazyValue
 
 from langgraph._internal._typing import MISSING
 from langgraph.channels.base import BaseChannel
+from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.channels.last_value import LastValue
 from langgraph.managed.base import ManagedValueMapping, ManagedValueSpec
 
 LATEST_VERSION = 4
@@ -67,15 +71,26 @@ def channels_from_checkpoint(
             channel_specs[k] = v
         else:
             managed_specs[k] = v
+    values = checkpoint["channel_values"]
     return (
         {
-            k: v.from_checkpoint(checkpoint["channel_values"].get(k, MISSING))
+            k: v.from_checkpoint(_load_value(v, values[k]) if k in values else MISSING)
             for k, v in channel_specs.items()
         },
         managed_specs,
     )
 
 
+# channels that keep a lazy value until it is read
+_LAZY_CHANNELS = (LastValue, BinaryOperatorAggregate)
+
+
+def _load_value(channel: BaseChannel, value: Any) -> Any:
+    if type(value) is LazyValue and type(channel) not in _LAZY_CHANNELS:
+        return value.load()
+    return value
+
+
 def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
     return Checkpoint(
         v=checkpoint["v"],
@@ -33,6 +33,7 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
     PendingWrite,
 )
+from langgraph.checkpoint.serde.lazy import lazy_loading
 from langgraph.store.base import BaseStore
 from typing_extensions import ParamSpec, Self
 
@@ -1074,7 +1075,9 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
 
     def __enter__(self) -> Self:
         if self.checkpointer:
-            saved = self.checkpointer.get_tuple(self.checkpoint_config)
+            # channel values are only deserialized once read by a task
+            with lazy_loading():
+                saved = self.checkpointer.get_tuple(self.checkpoint_config)
         else:
             saved = None
         if saved is None:
@@ -1253,7 +1256,9 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
 
     async def __aenter__(self) -> Self:
         if self.checkpointer:
-            saved = await self.checkpointer.aget_tuple(self.checkpoint_config)
+            # channel values are only deserialized once read by a task
+            with lazy_loading():
+                saved = await self.checkpointer.aget_tuple(self.checkpoint_config)
         else:
             saved = None
         if saved is None:
@@ -42,6 +42,7 @@ from langgraph.cache.base import BaseCache
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     Checkpoint,
+    CheckpointMetadataTuple,
     CheckpointTuple,
 )
 from langgraph.store.base import BaseStore
@@ -1106,6 +1107,20 @@ class Pregel(
             tuple([i for task in tasks_with_writes for i in task.interrupts]),
         )
 
+    def _prepare_metadata_snapshot(
+        self, saved: CheckpointMetadataTuple
+    ) -> StateSnapshot:
+        return StateSnapshot(
+            values={},
+            next=(),
+            config=patch_checkpoint_map(saved.config, saved.metadata),
+            metadata=saved.metadata,
+            created_at=saved.ts,
+            parent_config=patch_checkpoint_map(saved.parent_config, saved.metadata),
+            tasks=(),
+            interrupts=(),
+        )
+
     async def _aprepare_state_snapshot(
         self,
         config: RunnableConfig,
@@ -1317,8 +1332,14 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        values: bool = True,
     ) -> Iterator[StateSnapshot]:
-        """Get the history of the state of the graph."""
+        """Get the history of the state of the graph.
+
+        With `values=False`, only the checkpoint metadata is read, so the snapshots
+        have empty `values`, `next`, `tasks` and `interrupts`. This is much cheaper
+        for listing long histories.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = config[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1338,6 +1359,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    values=values,
                 )
                 return
             else:
@@ -1353,6 +1375,14 @@ class Pregel(
                 }
             },
         )
+        if not values:
+            for metadata_tuple in list(
+                checkpointer.list_metadata(
+                    config, before=before, limit=limit, filter=filter
+                )
+            ):
+                yield self._prepare_metadata_snapshot(metadata_tuple)
+            return
         # eagerly consume list() to avoid holding up the db cursor
         for checkpoint_tuple in list(
             checkpointer.list(config, before=before, limit=limit, filter=filter)
@@ -1368,8 +1398,14 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        values: bool = True,
     ) -> AsyncIterator[StateSnapshot]:
-        """Asynchronously get the history of the state of the graph."""
+        """Asynchronously get the history of the state of the graph.
+
+        With `values=False`, only the checkpoint metadata is read, so the snapshots
+        have empty `values`, `next`, `tasks` and `interrupts`. This is much cheaper
+        for listing long histories.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = ensure_config(config)[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1389,6 +1425,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    values=values,
                 ):
                     yield state
                 return
@@ -1405,6 +1442,15 @@ class Pregel(
                 }
             },
         )
+        if not values:
+            for metadata_tuple in [
+                c
+                async for c in checkpointer.alist_metadata(
+                    config, before=before, limit=limit, filter=filter
+                )
+            ]:
+                yield self._prepare_metadata_snapshot(metadata_tuple)
+            return
         # eagerly consume list() to avoid holding up the db cursor
         for checkpoint_tuple in [
             c
@@ -2,6 +2,8 @@ import operator
 from collections.abc import Sequence
 
 import pytest
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.lazy import LazyValue
 
 from langgraph._internal._typing import MISSING
 from langgraph.channels.binop import BinaryOperatorAggregate
@@ -90,6 +92,26 @@ def test_binop() -> None:
     assert channel.get() == 10
 
 
+def test_lazy_values() -> None:
+    serde = JsonPlusSerializer()
+    lazy = LazyValue(serde, serde.dumps_typed([1, 2]))
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint(lazy)
+    assert channel.is_available()
+    assert not channel.update([])
+    # checkpointing an unread value doesn't deserialize it
+    assert channel.checkpoint() is lazy
+    assert not lazy.loaded
+    channel.update([[3]])
+    assert channel.get() == [1, 2, 3]
+
+    lazy = LazyValue(serde, serde.dumps_typed("a"))
+    channel = LastValue(str).from_checkpoint(lazy)
+    assert channel.copy().checkpoint() is lazy
+    assert channel.get() == "a"
+    assert lazy.loaded
+    assert channel.checkpoint() == "a"
+
+
 def test_untracked_value() -> None:
     channel = UntrackedValue(dict).from_checkpoint(MISSING)
     assert channel.ValueType is dict
@@ -31,6 +31,7 @@ from langgraph.checkpoint.base import (
     CheckpointTuple,
 )
 from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.store.base import BaseStore
 from langsmith import traceable
@@ -193,6 +194,44 @@ def test_checkpoint_errors() -> None:
         )
 
 
+def test_lazy_channel_values() -> None:
+    loaded: list[Any] = []
+
+    class SpySerializer(JsonPlusSerializer):
+        def loads_typed(self, data: tuple[str, bytes]) -> Any:
+            value = super().loads_typed(data)
+            if isinstance(value, list):
+                loaded.append(value)
+            return value
+
+    class State(TypedDict):
+        documents: Annotated[list[str], operator.add]
+        count: int
+
+    class CountState(TypedDict):
+        count: int
+
+    def increment(state: CountState) -> dict:
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State, output_schema=CountState)
+    builder.add_node("increment", increment)
+    builder.add_edge(START, "increment")
+    checkpointer = InMemorySaver(serde=SpySerializer())
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "1"}}
+
+    graph.invoke({"documents": ["a" * 1000] * 100, "count": 0}, config)
+    loaded.clear()
+    assert graph.invoke({"count": 1}, config) == {"count": 2}
+    # the documents were neither read by a task nor output, so never deserialized
+    assert loaded == []
+    assert graph.get_state(config).values == {
+        "documents": ["a" * 1000] * 100,
+        "count": 2,
+    }
+
+
 def test_context_json_schema() -> None:
     """Test that config json schema is generated properly."""
     chain = NodeBuilder().subscribe_only("input").write_to("output")
@@ -1469,6 +1508,13 @@ def test_invoke_checkpoint_three(
     )
     assert len(cursored) == 1
     assert cursored[0].config == thread_1_history[1].config
+    # metadata-only history
+    assert [
+        (c.config, c.metadata, c.created_at, c.parent_config)
+        for c in app.get_state_history(thread_1, values=False)
+    ] == [
+        (c.config, c.metadata, c.created_at, c.parent_config) for c in thread_1_history
+    ]
     # the last checkpoint
     assert thread_1_history[0].values["total"] == 16
     # the first "loop" checkpoint
@@ -3680,6 +3680,13 @@ async def test_invoke_checkpoint_three(
     ]
     assert len(cursored) == 1
     assert cursored[0].config == thread_1_history[1].config
+    # metadata-only history
+    assert [
+        (c.config, c.metadata, c.created_at, c.parent_config)
+        async for c in app.aget_state_history(thread_1, values=False)
+    ] == [
+        (c.config, c.metadata, c.created_at, c.parent_config) for c in thread_1_history
+    ]
     # the last checkpoint
     assert thread_1_history[0].values["total"] == 16
     # the first "loop" checkpoint